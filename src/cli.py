@@ -0,0 +1,309 @@
+"""
+Ejecución por lotes sin interfaz gráfica.
+
+Ejemplos (desde la raíz del proyecto):
+    python src/cli.py schedule data/ cargas/*.txt -a fifo rr -q 4 -o resultados/
+    python src/cli.py sync data/ -m mutex semaphore -f jsonl -o resultados/
+    python src/cli.py sync data/ -m rwlock --rw-policy writers
+    python src/cli.py sweep data/processes.txt -q 1:16 32 64 -o resultados/
+
+Escribe en el directorio de salida metrics.<csv|jsonl> (una fila por corrida) y
+timelines.<csv|jsonl> (una fila por segmento); 'sweep' escribe sweep.<csv|jsonl>
+y 'sync --hold-and-wait' además deadlocks.<csv|jsonl>.
+No importa nada de gui/.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from typing import Iterable, List, Sequence
+
+from core.scheduler import ALGORITHMS
+from core.comparison import iter_comparison
+from core.sync_engine import run_synchronization, run_synchronization_stream
+from core.sweep import sweep_quantum
+from data_io.process_loader import load_processes, prepare_workload
+from data_io.sync_loader import load_resources, load_actions, iter_action_cycles, prepare_trace
+from synchronization.engine import ACCESED
+from synchronization.rwlock import POLICIES as RW_POLICIES
+from utils.metrics import (
+    compute_avg_waiting_time,
+    compute_total_waits,
+    compute_avg_turnaround_time,
+    compute_throughput,
+    compute_waiting_rate
+)
+
+SYNC_MODES = ('mutex', 'semaphore', 'rwlock')
+
+SCHEDULE_METRIC_FIELDS = ['workload', 'algorithm', 'quantum', 'processes',
+                          'awt', 'avg_turnaround', 'total_waits', 'throughput', 'makespan']
+SCHEDULE_TIMELINE_FIELDS = ['workload', 'algorithm', 'pid', 'start', 'end']
+SYNC_METRIC_FIELDS = ['workload', 'mode', 'actions', 'accesses', 'total_waits',
+                      'cycles', 'waiting_rate']
+SYNC_TIMELINE_FIELDS = ['workload', 'mode', 'cycle', 'pid', 'resource', 'state', 'duration']
+DEADLOCK_FIELDS = ['workload', 'mode', 'cycle', 'pids', 'resources']
+SWEEP_FIELDS = ['workload', 'quantum', 'awt', 'avg_turnaround', 'context_switches', 'throughput']
+
+
+class RowWriter:
+    """Escribe filas (en el orden de fields) como CSV o JSON Lines, a medida que llegan."""
+    def __init__(self, path: str, fields: List[str], fmt: str):
+        self.fields = fields
+        self.fmt = fmt
+        self._f = open(path, 'w', newline='', encoding='utf-8')
+        if fmt == 'csv':
+            self._csv = csv.writer(self._f)
+            self._csv.writerow(fields)
+
+    def write(self, row: Sequence):
+        if self.fmt == 'csv':
+            self._csv.writerow(row)
+        else:
+            self._f.write(json.dumps(dict(zip(self.fields, row))) + '\n')
+
+    def close(self):
+        self._f.close()
+
+
+def expand_paths(patterns: Iterable[str], dir_pattern: str = None) -> List[str]:
+    """
+    Expande globs. Si dir_pattern se indica, los directorios se sustituyen por los
+    archivos que coinciden dentro de ellos; si no, se devuelven tal cual.
+    """
+    paths: List[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or [pattern]
+        for path in matches:
+            if os.path.isdir(path) and dir_pattern:
+                paths.extend(sorted(glob.glob(os.path.join(path, dir_pattern))))
+            else:
+                paths.append(path)
+    return paths
+
+
+def run_schedule_batch(args) -> int:
+    if args.algorithms is None:
+        # por defecto todos; RR solo si se indicó su quantum
+        algos = [a for a in ALGORITHMS if a != 'rr' or args.quantum is not None]
+    else:
+        algos = [a.lower() for a in args.algorithms]
+    if 'rr' in algos and args.quantum is None:
+        print("error: RR requiere --quantum", file=sys.stderr)
+        return 2
+    configs = [(a, {'quantum': args.quantum} if a == 'rr' else {}) for a in algos]
+    ext = args.format
+    metrics = RowWriter(os.path.join(args.output, f'metrics.{ext}'), SCHEDULE_METRIC_FIELDS, ext)
+    timelines = None
+    if not args.no_timeline:
+        timelines = RowWriter(os.path.join(args.output, f'timelines.{ext}'), SCHEDULE_TIMELINE_FIELDS, ext)
+
+    try:
+        for path in expand_paths(args.paths, 'processes*.txt'):
+            workload = prepare_workload(load_processes(path))
+            arrival_map = dict(zip(workload.pid_ids, workload.arrival))
+            for item in iter_comparison(workload, configs, max_workers=args.workers):
+                res = item.result
+                # métricas sobre ids de pid; los nombres solo al exportar el timeline
+                makespan = max(res.completions.values(), default=0)
+                metrics.write([
+                    path, item.algorithm, item.params.get('quantum'), len(workload),
+                    round(compute_avg_waiting_time(res.waits), 4),
+                    round(compute_avg_turnaround_time(res.completions, arrival_map), 4),
+                    compute_total_waits(res.waits),
+                    round(compute_throughput(res.completions, makespan), 6),
+                    makespan
+                ])
+                if timelines:
+                    names = res.symbols.names
+                    for pid, start, end in res.segments:
+                        timelines.write([path, item.algorithm, names[pid], start, end])
+            print(f"{path}: {len(workload)} procesos", file=sys.stderr)
+    finally:
+        metrics.close()
+        if timelines:
+            timelines.close()
+    return 0
+
+
+def run_sync_batch(args) -> int:
+    if args.stream and args.blocking:
+        print("error: --stream no admite --blocking", file=sys.stderr)
+        return 2
+    blocking = args.blocking or args.hold_and_wait
+    if 'rwlock' in args.modes and (args.stream or blocking):
+        print("error: el modo rwlock no admite --stream ni --blocking", file=sys.stderr)
+        return 2
+    if args.stream and args.hold_and_wait:
+        print("error: --stream no admite --hold-and-wait", file=sys.stderr)
+        return 2
+    ext = args.format
+    metrics = RowWriter(os.path.join(args.output, f'metrics.{ext}'), SYNC_METRIC_FIELDS, ext)
+    timelines = None
+    if not args.no_timeline:
+        timelines = RowWriter(os.path.join(args.output, f'timelines.{ext}'), SYNC_TIMELINE_FIELDS, ext)
+    deadlocks = None
+    if args.hold_and_wait:
+        deadlocks = RowWriter(os.path.join(args.output, f'deadlocks.{ext}'), DEADLOCK_FIELDS, ext)
+
+    try:
+        for folder in expand_paths(args.paths):
+            processes = load_processes(os.path.join(folder, 'processes.txt'))
+            resources = load_resources(os.path.join(folder, 'resources.txt'))
+            actions_path = os.path.join(folder, 'actions.txt')
+            if args.stream:
+                _run_sync_stream(folder, processes, resources, actions_path, args.modes, metrics, timelines)
+                continue
+            actions = load_actions(actions_path)
+            # internada una vez para todos los modos (y para la clave de la cache)
+            trace = prepare_trace(actions, (p.pid for p in processes), (r.name for r in resources))
+            for mode in args.modes:
+                res = run_synchronization(processes, resources, trace, mode=mode,
+                                          blocking=blocking, rw_policy=args.rw_policy,
+                                          hold_and_wait=args.hold_and_wait)
+                # métricas sobre las columnas del timeline; los nombres solo al exportarlo
+                cycles = set(res.segments.cycle)
+                accesses = res.segments.state.count(ACCESED)
+                metrics.write([
+                    folder, mode, len(actions), accesses,
+                    compute_total_waits(res.waiting_counts), len(cycles),
+                    round(compute_waiting_rate(res.waiting_counts, len(cycles)), 4)
+                ])
+                if timelines:
+                    for (cycle, pid, resource, state), duration in zip(res.timeline, res.durations):
+                        timelines.write([folder, mode, cycle, pid, resource, state, duration])
+                if deadlocks:
+                    for dl in res.deadlocks:
+                        deadlocks.write([folder, mode, dl.cycle, ' '.join(dl.pids), ' '.join(dl.resources)])
+            print(f"{folder}: {len(actions)} acciones", file=sys.stderr)
+    finally:
+        metrics.close()
+        if timelines:
+            timelines.close()
+        if deadlocks:
+            deadlocks.close()
+    return 0
+
+
+def _run_sync_stream(folder, processes, resources, actions_path, modes, metrics, timelines):
+    """Relee actions.txt (ordenado por ciclo) por cada modo y escribe filas al vuelo."""
+    for mode in modes:
+        totals = {'actions': 0, 'accesses': 0, 'cycles': 0}
+        last_cycle = [None]
+
+        def sink(row, mode=mode):
+            cycle, pid, resource, state, duration = row
+            totals['actions'] += 1
+            if state == 'ACCESED':
+                totals['accesses'] += 1
+            if cycle != last_cycle[0]:
+                totals['cycles'] += 1
+                last_cycle[0] = cycle
+            if timelines:
+                timelines.write([folder, mode, cycle, pid, resource, state, duration])
+
+        waiting_counts = run_synchronization_stream(
+            processes, resources, iter_action_cycles(actions_path), sink, mode=mode
+        )
+        metrics.write([
+            folder, mode, totals['actions'], totals['accesses'],
+            compute_total_waits(waiting_counts), totals['cycles'],
+            round(compute_waiting_rate(waiting_counts, totals['cycles']), 4)
+        ])
+    print(f"{folder}: streaming terminado", file=sys.stderr)
+
+
+def parse_quanta(specs: Iterable[str]) -> List[int]:
+    """Acepta valores sueltos ('8') y rangos inclusivos 'inicio:fin[:paso]' ('1:16:2')."""
+    quanta: List[int] = []
+    for spec in specs:
+        if ':' in spec:
+            parts = [int(x) for x in spec.split(':')]
+            start, stop = parts[0], parts[1]
+            step = parts[2] if len(parts) > 2 else 1
+            quanta.extend(range(start, stop + 1, step))
+        else:
+            quanta.append(int(spec))
+    return quanta
+
+
+def run_sweep_batch(args) -> int:
+    quanta = parse_quanta(args.quanta)
+    ext = args.format
+    out = RowWriter(os.path.join(args.output, f'sweep.{ext}'), SWEEP_FIELDS, ext)
+    try:
+        for path in expand_paths(args.paths, 'processes*.txt'):
+            workload = prepare_workload(load_processes(path))
+            for row in sweep_quantum(workload, quanta, max_workers=args.workers):
+                out.write([path] + [
+                    round(row[k], 6) if isinstance(row[k], float) else row[k]
+                    for k in SWEEP_FIELDS[1:]
+                ])
+            print(f"{path}: {len(workload)} procesos, {len(quanta)} quantums", file=sys.stderr)
+    finally:
+        out.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Simulador de SO por lotes (sin GUI)")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def common(p):
+        p.add_argument('-o', '--output', default='resultados', help="directorio de salida")
+        p.add_argument('-f', '--format', choices=['csv', 'jsonl'], default='csv')
+        p.add_argument('--no-timeline', action='store_true', help="solo escribir métricas")
+
+    p_sched = sub.add_parser('schedule', help="calendarización")
+    p_sched.add_argument('paths', nargs='+',
+                         help="archivos de procesos, globs o directorios (se toman sus processes*.txt)")
+    p_sched.add_argument('-a', '--algorithms', nargs='+', choices=ALGORITHMS,
+                         help="por defecto todos (RR solo si se indica -q)")
+    p_sched.add_argument('-q', '--quantum', type=int, help="quantum para RR")
+    p_sched.add_argument('-j', '--workers', type=int, help="procesos para comparar algoritmos en paralelo")
+    common(p_sched)
+    p_sched.set_defaults(func=run_schedule_batch)
+
+    p_sync = sub.add_parser('sync', help="sincronización")
+    p_sync.add_argument('paths', nargs='+',
+                        help="directorios (o globs) con processes.txt, resources.txt y actions.txt")
+    p_sync.add_argument('-m', '--modes', nargs='+', choices=SYNC_MODES, default=['mutex'])
+    p_sync.add_argument('--rw-policy', choices=RW_POLICIES, default='readers',
+                        help="en modo rwlock: preferir lecturas (readers) o escrituras (writers)")
+    p_sync.add_argument('--blocking', action='store_true',
+                        help="las acciones denegadas esperan en una cola FIFO por recurso")
+    p_sync.add_argument('--hold-and-wait', action='store_true',
+                        help="(implica --blocking) un proceso en cola conserva lo que retiene; "
+                             "escribe los interbloqueos en deadlocks.<csv|jsonl>")
+    p_sync.add_argument('--stream', action='store_true',
+                        help="leer actions.txt (ordenado por ciclo) en streaming, con memoria acotada")
+    common(p_sync)
+    p_sync.set_defaults(func=run_sync_batch)
+
+    p_sweep = sub.add_parser('sweep', help="barrido de quantum para RR")
+    p_sweep.add_argument('paths', nargs='+',
+                         help="archivos de procesos, globs o directorios (se toman sus processes*.txt)")
+    p_sweep.add_argument('-q', '--quanta', nargs='+', required=True,
+                         help="quantums sueltos o rangos inicio:fin[:paso]")
+    p_sweep.add_argument('-j', '--workers', type=int, help="procesos para correr quantums en paralelo")
+    p_sweep.add_argument('-o', '--output', default='resultados', help="directorio de salida")
+    p_sweep.add_argument('-f', '--format', choices=['csv', 'jsonl'], default='csv')
+    p_sweep.set_defaults(func=run_sweep_batch)
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    os.makedirs(args.output, exist_ok=True)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as exc:
+        # archivo faltante o con formato inválido: mensaje en vez de traceback
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
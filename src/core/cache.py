@@ -0,0 +1,59 @@
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+from operator import attrgetter
+from typing import Any, Hashable, Iterable, Sequence
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def fingerprint(items: Iterable[Any], fields: Sequence[str]) -> str:
+    """
+    Hash de contenido de una lista de registros (Process, Resource, Action...).
+    Dos listas con los mismos valores en 'fields' y en el mismo orden dan el mismo hash.
+    """
+    get = attrgetter(*fields)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr([get(it) for it in items]).encode())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Cache LRU acotada para resultados de simulación, con contadores de hits/misses.
+    Los resultados se comparten entre llamadas: tratarlos como de solo lectura.
+    Es segura entre hilos (la GUI simula en un hilo aparte).
+    """
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            # desalojar el menos usado recientemente
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import as_completed
+from typing import Any, Dict, Iterator, List, NamedTuple, Sequence, Tuple, Union
+from data_io.process_loader import Process, PreparedWorkload, as_workload
+from core.scheduler import ScheduleResult, cache_key, cached_result, run_scheduling, store_result
+from utils.progress import Progress, part
+from utils.pool import process_pool
+
+# por debajo de este tamaño las corridas son tan cortas que el pool no compensa
+COMPARISON_PARALLEL_MIN = 20_000
+
+# carga compartida por cada proceso del pool (se recibe una vez, en el initializer)
+_shared_workload: PreparedWorkload = None
+
+
+class ComparisonResult(NamedTuple):
+    index: int              # posición de la configuración en la lista pedida
+    algorithm: str
+    params: Dict[str, Any]  # quantum, per_quantum...
+    result: ScheduleResult
+
+
+def iter_comparison(
+    processes: Union[PreparedWorkload, List[Process]],
+    configs: Sequence[Tuple[str, Dict[str, Any]]],
+    max_workers: int = None,
+    progress: Progress = None
+) -> Iterator[ComparisonResult]:
+    """
+    Corre varias configuraciones (algoritmo, parámetros) sobre la misma carga y
+    entrega cada resultado en cuanto termina (el orden no es el de configs).
+
+    Los resultados ya presentes en la cache de run_scheduling se entregan primero.
+    El resto se reparte en un pool de procesos; la carga se envía una sola vez a
+    cada proceso del pool, no una vez por tarea. max_workers=1 corre en serie;
+    None usa un proceso por configuración (hasta os.cpu_count()) si la carga tiene
+    al menos COMPARISON_PARALLEL_MIN procesos.
+
+    progress (ver utils.progress): en serie avanza dentro de cada corrida; con el
+    pool, por configuración terminada. Si lanza una excepción se cancelan las
+    configuraciones que aún no empezaron y no se espera a las que corren.
+    """
+    workload = as_workload(processes)
+    pending: List[Tuple[int, str, Dict[str, Any]]] = []
+    for i, (alg, params) in enumerate(configs):
+        alg = alg.lower()
+        params = dict(params or {})
+        cached = cached_result(_key(workload, alg, params))
+        if cached is not None:
+            yield ComparisonResult(i, alg, params, cached)
+        else:
+            pending.append((i, alg, params))
+    if not pending:
+        return
+
+    if max_workers is None:
+        if len(workload) >= COMPARISON_PARALLEL_MIN:
+            max_workers = min(len(pending), os.cpu_count() or 1)
+        else:
+            max_workers = 1
+    if max_workers <= 1 or len(pending) == 1:
+        for k, (i, alg, params) in enumerate(pending):
+            res = run_scheduling(workload, alg, use_cache=False,
+                                 progress=part(progress, k, len(pending)), **params)
+            store_result(_key(workload, alg, params), res)
+            yield ComparisonResult(i, alg, params, res)
+        return
+
+    with process_pool(max_workers, initializer=_init_worker, initargs=(workload,)) as pool:
+        futures = {
+            pool.submit(_run_config, alg, params): (i, alg, params)
+            for i, alg, params in pending
+        }
+        for done, fut in enumerate(as_completed(futures), 1):
+            i, alg, params = futures[fut]
+            res = fut.result()
+            store_result(_key(workload, alg, params), res)
+            if progress is not None:
+                progress(done / len(futures))
+            yield ComparisonResult(i, alg, params, res)
+
+
+def compare(
+    processes: Union[PreparedWorkload, List[Process]],
+    configs: Sequence[Tuple[str, Dict[str, Any]]],
+    max_workers: int = None,
+    progress: Progress = None
+) -> List[ScheduleResult]:
+    """Igual que iter_comparison, pero devuelve los resultados en el orden de configs."""
+    results: List[ScheduleResult] = [None] * len(configs)
+    for item in iter_comparison(processes, configs, max_workers=max_workers, progress=progress):
+        results[item.index] = item.result
+    return results
+
+
+def _key(workload: PreparedWorkload, alg: str, params: Dict[str, Any]) -> tuple:
+    return cache_key(workload, alg, params.get('quantum'), params.get('per_quantum', False))
+
+
+def _init_worker(workload: PreparedWorkload):
+    global _shared_workload
+    _shared_workload = workload
+
+
+def _run_config(alg: str, params: Dict[str, Any]) -> ScheduleResult:
+    # dentro del pool: sin cache local ni pools anidados
+    return run_scheduling(_shared_workload, alg, use_cache=False, workers=1, **params)
@@ -1,59 +1,212 @@
-from dataclasses import dataclass
-from typing import List, Dict, Any
-from data_io.process_loader import Process
-from scheduling.fifo import schedule as fifo_schedule, ScheduleResult as FIFOResult
+import os
+from typing import Hashable, List, Dict, Optional, Union
+from data_io.process_loader import Process, PreparedWorkload, as_workload
+from data_io.symbols import SymbolTable
+from utils.timeline import Timeline
+from utils.progress import Progress
+from utils.pool import process_pool
+from core.cache import ResultCache, CacheInfo
+from scheduling.fifo import schedule as fifo_schedule, ScheduleResult as FIFOResult, busy_periods
 from scheduling.sjf import schedule as sjf_schedule
 from scheduling.srt import schedule as srt_schedule
 from scheduling.rr import schedule as rr_schedule
 from scheduling.priority import schedule as priority_schedule
 
-@dataclass
-class ScheduleResult:
-    timeline: List[tuple]             # lista de (pid, start, end)
-    waiting_times: Dict[str, int]     # tiempos de espera por pid
-    completion_times: Dict[str, int]  # tiempo de finalización por pid
+ALGORITHMS = ('fifo', 'sjf', 'srt', 'rr', 'priority')
+
+# resultados memoizados por (hash de la carga, algoritmo, parámetros)
+_cache = ResultCache(maxsize=32)
+
+# por debajo de este tamaño no compensa levantar un pool de procesos
+PARALLEL_MIN_PROCESSES = 200_000
+# trozos por worker al repartir los periodos de ocupación (balanceo de carga)
+CHUNKS_PER_WORKER = 4
+
+
+class ScheduleResult(FIFOResult):
+    """
+    Resultado de run_scheduling. Además de segments/waits (con ids de pid, ver
+    scheduling.fifo.ScheduleResult) lleva completions: {pid_id: tiempo de fin}.
+    Con nombres de pid: timeline, waiting_times y completion_times.
+    """
+    def __init__(self, segments: Timeline, waits: Dict[int, int], completions: Dict[int, int],
+                 symbols: SymbolTable):
+        super().__init__(segments, waits, symbols)
+        self.completions = completions
+        self._completion_times = None
+
+    @property
+    def completion_times(self) -> Dict[str, int]:
+        if self._completion_times is None:
+            names = self.symbols.names
+            self._completion_times = {names[p]: t for p, t in self.completions.items()}
+        return self._completion_times
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ScheduleResult):
+            return NotImplemented
+        return (self.timeline == other.timeline and self.waiting_times == other.waiting_times
+                and self.completion_times == other.completion_times)
 
 
 def run_scheduling(
-    processes: List[Any],
+    processes: Union[PreparedWorkload, List[Process]],
     algorithm: str,
-    quantum: int = None
+    quantum: int = None,
+    per_quantum: bool = False,
+    use_cache: bool = True,
+    workers: int = None,
+    progress: Progress = None
 ) -> ScheduleResult:
+    """
+    Ejecuta el algoritmo indicado sobre la carga de procesos.
+    Acepta un PreparedWorkload (ver data_io.process_loader.prepare_workload) o una
+    lista de Process; la lista se ordena y se pasa a columnas una vez por llamada.
+    Con use_cache=True, repetir la misma carga, algoritmo y parámetros devuelve el
+    resultado ya calculado (compartido: no modificarlo).
+
+    workers: procesos para simular en paralelo los periodos de ocupación
+    independientes (1 = en serie; None = os.cpu_count() si la carga tiene al menos
+    PARALLEL_MIN_PROCESSES procesos).
+
+    progress: recibe la fracción completada cada tanto (ver utils.progress); si
+    lanza una excepción, la simulación se interrumpe.
+    """
     alg = algorithm.lower()
+    workload = as_workload(processes)
+    if not use_cache:
+        return _simulate(workload, alg, quantum, per_quantum, workers, progress)
+
+    key = cache_key(workload, alg, quantum, per_quantum)
+    res = cached_result(key)
+    if res is None:
+        res = _simulate(workload, alg, quantum, per_quantum, workers, progress)
+        store_result(key, res)
+    return res
+
+
+def cache_key(workload: PreparedWorkload, alg: str, quantum: int = None, per_quantum: bool = False) -> tuple:
+    """Clave de la cache: hash de la carga, algoritmo y parámetros que le afectan."""
+    # quantum/per_quantum solo afectan a RR
+    params = (quantum, per_quantum) if alg == 'rr' else ()
+    return (workload.fingerprint, alg, params)
+
+
+def cached_result(key: Hashable) -> Optional['ScheduleResult']:
+    """
+    Resultado memoizado bajo key (ver cache_key), o None. Cuenta como hit/miss.
+    Para quien simula por su cuenta (p.ej. core.comparison en un pool) y quiere
+    compartir la cache de run_scheduling.
+    """
+    return _cache.get(key)
+
+
+def store_result(key: Hashable, result: 'ScheduleResult'):
+    """Guarda result bajo key (ver cache_key); desaloja el menos usado si está llena."""
+    _cache.put(key, result)
+
+
+def cache_info() -> CacheInfo:
+    """Hits, misses y tamaño de la cache de run_scheduling."""
+    return _cache.info()
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def _simulate(workload: PreparedWorkload, alg: str, quantum: int,
+              per_quantum: bool, workers: int = None, progress: Progress = None) -> ScheduleResult:
+    if alg not in ALGORITHMS:
+        raise ValueError(f"Algoritmo desconocido: {alg}")
+    if alg == 'rr' and quantum is None:
+        raise ValueError("RR requiere quantum")
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(workload) >= PARALLEL_MIN_PROCESSES else 1
+    if workers > 1:
+        return _simulate_parallel(workload, alg, quantum, per_quantum, workers, progress)
+    res = _run_algorithm(workload, alg, quantum, per_quantum, progress)
+    return _build_result(res.segments, res.waits, workload.symbols)
+
+
+def _simulate_parallel(workload: PreparedWorkload, alg: str, quantum: int,
+                       per_quantum: bool, workers: int, progress: Progress = None) -> ScheduleResult:
+    """
+    Cuando la CPU queda ociosa con la cola vacía, el estado de cualquiera de los
+    algoritmos se reinicia: cada periodo de ocupación se puede simular por separado.
+    Se agrupan periodos consecutivos en trozos, se simulan en un pool de procesos y
+    se concatenan los resultados en orden. El avance se reporta por trozo terminado.
+    """
+    periods = busy_periods(workload)
+    target = max(1, len(workload) // (workers * CHUNKS_PER_WORKER))
+    bounds = []
+    first = 0
+    for p in periods:
+        if p.stop - first >= target:
+            bounds.append((first, p.stop))
+            first = p.stop
+    if first < len(workload):
+        bounds.append((first, len(workload)))
+    if len(bounds) <= 1:
+        res = _run_algorithm(workload, alg, quantum, per_quantum, progress)
+        return _build_result(res.segments, res.waits, workload.symbols)
+
+    segments = Timeline()
+    waits: Dict[int, int] = {}
+    chunks = [workload.slice(a, b) for a, b in bounds]
+    with process_pool(min(workers, len(chunks))) as pool:
+        results = pool.map(
+            _run_chunk, chunks,
+            [alg] * len(chunks), [quantum] * len(chunks), [per_quantum] * len(chunks)
+        )
+        for (_, stop), (chunk_segments, chunk_waits) in zip(bounds, results):
+            segments.extend(chunk_segments)
+            waits.update(chunk_waits)
+            if progress is not None:
+                progress(stop / len(workload))
+    return _build_result(segments, waits, workload.symbols)
+
+
+def _run_chunk(chunk: PreparedWorkload, alg: str, quantum: int, per_quantum: bool):
+    """Punto de entrada en el proceso hijo: devuelve (segments, waits)."""
+    res = _run_algorithm(chunk, alg, quantum, per_quantum)
+    return res.segments, res.waits
+
+
+def _run_algorithm(workload: PreparedWorkload, alg: str, quantum: int, per_quantum: bool,
+                   progress: Progress = None) -> FIFOResult:
     if alg == 'fifo':
         # first in first out: el que llega primero sale primero
-        res = fifo_schedule(processes)
+        return fifo_schedule(workload, progress=progress)
     elif alg == 'sjf':
         # shortest job first: ejecuta primero el proceso con menor duración
-        res = sjf_schedule(processes)
+        return sjf_schedule(workload, progress=progress)
     elif alg == 'srt':
         # shortest remaining time: como SJF pero permite interrupción
-        res = srt_schedule(processes)
+        return srt_schedule(workload, progress=progress)
     elif alg == 'rr':
         # round robin: usa quantum para rebanadas de tiempo
-        if quantum is None:
-            raise ValueError("RR requiere quantum")
-        res = rr_schedule(processes, quantum=quantum)
+        # per_quantum conserva un segmento por quantum (para animar el Gantt)
+        return rr_schedule(workload, quantum=quantum, per_quantum=per_quantum, progress=progress)
     elif alg == 'priority':
         # priority: ejecuta primero procesos con mayor prioridad
-        res = priority_schedule(processes)
+        return priority_schedule(workload, progress=progress)
     else:
-        raise ValueError(f"Algoritmo desconocido: {algorithm}")
+        raise ValueError(f"Algoritmo desconocido: {alg}")
 
-    # timeline y waiting_times del algoritmo
-    timeline = res.timeline
-    waiting_times = getattr(res, 'waiting_times', {})
 
-    # calcular completion_times:
-    # para cada pid, se toma el tiempo de fin más alto de su timeline
-    completion_times: Dict[str, int] = {}
-    for pid, start, end in timeline:
-        prev = completion_times.get(pid, 0)
-        completion_times[pid] = max(prev, end)  # así se guarda el momento en que acaba cada proceso
+def _build_result(segments: Timeline, waits: Dict[int, int], symbols: SymbolTable) -> ScheduleResult:
+    # calcular completions:
+    # para cada pid, se toma el tiempo de fin más alto de sus segmentos
+    completions: Dict[int, int] = {}
+    for pid, start, end in segments:
+        prev = completions.get(pid, 0)
+        completions[pid] = max(prev, end)  # así se guarda el momento en que acaba cada proceso
 
     # devuelve ScheduleResult con todos los datos
     return ScheduleResult(
-        timeline=timeline,
-        waiting_times=waiting_times,
-        completion_times=completion_times
+        segments=segments,
+        waits=waits,
+        completions=completions,
+        symbols=symbols
     )
@@ -0,0 +1,75 @@
+import os
+from typing import Any, Dict, Iterable, List, Union
+from data_io.process_loader import Process, PreparedWorkload, as_workload
+from core.comparison import COMPARISON_PARALLEL_MIN
+from core.scheduler import run_scheduling
+from utils.pool import process_pool
+from utils.metrics import (
+    compute_avg_waiting_time,
+    compute_avg_turnaround_time,
+    compute_context_switches,
+    compute_throughput
+)
+
+# carga compartida por cada proceso del pool (se recibe una vez, en el initializer)
+_shared_workload: PreparedWorkload = None
+
+
+def sweep_quantum(
+    processes: Union[PreparedWorkload, List[Process]],
+    quanta: Iterable[int],
+    max_workers: int = None
+) -> List[Dict[str, Any]]:
+    """
+    Evalúa Round Robin para cada quantum de 'quanta' sobre la misma carga
+    (ordenada una sola vez) y corre los quantums en paralelo: max_workers=1 en
+    serie, None como core.comparison (un proceso por quantum, hasta os.cpu_count(),
+    si la carga tiene al menos COMPARISON_PARALLEL_MIN procesos).
+
+    Cada corrida se reduce a su fila de métricas donde se simula: al proceso
+    padre solo vuelven las filas, y los timelines no pasan por la cache de
+    run_scheduling (un barrido no desaloja los resultados de la GUI o la CLI).
+
+    Devuelve una tabla ordenada por quantum: una fila por quantum con
+    quantum, awt, avg_turnaround, context_switches y throughput.
+    """
+    workload = as_workload(processes)
+    quanta = sorted(set(quanta))
+    if any(q <= 0 for q in quanta):
+        raise ValueError("Los quantums deben ser positivos")
+
+    if max_workers is None:
+        if len(workload) >= COMPARISON_PARALLEL_MIN:
+            max_workers = min(len(quanta), os.cpu_count() or 1)
+        else:
+            max_workers = 1
+    if max_workers <= 1 or len(quanta) <= 1:
+        return [_quantum_row(workload, q) for q in quanta]
+
+    with process_pool(max_workers, initializer=_init_worker, initargs=(workload,)) as pool:
+        return list(pool.map(_sweep_row, quanta))
+
+
+def _quantum_row(workload: PreparedWorkload, quantum: int, workers: int = None) -> Dict[str, Any]:
+    # sin cache: el timeline se descarta en cuanto se calculan las métricas
+    res = run_scheduling(workload, 'rr', quantum=quantum, use_cache=False, workers=workers)
+    # métricas sobre ids de pid: sin pasar por los nombres
+    arrival_map = dict(zip(workload.pid_ids, workload.arrival))
+    makespan = max(res.completions.values(), default=0)
+    return {
+        'quantum': quantum,
+        'awt': compute_avg_waiting_time(res.waits),
+        'avg_turnaround': compute_avg_turnaround_time(res.completions, arrival_map),
+        'context_switches': compute_context_switches(res.segments),
+        'throughput': compute_throughput(res.completions, makespan)
+    }
+
+
+def _init_worker(workload: PreparedWorkload):
+    global _shared_workload
+    _shared_workload = workload
+
+
+def _sweep_row(quantum: int) -> Dict[str, Any]:
+    # dentro del pool: sin cache local ni pools anidados
+    return _quantum_row(_shared_workload, quantum, workers=1)
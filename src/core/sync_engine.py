@@ -1,25 +1,228 @@
-from typing import List, Any
+import heapq
+import os
+from array import array
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Any, Tuple, Union
 from data_io.process_loader import Process
-from data_io.sync_loader import Resource, Action
-from synchronization.mutex import simulate as mutex_sim
-from synchronization.semaphore import simulate as sem_sim
+from data_io.sync_loader import Resource, Action, PreparedTrace, as_trace
+from core.cache import ResultCache, CacheInfo, fingerprint
+from synchronization.engine import SyncResult, WAITING, simulate_trace, simulate_counts_stream, capacities
+from synchronization.blocking import simulate_blocking_trace
+from synchronization.rwlock import simulate_rwlock_trace
+from synchronization import vectorized
+from utils.timeline import SyncTimeline
+from utils.progress import Progress
+from utils.pool import process_pool
+
+RESOURCE_FIELDS = ('name', 'count')
+
+# resultados memoizados por (hash de la traza, de los recursos y modo)
+_cache = ResultCache(maxsize=16)
+
+# por debajo de este número de acciones no compensa levantar un pool de procesos
+PARALLEL_MIN_ACTIONS = 500_000
 
 
 def run_synchronization(processes: List[Process], resources: List[Resource],
-                       actions: List[Action], mode: str = 'mutex') -> Any:
+                       actions: Union[PreparedTrace, List[Action]], mode: str = 'mutex',
+                       use_cache: bool = True, workers: int = None,
+                       blocking: bool = False, rw_policy: str = 'readers',
+                       hold_and_wait: bool = False, progress: Progress = None) -> Any:
     """
     Orquesta la simulación de sincronización.
 
     :param processes: lista de Process
     :param resources: lista de Resource
-    :param actions: lista de Action
+    :param actions: lista de Action o PreparedTrace (prepare_trace con los pids de
+                    processes y los nombres de resources). Para repetir corridas
+                    conviene pasar la traza: su hash se calcula una sola vez y un
+                    hit de la cache no vuelve a recorrer las acciones
+    :param mode: 'mutex', 'semaphore' o 'rwlock'
+    :param use_cache: reutiliza el resultado si ya se simuló la misma entrada
+    :param workers: procesos para simular en paralelo grupos de recursos
+                    (1 = en serie; None = os.cpu_count() si hay al menos
+                    PARALLEL_MIN_ACTIONS acciones). Sin numpy corre en serie
+    :param blocking: las acciones denegadas esperan en una cola FIFO por recurso
+                     en lugar de descartarse (devuelve BlockingSyncResult)
+    :param rw_policy: en modo rwlock, 'readers' (prefiere lecturas) o 'writers'
+    :param hold_and_wait: (requiere blocking) un pid en cola conserva lo que retiene
+                          y no emite más acciones hasta que se le conceda; los
+                          interbloqueos se reportan en BlockingSyncResult.deadlocks
+    :param progress: recibe la fracción completada cada tanto (ver utils.progress);
+                     si lanza una excepción, la simulación se interrumpe
+    :return: SyncResult con timeline y waiting_counts (compartido si viene de la cache)
+    """
+    m = mode.lower()
+    if hold_and_wait and not blocking:
+        raise ValueError("hold_and_wait requiere blocking=True")
+    # pids y recursos se internan una vez; los motores trabajan con enteros
+    trace = as_trace(actions, (p.pid for p in processes), (res.name for res in resources))
+    if not use_cache:
+        return _simulate(trace, resources, m, workers, blocking, rw_policy,
+                         hold_and_wait, progress)
+
+    # los pids de processes y los nombres de resources ya entran en el hash de la traza
+    key = (
+        trace.fingerprint,
+        fingerprint(resources, RESOURCE_FIELDS),
+        m,
+        blocking,
+        hold_and_wait,
+        rw_policy if m == 'rwlock' else None
+    )
+    res = _cache.get(key)
+    if res is None:
+        res = _simulate(trace, resources, m, workers, blocking, rw_policy,
+                        hold_and_wait, progress)
+        _cache.put(key, res)
+    return res
+
+
+def run_synchronization_stream(processes: List[Process], resources: List[Resource],
+                               action_cycles: Iterable[Tuple[int, List[Action]]],
+                               sink: Callable[[tuple], None], mode: str = 'mutex') -> Dict[str, int]:
+    """
+    Simulación en memoria constante para trazas que no caben en RAM.
+
+    :param action_cycles: (ciclo, acciones) en orden creciente de ciclo, p.ej.
+                          data_io.sync_loader.iter_action_cycles(path)
+    :param sink: recibe cada fila (cycle, pid, resource, state, duration) del timeline
     :param mode: 'mutex' o 'semaphore'
-    :return: SyncResult con timeline y waiting_counts
+    :return: waiting_counts
     """
     m = mode.lower()
+    if m == 'rwlock':
+        raise ValueError("El modo rwlock no admite streaming")
+    counts = _mode_counts(resources, m)
+    return simulate_counts_stream(processes, counts, action_cycles, sink)
+
+
+def cache_info() -> CacheInfo:
+    """Hits, misses y tamaño de la cache de run_synchronization."""
+    return _cache.info()
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def _simulate(trace: PreparedTrace, resources: List[Resource], m: str, workers: int = None,
+              blocking: bool = False, rw_policy: str = 'readers',
+              hold_and_wait: bool = False, progress: Progress = None) -> Any:
+    counts = _mode_counts(resources, m)
+    capacity = capacities(trace, counts)
+    if m == 'rwlock':
+        if blocking:
+            raise ValueError("El modo rwlock no admite simulación bloqueante")
+        engine = partial(simulate_rwlock_trace, policy=rw_policy)
+    elif blocking:
+        return simulate_blocking_trace(trace, capacity, hold_and_wait, progress)
+    else:
+        engine = _simulate_counts
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(trace) >= PARALLEL_MIN_ACTIONS else 1
+    if workers > 1 and vectorized.np is not None:
+        return _simulate_sharded(trace, capacity, workers, engine, progress)
+    return engine(trace, capacity, progress=progress)
+
+
+def _mode_counts(resources: List[Resource], m: str) -> Dict[str, int]:
     if m == 'mutex':
-        return mutex_sim(processes, resources, actions)
-    elif m == 'semaphore':
-        return sem_sim(processes, resources, actions)
+        # mutex: un acceso por recurso y ciclo
+        return {res.name: 1 for res in resources}
+    elif m in ('semaphore', 'rwlock'):
+        # semáforo: 'count' accesos por recurso y ciclo; rwlock solo distingue count > 0
+        return {res.name: res.count for res in resources}
     else:
-        raise ValueError(f"Modo desconocido: {mode}")
+        raise ValueError(f"Modo desconocido: {m}")
+
+
+def _simulate_counts(trace: PreparedTrace, capacity: List[int], progress: Progress = None) -> SyncResult:
+    # trazas grandes: motor vectorizado (mismo resultado) si numpy está disponible
+    # y todas las acciones duran un ciclo
+    if (vectorized.np is not None and len(trace) >= vectorized.VECTORIZE_MIN
+            and all(d == 1 for d in trace.duration)):
+        return vectorized.simulate_trace_vectorized(trace, capacity, progress)
+    return simulate_trace(trace, capacity, progress)
+
+
+def _simulate_sharded(trace: PreparedTrace, capacity: List[int], workers: int,
+                      engine: Callable, progress: Progress = None) -> SyncResult:
+    """
+    En los modos no bloqueantes, las decisiones sobre recursos distintos nunca
+    interactúan: se reparten los recursos en grupos (balanceados por número de
+    acciones) y cada grupo se simula con engine en un pool de procesos.
+
+    Las acciones se reordenan una vez por grupo (estable: dentro del grupo queda
+    el orden del archivo), así cada grupo es un rango contiguo de las columnas.
+    Cada proceso devuelve sus filas en orden (ciclo, orden del archivo); la mezcla
+    es un único lexsort sobre esa clave y las esperas se suman por pid. El avance
+    se reporta al terminar cada grupo. Requiere numpy.
+    """
+    np = vectorized.np
+    res = np.frombuffer(trace.resource, dtype=np.int64)
+    sizes = np.bincount(res, minlength=len(trace.resources))
+    used = np.flatnonzero(sizes)
+    if len(used) <= 1:
+        return engine(trace, capacity, progress=progress)
+
+    # asignación greedy: el recurso más cargado va al grupo con menos acciones
+    n_shards = min(workers, len(used))
+    shard_of = np.zeros(len(sizes), dtype=np.int64)
+    loads = [(0, k) for k in range(n_shards)]
+    for r in used[np.argsort(-sizes[used], kind='stable')].tolist():
+        load, k = heapq.heappop(loads)
+        shard_of[r] = k
+        heapq.heappush(loads, (load + int(sizes[r]), k))
+    action_shard = shard_of[res]
+    order = np.argsort(action_shard, kind='stable')
+    bounds = np.searchsorted(action_shard[order], np.arange(n_shards + 1)).tolist()
+
+    columns = [np.frombuffer(col, dtype=col.typecode)[order] for col in _trace_columns(trace)]
+    parts = [
+        PreparedTrace(*(array(col.typecode, data[lo:hi].tobytes())
+                        for col, data in zip(_trace_columns(trace), columns)),
+                      pids=trace.pids, resources=trace.resources, n_processes=trace.n_processes)
+        for lo, hi in zip(bounds, bounds[1:])
+    ]
+
+    with process_pool(n_shards) as pool:
+        results = []
+        for part in pool.map(engine, parts, [capacity] * n_shards):
+            results.append(part)
+            if progress is not None:
+                progress(len(results) / n_shards)
+
+    # índice en el archivo de cada fila: las del grupo con ciclo >= 0, por (ciclo, índice)
+    cycle = np.frombuffer(trace.cycle, dtype=np.int64)
+    keys = []
+    for lo, hi in zip(bounds, bounds[1:]):
+        idx = order[lo:hi]
+        idx = idx[cycle[idx] >= 0]
+        keys.append(idx[np.argsort(cycle[idx], kind='stable')])
+    # cada columna con el tipo más ancho entre las partes (duration puede variar)
+    merged = []
+    for name in SyncTimeline.COLUMNS:
+        cols = [getattr(part.segments, name) for part in results]
+        typecode = max((col.typecode for col in cols), key=lambda tc: np.dtype(tc).itemsize)
+        merged.append((typecode, np.concatenate([np.frombuffer(col, dtype=col.typecode) for col in cols])))
+    perm = np.lexsort((np.concatenate(keys), merged[0][1]))
+    segments = SyncTimeline.from_columns(*(array(tc, col[perm].tobytes()) for tc, col in merged))
+
+    # esperas: primero los pids de processes y luego el resto en orden de su
+    # primera espera en el timeline, igual que en la simulación en serie
+    waits: Dict[int, int] = dict.fromkeys(range(trace.n_processes), 0)
+    waiting = np.frombuffer(segments.pid, dtype=np.int32)[
+        np.frombuffer(segments.state, dtype=np.int8) == WAITING]
+    codes, first = np.unique(waiting, return_index=True)
+    for code in codes[np.argsort(first)].tolist():
+        waits.setdefault(code, 0)
+    for part in results:
+        for pid, n in part.waits.items():
+            waits[pid] = waits.get(pid, 0) + n
+    return SyncResult(segments, waits, trace.pids, trace.resources)
+
+
+def _trace_columns(trace: PreparedTrace) -> tuple:
+    # mismo orden que los campos de PreparedTrace
+    return trace.pid, trace.resource, trace.cycle, trace.duration, trace.write
@@ -1,5 +1,8 @@
-from dataclasses import dataclass
-from typing import List
+import hashlib
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Union
+from data_io.symbols import SymbolTable
 
 @dataclass
 class Process:
@@ -9,6 +12,96 @@ class Process:
     priority: int
 
 
+@dataclass
+class PreparedWorkload:
+    """
+    Carga de procesos en formato columnar, ordenada por llegada (estable: respeta
+    el orden del archivo en empates). Se construye una vez y la comparten todos
+    los algoritmos; cada proceso se identifica por su índice en estos arreglos.
+    Los algoritmos reportan cada pid por su id en symbols (pid_ids).
+    """
+    pids: List[str]          # pid por índice
+    burst: array             # burst_time por índice
+    arrival: array           # arrival_time por índice (no decreciente)
+    priority: array          # priority por índice
+    index: Dict[str, int]    # pid -> índice
+    pid_ids: array           # id del pid en symbols, por índice
+    symbols: SymbolTable     # pids internados (compartida con las sub-cargas)
+    _fingerprint: str = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash del contenido (se calcula una sola vez)."""
+        if self._fingerprint is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update('\x1f'.join(self.pids).encode())
+            for col in (self.burst, self.arrival, self.priority):
+                h.update(col.tobytes())
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    def slice(self, first: int, stop: int) -> 'PreparedWorkload':
+        """
+        Sub-carga con los procesos [first, stop) (sigue ordenada por llegada).
+        Comparte symbols, así que sus resultados usan los mismos ids.
+        """
+        pids = self.pids[first:stop]
+        return PreparedWorkload(
+            pids=pids,
+            burst=self.burst[first:stop],
+            arrival=self.arrival[first:stop],
+            priority=self.priority[first:stop],
+            index={pid: k for k, pid in enumerate(pids)},
+            pid_ids=self.pid_ids[first:stop],
+            symbols=self.symbols
+        )
+
+    def process(self, pid: str) -> Optional[Process]:
+        """Process de pid (por index, sin recorrer la carga); None si no está."""
+        k = self.index.get(pid)
+        if k is None:
+            return None
+        return Process(pid=pid, burst_time=self.burst[k], arrival_time=self.arrival[k],
+                       priority=self.priority[k])
+
+    def processes(self) -> List[Process]:
+        """Reconstruye la lista de Process (en orden de llegada)."""
+        return [
+            Process(pid=pid, burst_time=bt, arrival_time=at, priority=pr)
+            for pid, bt, at, pr in zip(self.pids, self.burst, self.arrival, self.priority)
+        ]
+
+
+def prepare_workload(processes: Sequence[Process]) -> PreparedWorkload:
+    """
+    Ordena los procesos por arrival_time una sola vez, los pasa a arreglos e
+    interna los pids.
+    """
+    order = sorted(range(len(processes)), key=lambda k: processes[k].arrival_time)
+    procs = [processes[k] for k in order]
+    pids = [p.pid for p in procs]
+    symbols = SymbolTable()
+    return PreparedWorkload(
+        pids=pids,
+        burst=array('q', [p.burst_time for p in procs]),
+        arrival=array('q', [p.arrival_time for p in procs]),
+        priority=array('q', [p.priority for p in procs]),
+        index={pid: k for k, pid in enumerate(pids)},
+        pid_ids=array('q', [symbols.intern(pid) for pid in pids]),
+        symbols=symbols
+    )
+
+
+def as_workload(processes: Union[PreparedWorkload, Sequence[Process]]) -> PreparedWorkload:
+    """Acepta una lista de Process o un PreparedWorkload ya construido."""
+    if isinstance(processes, PreparedWorkload):
+        return processes
+    return prepare_workload(processes)
+
+
 def load_processes(path: str) -> List[Process]:
     """
     Lee un archivo de procesos con formato por línea:
@@ -33,4 +126,4 @@ def load_processes(path: str) -> List[Process]:
                     priority=int(pr)
                 )
             )
-    return processes
\ No newline at end of file
+    return processes
@@ -0,0 +1,43 @@
+from typing import Dict, Iterable, List, Optional
+
+
+class SymbolTable:
+    """
+    Nombres (pids, recursos) internados como enteros densos 0..n-1, en orden de
+    primera aparición. Los motores trabajan con los enteros; los nombres solo se
+    usan para mostrar y exportar.
+    """
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        """Id de name, creándolo si es nuevo."""
+        i = self._ids.get(name)
+        if i is None:
+            i = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def get(self, name: str) -> Optional[int]:
+        """Id de name, o None si no está."""
+        return self._ids.get(name)
+
+    def name(self, i: int) -> str:
+        return self.names[i]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __getstate__(self):
+        # al serializar (pools de procesos) basta con los nombres
+        return self.names
+
+    def __setstate__(self, names):
+        self.names = names
+        self._ids = {name: i for i, name in enumerate(names)}
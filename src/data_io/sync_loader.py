@@ -1,5 +1,8 @@
-from dataclasses import dataclass
-from typing import List
+import hashlib
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Tuple, Union
+from data_io.symbols import SymbolTable
 
 
 @dataclass
@@ -13,6 +16,72 @@ class Action:
     action: str  # 'READ' o 'WRITE'
     resource: str
     cycle: int
+    duration: int = 1  # ciclos que retiene el recurso si se le concede
+
+
+@dataclass
+class PreparedTrace:
+    """
+    Acciones en formato columnar (en orden del archivo), con pids y recursos
+    internados como enteros. Los motores de sincronización trabajan sobre esto.
+    """
+    pid: array              # id del pid en pids, por acción
+    resource: array         # id del recurso en resources, por acción
+    cycle: array
+    duration: array
+    write: array            # 1 si la acción es WRITE
+    pids: SymbolTable       # primero los pids de processes, luego los que aparecen en acciones
+    resources: SymbolTable  # primero los de resources, luego los que aparecen en acciones
+    n_processes: int        # los ids 0..n_processes-1 son los pids de processes
+    _fingerprint: str = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash de las columnas y los nombres internados (se calcula una sola vez)."""
+        if self._fingerprint is None:
+            h = hashlib.blake2b(digest_size=16)
+            for names in (self.pids.names, self.resources.names):
+                h.update('\x1f'.join(names).encode())
+                h.update(b'\x1e')
+            h.update(self.n_processes.to_bytes(8, 'little'))
+            for col in (self.pid, self.resource, self.cycle, self.duration, self.write):
+                h.update(col.tobytes())
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+
+def prepare_trace(actions: Iterable[Action], pids: Iterable[str] = (),
+                  resources: Iterable[str] = ()) -> PreparedTrace:
+    """
+    Interna pids y recursos (primero los nombres dados, p.ej. los de processes y
+    resources, en ese orden) y pasa las acciones a columnas.
+    """
+    pid_table = SymbolTable(pids)
+    res_table = SymbolTable(resources)
+    n_processes = len(pid_table)
+    trace = PreparedTrace(array('q'), array('q'), array('q'), array('q'), array('b'),
+                          pid_table, res_table, n_processes)
+    for act in actions:
+        trace.pid.append(pid_table.intern(act.pid))
+        trace.resource.append(res_table.intern(act.resource))
+        trace.cycle.append(act.cycle)
+        trace.duration.append(act.duration)
+        trace.write.append(act.action == 'WRITE')
+    return trace
+
+
+def as_trace(actions: Union[PreparedTrace, Iterable[Action]], pids: Iterable[str] = (),
+             resources: Iterable[str] = ()) -> PreparedTrace:
+    """
+    Acepta una lista de Action o un PreparedTrace ya construido (con
+    prepare_trace sobre los mismos pids y recursos, que entonces se ignoran).
+    """
+    if isinstance(actions, PreparedTrace):
+        return actions
+    return prepare_trace(actions, pids, resources)
 
 
 def load_resources(path: str) -> List[Resource]:
@@ -38,25 +107,55 @@ def load_resources(path: str) -> List[Resource]:
 def load_actions(path: str) -> List[Action]:
     """
     Lee un archivo de acciones con formato por línea:
-        <PID>, <ACCION>, <RECURSO>, <CICLO>
-    y devuelve una lista de Action.
+        <PID>, <ACCION>, <RECURSO>, <CICLO>[, <DURACION>]
+    y devuelve una lista de Action. Sin DURACION, la acción dura un ciclo.
+    """
+    return list(iter_actions(path))
+
+
+def iter_actions(path: str) -> Iterator[Action]:
+    """
+    Igual que load_actions, pero entrega las acciones una a una sin cargar el
+    archivo completo en memoria.
     """
-    actions: List[Action] = []
     with open(path, 'r') as f:
         for line in f:
             line = line.strip()
             if not line or line.startswith('#'):
                 continue
             parts = [p.strip() for p in line.split(',')]
-            if len(parts) != 4:
+            if len(parts) not in (4, 5):
                 raise ValueError(f"Formato inválido en línea de acciones: '{line}'")
-            pid, act, res, cyc = parts
-            actions.append(
-                Action(
-                    pid=pid,
-                    action=act.upper(),
-                    resource=res,
-                    cycle=int(cyc)
-                )
+            pid, act, res, cyc = parts[:4]
+            duration = int(parts[4]) if len(parts) == 5 else 1
+            if duration < 1:
+                raise ValueError(f"Duración inválida en línea de acciones: '{line}'")
+            yield Action(
+                pid=pid,
+                action=act.upper(),
+                resource=res,
+                cycle=int(cyc),
+                duration=duration
             )
-    return actions
+
+
+def iter_action_cycles(path: str) -> Iterator[Tuple[int, List[Action]]]:
+    """
+    Lee un archivo de acciones ordenado por ciclo y entrega (ciclo, acciones del
+    ciclo en orden del archivo). En memoria solo hay un ciclo a la vez.
+    Lanza ValueError si el archivo no está ordenado por ciclo.
+    """
+    cycle = None
+    batch: List[Action] = []
+    for act in iter_actions(path):
+        if act.cycle != cycle:
+            if batch:
+                yield cycle, batch
+            if cycle is not None and act.cycle < cycle:
+                raise ValueError(
+                    f"Archivo de acciones no ordenado por ciclo: {act.cycle} después de {cycle}"
+                )
+            cycle, batch = act.cycle, []
+        batch.append(act)
+    if batch:
+        yield cycle, batch
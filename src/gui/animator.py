@@ -0,0 +1,109 @@
+import time
+from typing import Callable, Optional
+
+# un cuadro cada FRAME_MS (~30 fps), sin importar cuántos pasos tenga la animación
+FRAME_MS = 33
+
+
+class Animator:
+    """
+    Reproduce una animación de 'total' pasos con un solo timer de Tk.
+
+    Un reloj de reproducción avanza step_ms por paso (dividido por speed); en
+    cada cuadro se llama a on_frame(n) con los pasos que ya tocan mostrarse,
+    así que si un paso dura menos que un cuadro se dibujan varios de una vez.
+    Admite pausa, reanudación, cambio de velocidad y salto a cualquier paso.
+    """
+    def __init__(self, widget, on_frame: Callable[[int], None], frame_ms: int = FRAME_MS):
+        self.widget = widget
+        self.on_frame = on_frame
+        self.frame_ms = frame_ms
+        self.total = 0
+        self.step_ms = 1.0
+        self.speed = 1.0
+        self._pos = 0.0                   # pasos transcurridos en _t_ref
+        self._t_ref: Optional[float] = None  # instante (monotonic) de _pos; None = en pausa
+        self._job: Optional[str] = None
+        self._shown = 0
+
+    @property
+    def playing(self) -> bool:
+        return self._t_ref is not None
+
+    @property
+    def position(self) -> int:
+        """Pasos mostrados."""
+        return self._shown
+
+    def start(self, total: int, step_ms: float):
+        """Empieza desde el principio: el paso i se muestra a los step_ms * i ms."""
+        self.stop()
+        self.total = total
+        self.step_ms = max(float(step_ms), 1e-3)
+        self._pos = 1.0 if total else 0.0
+        self.resume()
+
+    def pause(self):
+        if not self.playing:
+            return
+        self._pos = self._clock()
+        self._t_ref = None
+        self._cancel()
+
+    def resume(self):
+        if self.playing or self._pos >= self.total:
+            self._emit()
+            return
+        self._t_ref = time.monotonic()
+        self._tick()
+
+    def set_speed(self, speed: float):
+        """Multiplicador de velocidad (2 = el doble de rápido)."""
+        if speed <= 0:
+            raise ValueError("La velocidad debe ser positiva")
+        self._pos = self._clock()
+        if self.playing:
+            self._t_ref = time.monotonic()
+        self.speed = speed
+
+    def seek(self, position: int):
+        """Salta a 'position' pasos mostrados, en pausa o reproduciendo."""
+        self._pos = float(min(max(position, 0), self.total))
+        if self.playing:
+            self._t_ref = time.monotonic()
+            if self._pos >= self.total:
+                self._cancel()
+                self._t_ref = None
+        self._emit()
+
+    def stop(self):
+        self._cancel()
+        self._t_ref = None
+        self._pos = 0.0
+        self._shown = 0
+        self.total = 0
+
+    def _clock(self) -> float:
+        if self._t_ref is None:
+            return self._pos
+        elapsed = (time.monotonic() - self._t_ref) * 1000 * self.speed
+        return min(self._pos + elapsed / self.step_ms, float(self.total))
+
+    def _emit(self):
+        n = int(self._clock())
+        if n != self._shown:
+            self._shown = n
+            self.on_frame(n)
+
+    def _tick(self):
+        self._job = None
+        self._emit()
+        if self._shown >= self.total:
+            self._pos, self._t_ref = float(self.total), None
+            return
+        self._job = self.widget.after(self.frame_ms, self._tick)
+
+    def _cancel(self):
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
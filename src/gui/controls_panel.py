@@ -61,12 +61,13 @@ class ControlsPanel(ctk.CTkFrame):
         entry_delay = ctk.CTkEntry(cal_tab, textvariable=self.delay_var, width=80)
         entry_delay.grid(row=7, column=1, padx=10, pady=(5,2), sticky="w")
 
-        # Botones Ejecutar / Pausar / Limpiar
+        # Botones Ejecutar / Pausar / Reanudar / Limpiar
         btns = ctk.CTkFrame(cal_tab)
         btns.grid(row=8, column=0, columnspan=2, pady=10)
         ctk.CTkButton(btns, text="Ejecutar", command=self._on_run).grid(row=0, column=0, padx=5)
         ctk.CTkButton(btns, text="Pausar", command=self.callbacks.get('pause')).grid(row=0, column=1, padx=5)
-        ctk.CTkButton(btns, text="Limpiar", command=self.callbacks.get('clear')).grid(row=0, column=2, padx=5)
+        ctk.CTkButton(btns, text="Reanudar", command=self.callbacks.get('resume')).grid(row=0, column=2, padx=5)
+        ctk.CTkButton(btns, text="Limpiar", command=self.callbacks.get('clear')).grid(row=0, column=3, padx=5)
 
         # Visor métricas y procesos
         self.metrics_box = ctk.CTkTextbox(cal_tab, height=100)
@@ -94,8 +95,17 @@ class ControlsPanel(ctk.CTkFrame):
         lbl_mode = ctk.CTkLabel(sync_tab, text="Modo:")
         lbl_mode.grid(row=0, column=0, sticky="w", padx=10, pady=(10,2))
         self.sync_var = tk.StringVar(value="mutex")
-        ctk.CTkOptionMenu(sync_tab, variable=self.sync_var, values=["mutex","semaphore"]) \
+        ctk.CTkOptionMenu(sync_tab, variable=self.sync_var, values=["mutex","semaphore","rwlock"],
+                          command=self._on_sync_mode) \
             .grid(row=1, column=0, sticky="w", padx=10, pady=(0,10))
+        # Política del rwlock: preferir lecturas o escrituras
+        self.sync_rw_policy_var = tk.StringVar(value="readers")
+        ctk.CTkOptionMenu(sync_tab, variable=self.sync_rw_policy_var, values=["readers","writers"], width=100) \
+            .grid(row=0, column=0, sticky="e", padx=10, pady=(10,2))
+        # Bloqueante: las acciones denegadas esperan en cola FIFO por recurso
+        self.sync_blocking_var = tk.BooleanVar(value=False)
+        self.sync_blocking_check = ctk.CTkCheckBox(sync_tab, text="Bloqueante", variable=self.sync_blocking_var)
+        self.sync_blocking_check.grid(row=1, column=0, sticky="e", padx=10, pady=(0,10))
 
         # Carga y vista de archivos
         ctk.CTkButton(sync_tab, text="Cargar procesos", command=self.callbacks.get('load')) \
@@ -110,6 +120,10 @@ class ControlsPanel(ctk.CTkFrame):
         # Delay sincronización
         lbl_sync_delay = ctk.CTkLabel(sync_tab, text="Delay (ms):")
         lbl_sync_delay.grid(row=8, column=0, sticky="w", padx=10, pady=(5,2))
+        # Retener en espera: un proceso en cola conserva sus recursos (puede interbloquearse)
+        self.sync_hold_var = tk.BooleanVar(value=False)
+        self.sync_hold_check = ctk.CTkCheckBox(sync_tab, text="Retener en espera", variable=self.sync_hold_var)
+        self.sync_hold_check.grid(row=8, column=0, sticky="e", padx=10, pady=(5,2))
         self.sync_delay_var = tk.StringVar(value='500')
         ctk.CTkEntry(sync_tab, textvariable=self.sync_delay_var, width=80).grid(row=9, column=0, sticky="w", padx=10, pady=(2,10))
 
@@ -118,7 +132,8 @@ class ControlsPanel(ctk.CTkFrame):
         btns2.grid(row=10, column=0, pady=5)
         ctk.CTkButton(btns2, text="Ejecutar", command=self._on_sync_run).grid(row=0, column=0, padx=5)
         ctk.CTkButton(btns2, text="Pausar", command=self.callbacks.get('pause')).grid(row=0, column=1, padx=5)
-        ctk.CTkButton(btns2, text="Limpiar", command=self.callbacks.get('clear')).grid(row=0, column=2, padx=5)
+        ctk.CTkButton(btns2, text="Reanudar", command=self.callbacks.get('resume')).grid(row=0, column=2, padx=5)
+        ctk.CTkButton(btns2, text="Limpiar", command=self.callbacks.get('clear')).grid(row=0, column=3, padx=5)
 
         # Visores de sync
         self.sync_metrics_box = ctk.CTkTextbox(sync_tab, height=100)
@@ -141,6 +156,15 @@ class ControlsPanel(ctk.CTkFrame):
             state = 'normal' if self.algo_vars['rr'].get() else 'disabled'
             self.quantum_entry.configure(state=state)
 
+    def _on_sync_mode(self, mode):
+        # el rwlock no tiene versión bloqueante (ni retener en espera, que la implica)
+        state = 'disabled' if mode == 'rwlock' else 'normal'
+        if mode == 'rwlock':
+            self.sync_blocking_var.set(False)
+            self.sync_hold_var.set(False)
+        self.sync_blocking_check.configure(state=state)
+        self.sync_hold_check.configure(state=state)
+
     def _on_run(self):
         algos = [a for a, var in self.algo_vars.items() if var.get()]
         quantum = int(self.quantum_var.get()) if 'rr' in algos else None
@@ -150,7 +174,11 @@ class ControlsPanel(ctk.CTkFrame):
     def _on_sync_run(self):
         mode = self.sync_var.get()
         delay = int(self.sync_delay_var.get())
-        self.callbacks.get('run_sync')(mode=mode, delay=delay)
+        blocking = self.sync_blocking_var.get()
+        rw_policy = self.sync_rw_policy_var.get()
+        hold_and_wait = self.sync_hold_var.get()
+        self.callbacks.get('run_sync')(mode=mode, delay=delay, blocking=blocking or hold_and_wait,
+                                       rw_policy=rw_policy, hold_and_wait=hold_and_wait)
 
     def display_file_content(self, content):
         self.file_view_box.configure(state="normal")
@@ -1,12 +1,58 @@
 import customtkinter as ctk
 import tkinter as tk
-from typing import List, Tuple, Dict, Callable
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from synchronization.engine import ACCESED, WAITING, STATES
+from gui.animator import Animator
+from utils.timeline import Timeline, SyncTimeline, TimelineIndex
+
+# geometría del eje X: margen izquierdo y píxeles por unidad de tiempo (zoom inicial)
+X0 = 50
+UNIT_PX = 20
+MAX_UNIT_PX = 400
+ZOOM_STEP = 1.5
+SPEEDS = ("0.5x", "1x", "2x", "4x", "10x")
+
+# nivel de detalle: con más segmentos que esto en la ventana se dibujan cubetas
+# (de 2^k unidades, al menos LOD_BUCKET_PX de ancho) con la ocupación de cada fila
+MAX_RAW_SEGMENTS = 1500
+LOD_BUCKET_PX = 3
+LOD_SHADES = 4
+# ancho mínimo de un bloque para mostrar su etiqueta
+MIN_LABEL_PX = 16
+# separación del tooltip respecto del cursor
+TIP_OFFSET_PX = 14
+
+SYNC_COLORS = {ACCESED: "#70ad47", WAITING: "#c00000"}
+
 
 class GanttCanvas(ctk.CTkFrame):
     """
     Canvas con scroll bidireccional para diagramas de Gantt:
     - scheduling: eje X = tiempo, eje Y = procesos
     - synchronization: eje X = ciclos, eje Y = procesos
+
+    Render virtualizado: solo existen items para los segmentos que se cruzan con
+    la ventana visible. Se buscan por bisección en un WindowIndex y los pares
+    rectángulo/texto se reciclan al hacer scroll, así que el primer dibujo cuesta
+    lo mismo con cualquier tamaño. Los índices (TimelineIndex) se arman una vez
+    por resultado, idealmente fuera del hilo de Tk, y se pasan a draw_*.
+
+    La animación la lleva un Animator (un solo timer por cuadro): se puede
+    pausar, reanudar, cambiar de velocidad y saltar con la barra de progreso.
+
+    El eje X tiene zoom (botones o Ctrl+rueda). Cuando la ventana abarca más de
+    MAX_RAW_SEGMENTS segmentos, cada fila se resume en cubetas de tiempo: el color
+    se aclara según la fracción ocupada y las cubetas vecinas iguales se unen en
+    una sola barra (también durante la animación, hasta la primera fila sin
+    revelar). La ocupación sale de un CoverageIndex calculado una vez, así que
+    cambiar el zoom solo recalcula las cubetas visibles.
+
+    Click y tooltip (al pasar el mouse) resuelven el segmento exacto bajo el
+    cursor con un PidIndex: el bloque da el pid y la x el instante, y una
+    bisección entre los segmentos de ese pid da la fila, también sobre las
+    barras resumidas. on_item_click recibe (pid, índice) en scheduling y
+    (pid, estado, índice) en sincronización; el índice es None si en ese
+    instante no hay segmento (un hueco dentro de una barra resumida).
     """
 
     def __init__(
@@ -21,7 +67,7 @@ class GanttCanvas(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         self.row_height = row_height
         self.on_item_click = on_item_click
-        self._jobs: List[str] = []  
+        self._animator = Animator(self, self._show_upto)
 
 
         fg = self.cget("fg_color")
@@ -30,12 +76,13 @@ class GanttCanvas(ctk.CTkFrame):
             bg_color = fg[1] if mode == "dark" else fg[0]
         else:
             bg_color = fg
+        self._bg = bg_color
 
 
         self.canvas = tk.Canvas(self, width=width, height=height, bg=bg_color)
         self.h_scroll = ctk.CTkScrollbar(self, orientation="horizontal", command=self.canvas.xview)
         self.v_scroll = ctk.CTkScrollbar(self, orientation="vertical",   command=self.canvas.yview)
-        self.canvas.configure(xscrollcommand=self.h_scroll.set, yscrollcommand=self.v_scroll.set)
+        self.canvas.configure(xscrollcommand=self._on_xscroll, yscrollcommand=self._on_yscroll)
 
         self.canvas.grid(row=0, column=0, sticky="nsew")
         self.v_scroll.grid(row=0, column=1, sticky="ns")
@@ -43,161 +90,430 @@ class GanttCanvas(ctk.CTkFrame):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
+        # controles de zoom y de reproducción
+        toolbar = ctk.CTkFrame(self, fg_color="transparent")
+        toolbar.grid(row=2, column=0, sticky="ew")
+        toolbar.grid_columnconfigure(5, weight=1)
+        ctk.CTkButton(toolbar, text="−", width=30, command=lambda: self.zoom(1 / ZOOM_STEP))\
+           .grid(row=0, column=0, padx=2)
+        ctk.CTkButton(toolbar, text="+", width=30, command=lambda: self.zoom(ZOOM_STEP))\
+           .grid(row=0, column=1, padx=2)
+        ctk.CTkButton(toolbar, text="Ajustar", width=60, command=self.fit)\
+           .grid(row=0, column=2, padx=2)
+        self.play_button = ctk.CTkButton(toolbar, text="⏸", width=30, command=self.toggle_play)
+        self.play_button.grid(row=0, column=3, padx=(12,2))
+        self.speed_var = tk.StringVar(value="1x")
+        ctk.CTkOptionMenu(toolbar, variable=self.speed_var, values=list(SPEEDS), width=70,
+                          command=lambda v: self.set_speed(float(v.rstrip("x"))))\
+           .grid(row=0, column=4, padx=2)
+        self.seek_slider = ctk.CTkSlider(toolbar, from_=0, to=1, command=self._on_seek)
+        self.seek_slider.set(1)
+        self.seek_slider.grid(row=0, column=5, padx=(2,10), sticky="ew")
+
 
-        self.color_map: Dict[str, str] = {}
         self.default_colors = [
             "#4f81bd", "#c0504d", "#9bbb59", "#8064a2", "#4bacc6",
             "#f79646", "#92a9cf", "#d1b2d8", "#b8d7a3", "#a4bdd2"
         ]
 
+        # timeline a dibujar
+        self._segments: Optional[Union[Timeline, SyncTimeline]] = None
+        self._labels: Sequence[str] = ()
+        self._index: Optional[TimelineIndex] = None
+        self._row_of: List[int] = []
+        self._pid_of_row: List[int] = []
+        self._max_t = 0
+        self._shown = 0   # segmentos revelados (la animación los va destapando)
+        self._resource_labels: Optional[Sequence[str]] = None
+        self.unit_px = float(UNIT_PX)
+
+        # items reciclables: pares (rect, text); slot de cada item y (pid, state) de cada slot
+        self._pool: List[Tuple[int, int]] = []
+        self._slot_of: Dict[int, int] = {}
+        self._slot_hit: List[Tuple[int, Optional[int]]] = []
+        self._n_visible = 0
+        self._view = (0, 0)   # ventana de tiempo del último render
+        self._render_job: Optional[str] = None
+        self._shade_cache: Dict[Tuple[str, int], str] = {}
+        self._tip: Optional[Tuple[int, int]] = None   # (rect, text) del tooltip
+
+        self.canvas.bind("<Configure>", lambda e: self._schedule_render())
+        self.canvas.bind("<Control-MouseWheel>",
+                         lambda e: self.zoom(ZOOM_STEP if e.delta > 0 else 1 / ZOOM_STEP, e.x))
+        self.canvas.bind("<Control-Button-4>", lambda e: self.zoom(ZOOM_STEP, e.x))
+        self.canvas.bind("<Control-Button-5>", lambda e: self.zoom(1 / ZOOM_STEP, e.x))
+        self.canvas.tag_bind("block", "<Button-1>", self._on_click)
+        self.canvas.tag_bind("block", "<Motion>", self._on_motion)
+        self.canvas.tag_bind("block", "<Leave>", lambda e: self._hide_tip())
+
     def clear(self):
         """Borrar todo y cancelar jobs pendientes."""
-        for job in self._jobs:
-            self.after_cancel(job)
-        self._jobs.clear()
+        self._animator.stop()
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+            self._render_job = None
         self.canvas.delete("all")
+        self._segments = None
+        self._index = None
+        self._tip = None
+        self._pool.clear()
+        self._slot_of.clear()
+        self._slot_hit.clear()
+        self._n_visible = 0
+        self._view = (0, 0)
 
     def pause(self):
-        """Cancelar animaciones en curso."""
-        for job in self._jobs:
-            self.after_cancel(job)
-        self._jobs.clear()
-
-    def _get_color(self, key: str) -> str:
-        if key not in self.color_map:
-            idx = len(self.color_map) % len(self.default_colors)
-            self.color_map[key] = self.default_colors[idx]
-        return self.color_map[key]
-
-
-    def draw_schedule(self, timeline: List[Tuple[str, int, int]]):
-        """Dibuja Gantt de scheduling (inmediato)."""
-        self.clear()
-        pids: List[str] = []
-        for pid, _, _ in timeline:
-            if pid not in pids:
-                pids.append(pid)
-        max_t = max((end for _, _, end in timeline), default=0)
-
-        self.canvas.config(scrollregion=(0, 0, max_t*20 + 100, len(pids)*self.row_height))
-        for pid, start, end in timeline:
-            row = pids.index(pid)
-            y1 = row * self.row_height
-            y2 = y1 + self.row_height * 0.8
-            x1 = start * 20 + 50
-            x2 = end   * 20 + 50
-            color = self._get_color(pid)
-
-            rid = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
-            tid = self.canvas.create_text((x1+x2)/2, y1+self.row_height*0.4, text=pid, fill="white")
-
-            tag = f"proc_{pid}_{start}"
-            self.canvas.addtag_withtag(tag, rid)
-            self.canvas.addtag_withtag(tag, tid)
-            if self.on_item_click:
-                self.canvas.tag_bind(tag, "<Button-1>", lambda e, p=pid: self.on_item_click(p))
-
-    def draw_schedule_delayed(self, timeline: List[Tuple[str, int, int]], delay_ms: int = 500):
-        """Dibuja Gantt de scheduling con delay."""
-        self.clear()
-        pids: List[str] = []
-        for pid, _, _ in timeline:
-            if pid not in pids:
-                pids.append(pid)
-        max_t = max((end for _, _, end in timeline), default=0)
-
-        self.canvas.config(scrollregion=(0, 0, max_t*20 + 100, len(pids)*self.row_height))
-        for i, (pid, start, end) in enumerate(timeline):
-            job = self.after(
-                delay_ms * i,
-                lambda p=pid, st=start, en=end: self._draw_schedule_block(p, st, en, pids)
-            )
-            self._jobs.append(job)
-
-    def _draw_schedule_block(self, pid: str, start: int, end: int, pids: List[str]):
-        """Helper para draw_schedule_delayed."""
-        row = pids.index(pid)
-        y1 = row * self.row_height
-        y2 = y1 + self.row_height * 0.8
-        x1 = start * 20 + 50
-        x2 = end   * 20 + 50
-        color = self._get_color(pid)
+        """Pausar la animación en curso (se retoma con resume)."""
+        self._animator.pause()
+        self.play_button.configure(text="▶")
+
+    def resume(self):
+        """Retomar la animación desde donde se pausó."""
+        if self._segments is None or self._shown >= len(self._segments):
+            return
+        self._animator.resume()
+        self.play_button.configure(text="⏸")
+
+    def toggle_play(self):
+        if self._animator.playing:
+            self.pause()
+        else:
+            self.resume()
 
-        rid = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
-        tid = self.canvas.create_text((x1+x2)/2, y1+self.row_height*0.4, text=pid, fill="white")
+    def set_speed(self, speed: float):
+        """Velocidad de la animación (2 = el doble de rápido que el delay)."""
+        self._animator.set_speed(speed)
 
-        tag = f"proc_delayed_{pid}_{start}"
-        self.canvas.addtag_withtag(tag, rid)
-        self.canvas.addtag_withtag(tag, tid)
-        if self.on_item_click:
-            self.canvas.tag_bind(tag, "<Button-1>", lambda e, p=pid: self.on_item_click(p))
+    def seek(self, n: int):
+        """Mostrar los primeros n segmentos (solo con una animación cargada)."""
+        if self._animator.total:
+            self._animator.seek(n)
 
+    def _on_seek(self, fraction: float):
+        self.seek(round(fraction * self._animator.total))
 
 
-    def draw_sync(self, timeline: List[Tuple[int, str, str, str]]):
-        """Dibuja Gantt de synchronización (inmediato)."""
+    def _load(self, segments: Union[Timeline, SyncTimeline], labels: Sequence[str],
+              index: Optional[TimelineIndex], resources: Optional[Sequence[str]] = None):
         self.clear()
-        pids: List[str] = []
-        for _, pid, _, _ in timeline:
-            if pid not in pids:
-                pids.append(pid)
-        max_c = max((cycle for cycle, _, _, _ in timeline), default=0)
-
-        self.canvas.config(scrollregion=(0, 0, max_c*20 + 100, len(pids)*self.row_height))
-        for cycle, pid, res, state in timeline:
-            row = pids.index(pid)
-            y1 = row * self.row_height
-            y2 = y1 + self.row_height * 0.8
-            x1 = cycle * 20 + 50
-            x2 = x1 + 20
-            color = "#70ad47" if state == "ACCESED" else "#c00000"
-
-            rid = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
-            tid = self.canvas.create_text((x1+x2)/2, y1+self.row_height*0.4, text=pid, fill="white")
-
-            tag = f"sync_{pid}_{cycle}"
-            self.canvas.addtag_withtag(tag, rid)
-            self.canvas.addtag_withtag(tag, tid)
-            if self.on_item_click:
-                self.canvas.tag_bind(
-                    tag, "<Button-1>",
-                    lambda e, p=pid, st=state: self.on_item_click(p, st)
+        if index is None:
+            index = TimelineIndex(segments, len(labels))
+        self._segments = segments
+        self._labels = labels
+        self._index = index
+        self._resource_labels = resources
+        self._row_of = index.row_of
+        self._pid_of_row = index.pid_of_row
+        end = index.window.end
+        self._max_t = max(end - 1, 0) if isinstance(segments, SyncTimeline) else end
+        self._shown = len(segments)
+        self.seek_slider.set(1)
+        self.play_button.configure(text="▶")
+        self._update_scrollregion()
+
+    def _update_scrollregion(self):
+        n_rows = len(self._pid_of_row)
+        self.canvas.config(scrollregion=(0, 0, self._max_t*self.unit_px + 2*X0, n_rows*self.row_height))
+
+    def draw_schedule(self, segments: Timeline, labels: Sequence[str],
+                      index: Optional[TimelineIndex] = None):
+        """
+        Dibuja Gantt de scheduling (inmediato).
+        segments: (pid_id, start, end); labels: nombre de cada pid_id.
+        index: TimelineIndex de segments (ScheduleResult.timeline_index); si
+        falta se arma aquí, recorriendo todo el timeline en el hilo de Tk.
+        """
+        self._load(segments, labels, index)
+        self._render()
+
+    def draw_schedule_delayed(self, segments: Timeline, labels: Sequence[str],
+                              delay_ms: int = 500, index: Optional[TimelineIndex] = None):
+        """Dibuja Gantt de scheduling con delay."""
+        self._load(segments, labels, index)
+        self._animate(delay_ms)
+
+    def draw_sync(self, segments: SyncTimeline, labels: Sequence[str],
+                  index: Optional[TimelineIndex] = None, resources: Optional[Sequence[str]] = None):
+        """
+        Dibuja Gantt de synchronización (inmediato).
+        segments: (cycle, pid_id, resource_id, state_id) con la duración de cada
+        fila; cada retención es una sola barra. labels: nombre de cada pid_id.
+        index: TimelineIndex de segments (SyncResult.timeline_index);
+        resources: nombre de cada resource_id (para el tooltip).
+        """
+        self._load(segments, labels, index, resources)
+        self._render()
+
+    def draw_sync_delayed(self, segments: SyncTimeline, labels: Sequence[str],
+                          delay_ms: int = 500, index: Optional[TimelineIndex] = None,
+                          resources: Optional[Sequence[str]] = None):
+        """Dibuja Gantt de synchronización con delay."""
+        self._load(segments, labels, index, resources)
+        self._animate(delay_ms)
+
+    def _animate(self, delay_ms: int):
+        # el segmento i aparece a los delay_ms * i ms (a velocidad 1x)
+        self._shown = 0
+        self.seek_slider.set(0)
+        self.play_button.configure(text="⏸")
+        self._render()
+        self._animator.start(len(self._segments), delay_ms)
+
+    def _show_upto(self, n: int):
+        # cuadro de la animación: solo se redibuja si cambió algo dentro de la ventana
+        first, last = sorted((self._shown, n))
+        self._shown = n
+        total = len(self._segments)
+        self.seek_slider.set(n / total if total else 1)
+        if n >= total:
+            self.play_button.configure(text="▶")
+        if self._index.window.touches(*self._view, first, last):
+            self._render()
+
+    # --- zoom ---
+
+    def zoom(self, factor: float, x: Optional[float] = None):
+        """
+        Multiplica la escala del eje X por factor, dejando fijo el instante que
+        está en la posición x de la ventana (por defecto, el centro).
+        """
+        if self._segments is None:
+            return
+        c = self.canvas
+        if x is None:
+            x = c.winfo_width() / 2
+        t = (c.canvasx(x) - X0) / self.unit_px
+        self._set_scale(self.unit_px * factor)
+        total = self._max_t*self.unit_px + 2*X0
+        c.xview_moveto(max(0.0, (t*self.unit_px + X0 - x) / total))
+        self._schedule_render()
+
+    def fit(self):
+        """Escala para que todo el timeline quepa en el ancho de la ventana."""
+        if self._segments is None:
+            return
+        self._set_scale((self.canvas.winfo_width() - 2*X0) / max(self._max_t, 1))
+        self.canvas.xview_moveto(0.0)
+        self._schedule_render()
+
+    def _set_scale(self, unit_px: float):
+        # como mínimo, todo el timeline en el ancho de la ventana
+        fit = (self.canvas.winfo_width() - 2*X0) / max(self._max_t, 1)
+        self.unit_px = max(min(unit_px, MAX_UNIT_PX), min(fit, UNIT_PX), 1e-6)
+        self._update_scrollregion()
+
+    # --- render virtualizado ---
+
+    def _on_xscroll(self, first, last):
+        self.h_scroll.set(first, last)
+        self._schedule_render()
+
+    def _on_yscroll(self, first, last):
+        self.v_scroll.set(first, last)
+        self._schedule_render()
+
+    def _schedule_render(self):
+        # varios eventos de scroll seguidos se atienden con un solo render
+        if self._render_job is None:
+            self._render_job = self.after_idle(self._render)
+
+    def _viewport(self) -> Tuple[int, int, int, int]:
+        """Ventana visible: (t0, t1) en unidades de tiempo y filas [r0, r1]."""
+        c = self.canvas
+        x0, x1 = c.canvasx(0), c.canvasx(c.winfo_width())
+        y0, y1 = c.canvasy(0), c.canvasy(c.winfo_height())
+        return (int((x0 - X0) // self.unit_px), int((x1 - X0) // self.unit_px) + 1,
+                int(y0 // self.row_height), int(y1 // self.row_height))
+
+    def _render(self):
+        self._render_job = None
+        segs = self._segments
+        if segs is None:
+            return
+        t0, t1, r0, r1 = self._viewport()
+        self._view = (t0, t1)
+        window = self._index.window
+        upto = self._shown if self._shown < len(segs) else None
+        if window.count(t0, t1, upto) > MAX_RAW_SEGMENTS:
+            if upto is not None:
+                # animación: el resumen llega hasta la primera fila sin revelar
+                t1 = min(t1, window.start_of(upto))
+            used = self._render_lod(t0, t1, r0, r1)
+        else:
+            used = self._render_raw(window.rows(t0, t1, upto), r0, r1)
+        for rid, tid in self._pool[used:self._n_visible]:
+            self.canvas.itemconfigure(rid, state="hidden")
+            self.canvas.itemconfigure(tid, state="hidden")
+        self._n_visible = used
+
+    def _render_raw(self, rows: Iterable[int], r0: int, r1: int) -> int:
+        segs, row_of, labels = self._segments, self._row_of, self._labels
+        scale = self.unit_px
+        sync = isinstance(segs, SyncTimeline)
+        used = 0
+        for i in rows:
+            pid = segs.pid[i]
+            row = row_of[pid]
+            if row < r0 or row > r1:
+                continue
+            if sync:
+                state = segs.state[i]
+                x1 = segs.cycle[i] * scale + X0
+                x2 = x1 + scale * segs.duration[i]
+                color = SYNC_COLORS[state]
+            else:
+                state = None
+                x1 = segs.start[i] * scale + X0
+                x2 = segs.end[i] * scale + X0
+                color = self.default_colors[row % len(self.default_colors)]
+            self._place(used, (pid, state), x1, row, x2, color, labels[pid])
+            used += 1
+        return used
+
+    def _render_lod(self, t0: int, t1: int, r0: int, r1: int) -> int:
+        cov = self._index.coverage
+        scale = self.unit_px
+        # ancho de cubeta: potencia de 2 (rejilla fija al hacer scroll)
+        width = 1
+        while width * scale < LOD_BUCKET_PX:
+            width *= 2
+        sync = isinstance(self._segments, SyncTimeline)
+        used = 0
+        for row in range(max(r0, 0), min(r1, len(self._pid_of_row) - 1) + 1):
+            pid = self._pid_of_row[row]
+            layers = ([((pid, ACCESED), ACCESED), ((pid, WAITING), WAITING)] if sync
+                      else [(pid, None)])
+            for key, state in layers:
+                color = (SYNC_COLORS[state] if sync
+                         else self.default_colors[row % len(self.default_colors)])
+                # barras: tramos de cubetas contiguas con el mismo tono
+                run_start = run_end = run_shade = None
+                t = cov.next_busy(key, max(t0, 0) // width * width)
+                while t is not None and t < t1:
+                    b0 = t // width * width
+                    busy = cov.busy(key, b0, b0 + width)
+                    shade = -(-busy * LOD_SHADES // width)  # 1..LOD_SHADES
+                    if run_shade == shade and run_end == b0:
+                        run_end = b0 + width
+                    else:
+                        if run_shade is not None:
+                            self._place_run(used, pid, state, run_start, run_end, row, color, run_shade)
+                            used += 1
+                        run_start, run_end, run_shade = b0, b0 + width, shade
+                    t = cov.next_busy(key, b0 + width)
+                if run_shade is not None:
+                    self._place_run(used, pid, state, run_start, run_end, row, color, run_shade)
+                    used += 1
+        return used
+
+    def _place_run(self, slot: int, pid: int, state: Optional[int], start: int, end: int,
+                   row: int, color: str, shade: int):
+        fill = self._shade(color, shade)
+        self._place(slot, (pid, state), start*self.unit_px + X0, row, end*self.unit_px + X0,
+                    fill, self._labels[pid])
+
+    def _shade(self, color: str, shade: int) -> str:
+        """color mezclado con el fondo según shade (LOD_SHADES = color pleno)."""
+        key = (color, shade)
+        if key not in self._shade_cache:
+            if shade >= LOD_SHADES:
+                self._shade_cache[key] = color
+            else:
+                bg = self._bg if isinstance(self._bg, str) and self._bg.startswith('#') else "#ffffff"
+                a = shade / LOD_SHADES
+                fg_rgb = [int(color[k:k+2], 16) for k in (1, 3, 5)]
+                bg_rgb = [int(bg[k:k+2], 16) for k in (1, 3, 5)]
+                self._shade_cache[key] = "#" + "".join(
+                    f"{round(f*a + b*(1 - a)):02x}" for f, b in zip(fg_rgb, bg_rgb)
                 )
+        return self._shade_cache[key]
 
-    def draw_sync_delayed(self, timeline: List[Tuple[int, str, str, str]], delay_ms: int = 500):
-        """Dibuja Gantt de synchronización con delay."""
-        self.clear()
-        pids: List[str] = []
-        for _, pid, _, _ in timeline:
-            if pid not in pids:
-                pids.append(pid)
-        max_c = max((cycle for cycle, _, _, _ in timeline), default=0)
-
-        self.canvas.config(scrollregion=(0, 0, max_c*20 + 100, len(pids)*self.row_height))
-        for i, (cycle, pid, res, state) in enumerate(timeline):
-            job = self.after(
-                delay_ms * i,
-                lambda c=cycle, p=pid, st=state: self._draw_sync_block(c, p, res, st, pids)
-            )
-            self._jobs.append(job)
-
-    def _draw_sync_block(self, cycle: int, pid: str, res: str, state: str, pids: List[str]):
-        """Helper para draw_sync_delayed."""
-        row = pids.index(pid)
+    def _place(self, slot: int, hit: Tuple[int, Optional[int]], x1: float, row: int, x2: float,
+               color: str, name: str):
+        """Ubica un bloque de la fila row en el par de items 'slot', creándolo si falta."""
+        c = self.canvas
         y1 = row * self.row_height
         y2 = y1 + self.row_height * 0.8
-        x1 = cycle * 20 + 50
-        x2 = x1 + 20
-        color = "#70ad47" if state == "ACCESED" else "#c00000"
-
-        rid = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
-        tid = self.canvas.create_text((x1+x2)/2, y1+self.row_height*0.4, text=pid, fill="white")
-
-        tag = f"sync_delayed_{pid}_{cycle}"
-        self.canvas.addtag_withtag(tag, rid)
-        self.canvas.addtag_withtag(tag, tid)
-        if self.on_item_click:
-            self.canvas.tag_bind(
-                tag, "<Button-1>",
-                lambda e, p=pid, st=state: self.on_item_click(p, st)
-            )
+        xt, yt = (x1+x2)/2, y1+self.row_height*0.4
+        text_state = "normal" if x2 - x1 >= MIN_LABEL_PX else "hidden"
+        if slot < len(self._pool):
+            rid, tid = self._pool[slot]
+            c.coords(rid, x1, y1, x2, y2)
+            c.itemconfigure(rid, fill=color, state="normal")
+            c.coords(tid, xt, yt)
+            c.itemconfigure(tid, text=name, state=text_state)
+            self._slot_hit[slot] = hit
+            return
+        rid = c.create_rectangle(x1, y1, x2, y2, fill=color, outline="black", tags=("block",))
+        tid = c.create_text(xt, yt, text=name, fill="white", state=text_state, tags=("block",))
+        self._pool.append((rid, tid))
+        self._slot_of[rid] = self._slot_of[tid] = slot
+        self._slot_hit.append(hit)
+
+    # --- click y tooltip ---
+
+    def _segment_at(self, event) -> Optional[Tuple[int, Optional[int], Optional[int]]]:
+        """(pid_id, state, índice del segmento) bajo el cursor; None fuera de un bloque."""
+        if self._segments is None:
+            return None
+        current = self.canvas.find_withtag("current")
+        slot = self._slot_of.get(current[0]) if current else None
+        if slot is None or slot >= self._n_visible:
+            return None
+        pid, state = self._slot_hit[slot]
+        x = self.canvas.canvasx(event.x) - X0
+        t = int(x // self.unit_px)
+        until = int((x + 1) // self.unit_px) + 1   # unidades que caen en el mismo pixel
+        return pid, state, self._index.pids.find(pid, t, state, upto=self._shown, until=until)
+
+    def _on_click(self, event):
+        if not self.on_item_click:
+            return
+        hit = self._segment_at(event)
+        if hit is None:
+            return
+        pid, state, i = hit
+        if state is None:
+            self.on_item_click(self._labels[pid], i)
+        else:
+            self.on_item_click(self._labels[pid], STATES[state], i)
+
+    def _on_motion(self, event):
+        hit = self._segment_at(event)
+        if hit is None:
+            self._hide_tip()
+            return
+        c = self.canvas
+        x, y = c.canvasx(event.x) + TIP_OFFSET_PX, c.canvasy(event.y) + TIP_OFFSET_PX
+        if self._tip is None:
+            tid = c.create_text(x, y, anchor="nw", tags=("tooltip",))
+            rid = c.create_rectangle(x, y, x, y, fill="#ffffe0", outline="black", tags=("tooltip",))
+            c.tag_lower(rid, tid)
+            self._tip = (rid, tid)
+        rid, tid = self._tip
+        c.coords(tid, x, y)
+        c.itemconfigure(tid, text=self._describe(*hit), state="normal")
+        x1, y1, x2, y2 = c.bbox(tid)
+        c.coords(rid, x1 - 3, y1 - 2, x2 + 3, y2 + 2)
+        c.itemconfigure(rid, state="normal")
+        c.tag_raise(rid)
+        c.tag_raise(tid)
+
+    def _hide_tip(self):
+        if self._tip is not None:
+            for item in self._tip:
+                self.canvas.itemconfigure(item, state="hidden")
+
+    def _describe(self, pid: int, state: Optional[int], i: Optional[int]) -> str:
+        """Texto del tooltip para el segmento i (o solo el pid si no hay segmento)."""
+        name = self._labels[pid]
+        segs = self._segments
+        if i is None:
+            return name if state is None else f"{name}  {STATES[state]}"
+        if state is None:
+            return f"{name}  t={segs.start[i]}–{segs.end[i]}"
+        res = segs.resource[i]
+        res_name = self._resource_labels[res] if self._resource_labels is not None else res
+        cycle, dur = segs.cycle[i], segs.duration[i]
+        cycles = f"ciclo {cycle}" if dur == 1 else f"ciclos {cycle}–{cycle + dur - 1}"
+        return f"{name}  {res_name}  {STATES[state]}  {cycles}"
@@ -1,6 +1,6 @@
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
@@ -11,9 +11,10 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from gui.styles import apply_theme
 from gui.controls_panel import ControlsPanel
 from gui.gantt_canvas import GanttCanvas
-from data_io.process_loader import load_processes
-from data_io.sync_loader import load_resources, load_actions
-from core.scheduler import run_scheduling
+from gui.worker import SimulationWorker
+from data_io.process_loader import load_processes, prepare_workload
+from data_io.sync_loader import load_resources, load_actions, prepare_trace
+from core.comparison import compare
 from core.sync_engine import run_synchronization
 from utils.metrics import (
     compute_avg_waiting_time,
@@ -48,6 +49,7 @@ class MainWindow(ctk.CTk):
                 'run':                self.on_run,
                 'run_sync':           self.on_run_sync,
                 'pause':              self.on_pause,
+                'resume':             self.on_resume,
                 'clear':              self.on_clear
             }
         )
@@ -60,10 +62,27 @@ class MainWindow(ctk.CTk):
 
         self.gantt_canvases: List[GanttCanvas] = []
 
+        # estado de la simulación en curso (corre en un hilo, ver gui.worker)
+        self.status_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.status_frame.grid(row=1, column=1, sticky="ew", padx=10, pady=(0,10))
+        self.status_frame.grid_columnconfigure(1, weight=1)
+        self.status_label = ctk.CTkLabel(self.status_frame, text="")
+        self.status_label.grid(row=0, column=0, padx=(0,10), sticky="w")
+        self.progress_bar = ctk.CTkProgressBar(self.status_frame)
+        self.progress_bar.grid(row=0, column=1, sticky="ew")
+        self.progress_bar.set(0)
+        self.cancel_button = ctk.CTkButton(self.status_frame, text="Cancelar", width=80,
+                                           command=self.on_cancel, state="disabled")
+        self.cancel_button.grid(row=0, column=2, padx=(10,0))
+        self.worker: Optional[SimulationWorker] = None
+
 
         self.processes = []
+        self.workload = prepare_workload([])
         self.resources = []
         self.actions = []
+        # traza internada de la última corrida de sync (se descarta al cargar archivos)
+        self.trace = None
 
     def on_load(self):
         """Carga archivo de procesos."""
@@ -75,6 +94,9 @@ class MainWindow(ctk.CTk):
             return
         try:
             self.processes = load_processes(path)
+            # ordenado y en columnas una sola vez para todos los algoritmos
+            self.workload = prepare_workload(self.processes)
+            self.trace = None
             self.processes_path = path
             messagebox.showinfo("Carga exitosa", f"{len(self.processes)} procesos cargados.")
         except Exception as e:
@@ -102,6 +124,7 @@ class MainWindow(ctk.CTk):
             return
         try:
             self.resources = load_resources(path)
+            self.trace = None
             self.resources_path = path
             messagebox.showinfo("Carga exitosa", f"{len(self.resources)} recursos cargados.")
         except Exception as e:
@@ -129,6 +152,7 @@ class MainWindow(ctk.CTk):
             return
         try:
             self.actions = load_actions(path)
+            self.trace = None
             self.actions_path = path
             messagebox.showinfo("Carga exitosa", f"{len(self.actions)} acciones cargadas.")
         except Exception as e:
@@ -147,27 +171,44 @@ class MainWindow(ctk.CTk):
             messagebox.showerror("Error al mostrar archivo", str(e))
 
     def on_run(self, algorithms=None, quantum=None, delay=0):
-        """Ejecuta calendarización, muestra métricas y dibuja Gantt."""
+        """Ejecuta calendarización en segundo plano; al terminar muestra métricas y Gantt."""
         self.clear_canvases()
         algos = algorithms or [a for a,v in self.controls.algo_vars.items() if v.get()]
         if not algos:
             messagebox.showwarning("Atención", "Selecciona al menos un algoritmo.")
             return
 
-        arrival_map = {p.pid: p.arrival_time for p in self.processes}
+        workload = self.workload
+        # los algoritmos se corren a la vez (ver core.comparison); la animación
+        # muestra RR quantum por quantum, y esa misma corrida da sus métricas
+        # (per_quantum no cambia esperas ni finalizaciones)
+        configs = [(algo, {'quantum': quantum, 'per_quantum': delay > 0} if algo == 'rr' else {})
+                   for algo in algos]
+
+        def job(progress):
+            results = compare(workload, configs, progress=progress)
+            for res in results:
+                res.timeline_index  # se indexa aquí, fuera del hilo de Tk
+            return results
+
+        self.start_simulation("Calendarizando...", job,
+                              lambda results: self.show_schedule(algos, workload, results, delay))
+
+    def show_schedule(self, algos, workload, results, delay=0):
+        """Métricas y Gantt de cada algoritmo (en el hilo de Tk)."""
+        # métricas sobre ids de pid (ver PreparedWorkload.symbols)
+        arrival_map = dict(zip(workload.pid_ids, workload.arrival))
         mb = self.controls.metrics_box
         mb.configure(state="normal"); mb.delete("0.0","end")
         mb.insert("0.0", "Métricas por algoritmo:\n")
-        for algo in algos:
-            res = run_scheduling(self.processes, algo, quantum=quantum)
-            awt = compute_avg_waiting_time(res.waiting_times)
-            tw  = compute_total_waits(res.waiting_times)
-            ta  = compute_avg_turnaround_time(res.completion_times, arrival_map)
+        for algo, res in zip(algos, results):
+            awt = compute_avg_waiting_time(res.waits)
+            tw  = compute_total_waits(res.waits)
+            ta  = compute_avg_turnaround_time(res.completions, arrival_map)
             mb.insert("end", f" • {algo.upper():<8} AWT={awt:.2f}  TA={ta:.2f}  waits={tw}\n")
         mb.configure(state="disabled")
 
-        for idx, algo in enumerate(algos):
-            res = run_scheduling(self.processes, algo, quantum=quantum)
+        for idx, (algo, res) in enumerate(zip(algos, results)):
             frame = ctk.CTkFrame(self.results_frame)
             frame.grid(row=idx, column=0, sticky="ew", pady=10)
             frame.grid_columnconfigure(1, weight=1)
@@ -175,17 +216,19 @@ class MainWindow(ctk.CTk):
                .grid(row=0,column=0, padx=(0,10), sticky="w")
             gantt = GanttCanvas(
                 master=frame, height=150,
-                on_item_click=lambda pid, r=res: self.show_process_info(pid, r)
+                on_item_click=lambda pid, i, r=res: self.show_process_info(pid, r, workload, i)
             )
             gantt.grid(row=1, column=0, columnspan=2, sticky="ew")
             self.gantt_canvases.append(gantt)
             if delay>0:
-                gantt.draw_schedule_delayed(res.timeline, delay_ms=delay)
+                gantt.draw_schedule_delayed(res.segments, res.symbols.names, delay_ms=delay,
+                                            index=res.timeline_index)
             else:
-                gantt.draw_schedule(res.timeline)
+                gantt.draw_schedule(res.segments, res.symbols.names, index=res.timeline_index)
 
-    def on_run_sync(self, mode=None, delay=0):
-        """Ejecuta sincronización, muestra métricas y dibuja Gantt de sincronización."""
+    def on_run_sync(self, mode=None, delay=0, blocking=False, rw_policy='readers',
+                    hold_and_wait=False):
+        """Ejecuta sincronización en segundo plano; al terminar muestra métricas y Gantt."""
         # 1) Limpia gráficos anteriores
         self.clear_canvases()
 
@@ -193,80 +236,121 @@ class MainWindow(ctk.CTk):
         if not (self.processes and self.resources and self.actions):
             messagebox.showwarning("Atención", "Carga procesos, recursos y acciones primero.")
             return
+        if mode == 'rwlock' and (blocking or hold_and_wait):
+            messagebox.showwarning("Atención", "El modo rwlock no admite simulación bloqueante.")
+            return
 
-        # 3) Corre la simulación
-        sync_res = run_synchronization(self.processes, self.resources, self.actions, mode=mode)
-
+        # 3) Corre la simulación en segundo plano
+        processes, resources, actions = self.processes, self.resources, self.actions
+        trace = self.trace
+
+        def job(progress):
+            # la traza se interna una vez y se reusa: con ella un hit de la cache es inmediato
+            prepared = trace or prepare_trace(actions, (p.pid for p in processes),
+                                              (r.name for r in resources))
+            res = run_synchronization(processes, resources, prepared,
+                                      mode=mode, blocking=blocking, rw_policy=rw_policy,
+                                      hold_and_wait=hold_and_wait, progress=progress)
+            res.timeline_index  # se indexa aquí, fuera del hilo de Tk
+            return prepared, res
+
+        def done(result):
+            prepared, sync_res = result
+            # solo si no se cargó otro archivo mientras corría
+            if self.processes is processes and self.resources is resources and self.actions is actions:
+                self.trace = prepared
+            self.show_sync(sync_res, mode, delay, blocking, rw_policy)
+
+        self.start_simulation("Sincronizando...", job, done)
+
+    def show_sync(self, sync_res, mode, delay=0, blocking=False, rw_policy='readers'):
+        """Métricas y Gantt de sincronización (en el hilo de Tk)."""
         # 4) Métricas generales: accesses vs waits
         mb = self.controls.sync_metrics_box
-        total_accesses = len(sync_res.timeline)
+        total_accesses = len(sync_res.segments)
         total_waits    = compute_total_waits(sync_res.waiting_counts)
 
         mb.configure(state="normal")
         mb.delete("0.0", "end")
         mb.insert("0.0", f"Total accesses: {total_accesses}\n")
         mb.insert("end",  f"Total waits:    {total_waits}\n")
+        if blocking:
+            # ciclos en cola y cola más larga por recurso
+            mb.insert("end", f"Wait cycles:    {compute_total_waits(sync_res.wait_durations)}\n")
+            mb.insert("end", f"Max queue:      {max(sync_res.max_queue_lengths.values(), default=0)}\n")
+            if sync_res.pending:
+                mb.insert("end", f"Sin conceder:   {len(sync_res.pending)}\n")
+            for dl in sync_res.deadlocks:
+                mb.insert("end", f"Deadlock c{dl.cycle}: {', '.join(dl.pids)} / {', '.join(dl.resources)}\n")
         mb.configure(state="disabled")
 
         # 5) Crea el contenedor para el único Gantt de sincronización
         frame = ctk.CTkFrame(self.results_frame)
         frame.grid(row=0, column=0, sticky="ew", pady=10)
         frame.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(frame, text=mode.upper(), font=(None,16,"bold")) \
+        title = mode.upper() + (f" ({rw_policy})" if mode == 'rwlock' else "") \
+            + (" (BLOQUEANTE)" if blocking else "")
+        ctk.CTkLabel(frame, text=title, font=(None,16,"bold")) \
            .grid(row=0, column=0, padx=(0,10), sticky="w")
 
         # 6) Instancia el canvas con su handler de click
         gantt = GanttCanvas(
             master=frame,
             height=150,
-            on_item_click=lambda pid, state: self.show_sync_info(pid, state, sync_res)
+            on_item_click=lambda pid, state, i: self.show_sync_info(pid, state, sync_res, i)
         )
         gantt.grid(row=1, column=0, columnspan=2, sticky="nsew")
         self.gantt_canvases.append(gantt)
 
         # 7) Dibuja animado o inmediato según delay
         if delay and delay > 0:
-            gantt.draw_sync_delayed(sync_res.timeline, delay_ms=delay)
+            gantt.draw_sync_delayed(sync_res.segments, sync_res.pids.names, delay_ms=delay,
+                                    index=sync_res.timeline_index,
+                                    resources=sync_res.resources.names)
         else:
-            gantt.draw_sync(sync_res.timeline)
+            gantt.draw_sync(sync_res.segments, sync_res.pids.names,
+                            index=sync_res.timeline_index, resources=sync_res.resources.names)
 
 
 
 
-    def show_process_info(self, pid, res):
-        proc = next((p for p in self.processes if p.pid==pid), None)
+    def show_process_info(self, pid, res, workload=None, i=None):
+        """Datos del proceso y, si se indica, del segmento i (el clickeado)."""
+        proc = (workload if workload is not None else self.workload).process(pid)
         at, bt = (proc.arrival_time, proc.burst_time) if proc else (None,None)
         wt = res.waiting_times.get(pid,0)
         ct = res.completion_times.get(pid)
         ta = (ct-at) if (ct and at is not None) else None
         info = [f"PID: {pid}", f"Arrival: {at}", f"Burst: {bt}",
                 f"Waiting: {wt}", f"TA: {ta}", f"Complete: {ct}"]
+        if i is not None:
+            info.append(f"Segmento: {res.segments.start[i]}–{res.segments.end[i]}")
         ib = self.controls.info_box
         ib.configure(state="normal"); ib.delete("0.0","end")
         ib.insert("0.0","\n".join(info)); ib.configure(state="disabled")
 
-    def show_sync_info(self, pid, state, res):
+    def show_sync_info(self, pid, state, res, i=None):
         """
         Al darle click a un bloque de sync, muestra:
           - PID
           - Estado (ACCESED/WAITING)
-          - Ciclo start y end (end = start + 1)
+          - Recurso, ciclo start y end (end = start + duración) de la fila
+            clickeada (i, resuelta por el Gantt con res.pid_index)
           - Número de waits de ese PID
         """
-        # Localiza la primera tupla de este pid
-        entry = next((t for t in res.timeline if t[1] == pid), None)
-        if entry:
-            cycle = entry[0]
-            start = cycle
-            end   = cycle + 1
+        if i is not None:
+            start = res.segments.cycle[i]
+            end   = start + res.durations[i]
+            resource = res.resources.names[res.segments.resource[i]]
         else:
-            start = end = None
+            start = end = resource = None
 
         waits = res.waiting_counts.get(pid, 0)
 
         info = [
             f"PID:     {pid}",
             f"Estado:  {state}",
+            f"Recurso: {resource}",
             f"Start:   {start}",
             f"End:     {end}",
             f"Waits:   {waits}"
@@ -277,18 +361,59 @@ class MainWindow(ctk.CTk):
         ib.insert("0.0", "\n".join(info))
         ib.configure(state="disabled")
 
+    def start_simulation(self, label, job, on_done):
+        """
+        Corre job(progress) en un hilo (ver gui.worker.SimulationWorker) y llama a
+        on_done(resultado) en el hilo de Tk. Cancela la simulación anterior si sigue.
+        """
+        self.cancel_simulation()
+        self.status_label.configure(text=label)
+        self.progress_bar.set(0)
+        self.cancel_button.configure(state="normal")
+
+        def done(result):
+            self._end_simulation("")
+            on_done(result)
+
+        def failed(e):
+            self._end_simulation("Error")
+            messagebox.showerror("Error en la simulación", str(e))
+
+        self.worker = SimulationWorker(self, job, on_done=done, on_error=failed,
+                                       on_progress=self.progress_bar.set).start()
+
+    def cancel_simulation(self):
+        if self.worker is not None and self.worker.running:
+            self.worker.cancel()
+            self._end_simulation("Cancelada")
+        self.worker = None
+
+    def _end_simulation(self, text):
+        self.status_label.configure(text=text)
+        self.cancel_button.configure(state="disabled")
+
+    def on_cancel(self):
+        """Detiene la simulación en curso (al próximo reporte de avance del motor)."""
+        self.cancel_simulation()
+
     def on_pause(self):
         """Pausa todas las animaciones de Gantt."""
         for canvas in self.gantt_canvases:
             canvas.pause()
         messagebox.showinfo("Pausa", "Simulación pausada.")
 
+    def on_resume(self):
+        """Reanuda las animaciones de Gantt pausadas."""
+        for canvas in self.gantt_canvases:
+            canvas.resume()
+
     def clear_canvases(self):
         for c in self.gantt_canvases:
             c.clear(); c.master.destroy()
         self.gantt_canvases.clear()
 
     def on_clear(self):
+        self.cancel_simulation()
         self.clear_canvases()
 
 
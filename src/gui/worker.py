@@ -0,0 +1,90 @@
+import threading
+from typing import Any, Callable, Optional
+
+from utils.progress import SimulationCancelled
+
+# cada cuánto el hilo de Tk revisa el estado del trabajo
+POLL_MS = 50
+
+
+class SimulationWorker:
+    """
+    Corre job(progress) en un hilo aparte para no congelar la ventana.
+
+    El hilo solo escribe el avance y el resultado; el hilo de Tk los lee con
+    after() y llama ahí a on_progress(fracción), on_done(resultado) u
+    on_error(excepción), así que los callbacks pueden tocar widgets.
+    cancel() es cooperativo: el próximo progress() del motor lanza
+    SimulationCancelled, la simulación se corta y no se llama a ningún callback.
+    Los motores en Python reportan cada PROGRESS_EVERY pasos, los vectorizados
+    entre pasadas de NumPy y los pools por trozo terminado (sin esperar al resto,
+    ver utils.pool.process_pool).
+    """
+    def __init__(self, widget, job: Callable[[Callable[[float], None]], Any],
+                 on_done: Callable[[Any], None],
+                 on_error: Optional[Callable[[BaseException], None]] = None,
+                 on_progress: Optional[Callable[[float], None]] = None,
+                 poll_ms: int = POLL_MS):
+        self.widget = widget
+        self.job = job
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.poll_ms = poll_ms
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._fraction = 0.0
+        self._result: Any = None
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._job_id: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive() or self._job_id is not None
+
+    def start(self) -> 'SimulationWorker':
+        self._thread.start()
+        self._job_id = self.widget.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        """Pide al motor que se detenga; el hilo termina en su próximo reporte de avance."""
+        self._cancel.set()
+        if self._job_id is not None:
+            self.widget.after_cancel(self._job_id)
+            self._job_id = None
+
+    def _progress(self, fraction: float):
+        # corre en el hilo del motor
+        if self._cancel.is_set():
+            raise SimulationCancelled()
+        self._fraction = fraction
+
+    def _run(self):
+        try:
+            self._result = self.job(self._progress)
+        except SimulationCancelled:
+            pass
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._finished.set()
+
+    def _poll(self):
+        self._job_id = None
+        if self._cancel.is_set():
+            return
+        if not self._finished.is_set():
+            if self.on_progress is not None:
+                self.on_progress(self._fraction)
+            self._job_id = self.widget.after(self.poll_ms, self._poll)
+            return
+        if self._error is not None:
+            if self.on_error is None:
+                raise self._error
+            self.on_error(self._error)
+        else:
+            if self.on_progress is not None:
+                self.on_progress(1.0)
+            self.on_done(self._result)
@@ -1,38 +1,176 @@
-from typing import List
-from data_io.process_loader import Process
+from typing import Dict, List, NamedTuple, Tuple, Union
+from data_io.process_loader import Process, PreparedWorkload, as_workload
+from data_io.symbols import SymbolTable
+from utils.timeline import Timeline, NamedRows, PidIndex, TimelineIndex
+from utils.progress import PROGRESS_EVERY
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se usa el recorrido en Python
+    np = None
+
+# a partir de este tamaño conviene el camino vectorizado
+VECTORIZE_MIN = 1024
+
 
 class ScheduleResult:
     """
-    Resultado de un scheduling:
-      - timeline: lista de tuplas (pid, start_cycle, end_cycle)
-      - waiting_times: dict {pid: waiting_time}
+    Resultado de un scheduling, con cada pid como su id en symbols:
+      - segments: Timeline con las tuplas (pid_id, start_cycle, end_cycle)
+      - waits: dict {pid_id: waiting_time}
+      - symbols: SymbolTable de los pids
+    timeline (vista de segments con los nombres de los pids, sin copiarlos) y
+    waiting_times son lo mismo con nombres (solo para mostrar o exportar).
+    pid_index (PidIndex) ubica el segmento de un pid en un instante;
+    timeline_index (TimelineIndex) reúne lo que precalcula el Gantt.
+    """
+    def __init__(self, segments: Timeline, waits: Dict[int, int], symbols: SymbolTable):
+        self.segments = segments
+        self.waits = waits
+        self.symbols = symbols
+        self._waiting_times = None
+        self._pid_index = None
+        self._timeline_index = None
+
+    @property
+    def timeline(self) -> NamedRows:
+        return self.segments.named(self.symbols.names)
+
+    @property
+    def waiting_times(self) -> Dict[str, int]:
+        if self._waiting_times is None:
+            names = self.symbols.names
+            self._waiting_times = {names[p]: w for p, w in self.waits.items()}
+        return self._waiting_times
+
+    @property
+    def pid_index(self) -> PidIndex:
+        """Segmentos de cada pid_id (se indexa una sola vez, al primer uso)."""
+        if self._pid_index is None:
+            self._pid_index = PidIndex(self.segments)
+        return self._pid_index
+
+    @property
+    def timeline_index(self) -> TimelineIndex:
+        """Índices para dibujar segments (se arman una sola vez, al primer uso)."""
+        if self._timeline_index is None:
+            self._timeline_index = TimelineIndex(self.segments, len(self.symbols.names),
+                                                 self.pid_index)
+        return self._timeline_index
+
+
+class BusyPeriod(NamedTuple):
+    """
+    Intervalo en que la CPU no queda ociosa. Depende solo de llegadas y bursts,
+    así que es el mismo para cualquier algoritmo que no deje la CPU ociosa con
+    procesos listos (los cinco de scheduling/).
     """
-    def __init__(self, timeline, waiting_times):
-        self.timeline = timeline
-        self.waiting_times = waiting_times
+    first: int   # índice (en la carga) del primer proceso del periodo
+    stop: int    # índice siguiente al último proceso del periodo
+    start: int   # tiempo de inicio
+    end: int     # tiempo de fin
 
 
-def schedule(processes: List[Process], **kwargs) -> ScheduleResult:
+def schedule(processes: Union[PreparedWorkload, List[Process]], **kwargs) -> ScheduleResult:
     """
     First-In-First-Out scheduling. Ejecuta los procesos en orden de llegada.
     """
-    # Ordenar por arrival_time
-    procs = sorted(processes, key=lambda p: p.arrival_time)
-    timeline = []         # [(pid, start, end), ...]
-    waiting_times = {}    # {pid: waiting_time}
+    # Carga ya ordenada por arrival_time
+    wl = as_workload(processes)
+    progress = kwargs.get('progress')  # ver utils.progress
+    if np is not None and len(wl) >= VECTORIZE_MIN:
+        # vectorizado: el avance (y la cancelación) va entre pasadas
+        starts, ends = _fifo_pass_np(wl)
+        waits = starts - np.frombuffer(wl.arrival, dtype=np.int64)
+        if progress is not None:
+            progress(0.2)
+        timeline = Timeline.from_columns(wl.pid_ids, starts.tolist(), ends.tolist())
+        if progress is not None:
+            progress(0.6)
+        return ScheduleResult(timeline, dict(zip(wl.pid_ids, waits.tolist())), wl.symbols)
+
+    ids, burst, arrival = wl.pid_ids, wl.burst, wl.arrival
+    n = len(wl)
+    timeline = Timeline()  # segmentos (pid_id, start, end)
+    waiting_times = {}    # {pid_id: waiting_time}
     current_time = 0
 
-    for p in procs:
+    for idx in range(n):
+        if progress is not None and idx and not idx % PROGRESS_EVERY:
+            progress(idx / n)
         # Si la CPU está ocupada hasta la llegada del proceso
-        if current_time < p.arrival_time:
-            current_time = p.arrival_time
+        if current_time < arrival[idx]:
+            current_time = arrival[idx]
         start = current_time
-        end = start + p.burst_time
+        end = start + burst[idx]
         # Registrar en timeline
-        timeline.append((p.pid, start, end))
+        timeline.append(ids[idx], start, end)
         # Tiempo de espera: desde arrival hasta inicio
-        waiting_times[p.pid] = start - p.arrival_time
+        waiting_times[ids[idx]] = start - arrival[idx]
         # Avanzar el reloj
         current_time = end
 
-    return ScheduleResult(timeline, waiting_times)
+    return ScheduleResult(timeline, waiting_times, wl.symbols)
+
+
+def _fifo_pass_np(wl: PreparedWorkload):
+    """
+    start_i = max(end_{i-1}, arrival_i) resuelto en una pasada:
+    con S_i = suma de bursts anteriores a i, start_i = S_i + max(0, max_{j<=i}(arrival_j - S_j)).
+    """
+    burst = np.frombuffer(wl.burst, dtype=np.int64)
+    arrival = np.frombuffer(wl.arrival, dtype=np.int64)
+    before = np.cumsum(burst) - burst
+    slack = np.maximum.accumulate(arrival - before)
+    np.maximum(slack, 0, out=slack)
+    starts = before + slack
+    return starts, starts + burst
+
+
+def busy_periods(processes: Union[PreparedWorkload, List[Process]]) -> List[BusyPeriod]:
+    """
+    Periodos de ocupación de la CPU. Un periodo nuevo empieza cuando un proceso
+    llega estrictamente después de que terminó todo el trabajo anterior.
+    """
+    wl = as_workload(processes)
+    n = len(wl)
+    if n == 0:
+        return []
+    if np is not None and n >= VECTORIZE_MIN:
+        starts, ends = _fifo_pass_np(wl)
+        arrival = np.frombuffer(wl.arrival, dtype=np.int64)
+        firsts = np.flatnonzero(arrival[1:] > ends[:-1]) + 1
+        firsts = np.concatenate(([0], firsts))
+        stops = np.append(firsts[1:], n)
+        return [
+            BusyPeriod(first, stop, start, end)
+            for first, stop, start, end in zip(
+                firsts.tolist(), stops.tolist(),
+                starts[firsts].tolist(), ends[stops - 1].tolist()
+            )
+        ]
+
+    burst, arrival = wl.burst, wl.arrival
+    periods: List[BusyPeriod] = []
+    first = 0
+    start = max(0, arrival[0])
+    current_time = start
+    for idx in range(n):
+        if arrival[idx] > current_time and idx > 0:
+            # CPU ociosa: cerrar el periodo anterior
+            periods.append(BusyPeriod(first, idx, start, current_time))
+            first, start, current_time = idx, arrival[idx], arrival[idx]
+        current_time += burst[idx]
+    periods.append(BusyPeriod(first, n, start, current_time))
+    return periods
+
+
+def idle_gaps(periods: List[BusyPeriod]) -> List[Tuple[int, int]]:
+    """Intervalos (start, end) de CPU ociosa entre periodos de ocupación, desde t=0."""
+    gaps = []
+    prev_end = 0
+    for p in periods:
+        if p.start > prev_end:
+            gaps.append((prev_end, p.start))
+        prev_end = p.end
+    return gaps
@@ -0,0 +1,22 @@
+import heapq
+from typing import List, Sequence, Tuple
+
+
+class ReadyQueue:
+    """
+    Cola de listos respaldada por un heap de índices de proceso.
+    Ordena por keys[idx] y desempata por el índice, que es el orden de llegada
+    (y el orden del archivo en empates). push/pop cuestan O(log n).
+    """
+    def __init__(self, keys: Sequence[int]):
+        self._keys = keys
+        self._heap: List[Tuple[int, int]] = []
+
+    def push(self, idx: int):
+        heapq.heappush(self._heap, (self._keys[idx], idx))
+
+    def pop(self) -> int:
+        return heapq.heappop(self._heap)[1]
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -1,63 +1,93 @@
-from typing import List
-from data_io.process_loader import Process
+from array import array
+from collections import deque
+from typing import Deque, List, Union
+from data_io.process_loader import Process, PreparedWorkload, as_workload
 from scheduling.fifo import ScheduleResult
+from utils.timeline import Timeline
+from utils.progress import PROGRESS_EVERY
 
 
-def schedule(processes: List[Process], **kwargs) -> ScheduleResult:
+def schedule(processes: Union[PreparedWorkload, List[Process]], **kwargs) -> ScheduleResult:
     """
     Round Robin scheduling (preemptivo).
-    Requiere 'quantum' 
+    Requiere 'quantum'.
+
+    Cuando un proceso es el único ejecutable, sus quantums consecutivos hasta la
+    siguiente llegada se resuelven de una vez y se registran como un solo segmento.
+    Con per_quantum=True se conserva un segmento por quantum (útil para la animación).
     """
     quantum = kwargs.get('quantum')
     if quantum is None or quantum <= 0:
         raise ValueError("Round Robin requiere un quantum positivo")
+    per_quantum = kwargs.get('per_quantum', False)
 
-    # Ordenar procesos por llegada
-    procs = sorted(processes, key=lambda p: p.arrival_time)
-    n = len(procs)
+    # Carga ya ordenada por llegada
+    wl = as_workload(processes)
+    ids, burst, arrival = wl.pid_ids, wl.burst, wl.arrival
+    n = len(wl)
+    progress = kwargs.get('progress')  # ver utils.progress
+    done = 0
     current_time = 0
-    timeline = []  # [(pid, start, end), ...]
+    timeline = Timeline()  # segmentos (pid_id, start, end)
 
-    # Registros
-    remaining = {p.pid: p.burst_time for p in procs}
-    arrival = {p.pid: p.arrival_time for p in procs}
-    finish_times = {}
+    # Registros por índice de proceso
+    remaining = array('q', burst)
+    finish_times = array('q', bytes(8 * n))
 
-    ready_queue: List[Process] = []
+    ready_queue: Deque[int] = deque()
     i = 0  # índice de llegada
 
     while i < n or ready_queue:
         # Añadir nuevos procesos llegados
-        while i < n and procs[i].arrival_time <= current_time:
-            ready_queue.append(procs[i])
+        while i < n and arrival[i] <= current_time:
+            ready_queue.append(i)
             i += 1
         if not ready_queue:
             # CPU idle hasta siguiente llegada
-            current_time = procs[i].arrival_time
+            current_time = arrival[i]
             continue
         # Tomar siguiente proceso
-        p = ready_queue.pop(0)
+        idx = ready_queue.popleft()
         start = current_time
-        run = min(quantum, remaining[p.pid])
+        if ready_queue:
+            run = min(quantum, remaining[idx])
+        elif i < n:
+            # único ejecutable: encadena quantums hasta cubrir la próxima llegada
+            quanta = max(1, -(-(arrival[i] - start) // quantum))
+            run = min(quanta * quantum, remaining[idx])
+        else:
+            # nadie más por llegar: corre hasta terminar
+            run = remaining[idx]
         end = start + run
         # Registrar ejecución
-        timeline.append((p.pid, start, end))
-        remaining[p.pid] -= run
+        if per_quantum:
+            seg_start = start
+            while True:
+                seg_end = min(seg_start + quantum, end)
+                timeline.append(ids[idx], seg_start, seg_end)
+                seg_start = seg_end
+                if seg_start >= end:
+                    break
+        else:
+            timeline.append(ids[idx], start, end)
+        remaining[idx] -= run
         current_time = end
         # Incorporar procesos que llegaron durante este quantum
-        while i < n and procs[i].arrival_time <= current_time:
-            ready_queue.append(procs[i])
+        while i < n and arrival[i] <= current_time:
+            ready_queue.append(i)
             i += 1
         # Si aún no termina, reencolarlo
-        if remaining[p.pid] > 0:
-            ready_queue.append(p)
+        if remaining[idx] > 0:
+            ready_queue.append(idx)
         else:
-            finish_times[p.pid] = current_time
+            finish_times[idx] = current_time
+            done += 1
+            if progress is not None and not done % PROGRESS_EVERY:
+                progress(done / n)
 
-    # Calcular tiempos de espera
+    # Calcular tiempos de espera: turnaround - burst
     waiting_times = {}
-    for p in procs:
-        turnaround = finish_times[p.pid] - arrival[p.pid]
-        waiting_times[p.pid] = turnaround - p.burst_time
+    for idx in range(n):
+        waiting_times[ids[idx]] = finish_times[idx] - arrival[idx] - burst[idx]
 
-    return ScheduleResult(timeline, waiting_times)
+    return ScheduleResult(timeline, waiting_times, wl.symbols)
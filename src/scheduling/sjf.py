@@ -1,37 +1,45 @@
-from typing import List
-from data_io.process_loader import Process
+from typing import List, Union
+from data_io.process_loader import Process, PreparedWorkload, as_workload
 from scheduling.fifo import ScheduleResult
+from utils.timeline import Timeline
+from utils.progress import PROGRESS_EVERY
+from scheduling.ready_queue import ReadyQueue
 
 
-def schedule(processes: List[Process], **kwargs) -> ScheduleResult:
+def schedule(processes: Union[PreparedWorkload, List[Process]], **kwargs) -> ScheduleResult:
     """
     Shortest Job First (no-preemptivo). En cada punto, elige el proceso con menor burst_time
     entre los que ya han llegado.
     """
-    # Copia de lista para no modificar original
-    procs = sorted(processes, key=lambda p: p.arrival_time)
-    timeline = []
+    # Carga ya ordenada por arrival_time
+    wl = as_workload(processes)
+    ids, burst, arrival = wl.pid_ids, wl.burst, wl.arrival
+    timeline = Timeline()
     waiting_times = {}
     current_time = 0
-    ready_queue: List[Process] = []
+    ready_queue = ReadyQueue(keys=burst)
     i = 0  # índice de llegada
-    n = len(procs)
+    n = len(wl)
+    progress = kwargs.get('progress')  # ver utils.progress
+    done = 0
 
     while i < n or ready_queue:
         # Añadir a ready_queue todos los procesos que han llegado
-        while i < n and procs[i].arrival_time <= current_time:
-            ready_queue.append(procs[i])
+        while i < n and arrival[i] <= current_time:
+            ready_queue.push(i)
             i += 1
         if not ready_queue:
             # Si no hay listos, adelantar al próximo arrival
-            current_time = procs[i].arrival_time
+            current_time = arrival[i]
             continue
-        # Seleccionar el de burst más corto
-        ready_queue.sort(key=lambda p: p.burst_time)
-        p = ready_queue.pop(0)
+        # Seleccionar el de burst más corto (empates: orden de llegada)
+        idx = ready_queue.pop()
         start = current_time
-        end = start + p.burst_time
-        timeline.append((p.pid, start, end))
-        waiting_times[p.pid] = start - p.arrival_time
+        end = start + burst[idx]
+        timeline.append(ids[idx], start, end)
+        waiting_times[ids[idx]] = start - arrival[idx]
         current_time = end
-    return ScheduleResult(timeline, waiting_times)
+        done += 1
+        if progress is not None and not done % PROGRESS_EVERY:
+            progress(done / n)
+    return ScheduleResult(timeline, waiting_times, wl.symbols)
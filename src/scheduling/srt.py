@@ -1,64 +1,78 @@
-from typing import List
-from data_io.process_loader import Process
+import heapq
+from typing import List, Union
+from data_io.process_loader import Process, PreparedWorkload, as_workload
 from scheduling.fifo import ScheduleResult
+from utils.timeline import Timeline
+from utils.progress import PROGRESS_EVERY
 
 
-def schedule(processes: List[Process], **kwargs) -> ScheduleResult:
+def schedule(processes: Union[PreparedWorkload, List[Process]], **kwargs) -> ScheduleResult:
     """
     Shortest Remaining Time (preemptivo).
     En cada momento de llegada o finalización de ráfaga, selecciona el proceso con
     el menor tiempo restante.
+
+    Motor por eventos: el reloj salta directamente a la siguiente llegada o
+    finalización. Los listos viven en un heap con clave (remaining, índice de llegada),
+    así que el costo es O((n + preempciones) log n) en lugar de O(burst_total · n log n).
     """
 
-    procs = sorted(processes, key=lambda p: p.arrival_time)
-    n = len(procs)
-    timeline = []  # [(pid, start, end), ...]
+    wl = as_workload(processes)
+    ids, burst, arrival = wl.pid_ids, wl.burst, wl.arrival
+    n = len(wl)
+    progress = kwargs.get('progress')  # ver utils.progress
+    done = 0
+    timeline = Timeline()  # segmentos (pid_id, start, end)
     waiting_times = {}
 
-    # Tiempos restantes y llegadas
-    remaining = {p.pid: p.burst_time for p in procs}
-    arrival = {p.pid: p.arrival_time for p in procs}
+    # heap de listos: (remaining, índice); el índice desempata igual que
+    # el orden estable por llegada
+    ready: List[tuple] = []
 
     current_time = 0
     i = 0  # índice para llegada
 
-    current_proc = None  # pid
-    last_switch_time = 0
-
-    while i < n or any(rem > 0 for rem in remaining.values()):
-        # Incorporar nuevos procesos que llegan
-        while i < n and procs[i].arrival_time <= current_time:
+    while i < n or ready:
+        # CPU idle: saltar al próximo arrival
+        if not ready and arrival[i] > current_time:
+            current_time = arrival[i]
+        # Incorporar nuevos procesos que llegan (los de ráfaga 0 nunca se ejecutan)
+        while i < n and arrival[i] <= current_time:
+            if burst[i] > 0:
+                heapq.heappush(ready, (burst[i], i))
             i += 1
-        # Seleccionar proceso con menor remaining > 0 y arrival <= current_time
-        candidates = [p for p in procs
-                      if p.arrival_time <= current_time and remaining[p.pid] > 0]
-        if not candidates:
-            # Saltar al próximo arrival
-            current_time = procs[i].arrival_time
+        if not ready:
             continue
-        # Elegir el que tenga el menor remaining
-        candidates.sort(key=lambda p: remaining[p.pid])
-        chosen = candidates[0]
 
-        # Si cambia de proceso, cerrar bloque anterior
-        if current_proc and current_proc != chosen.pid:
-            timeline.append((current_proc, last_switch_time, current_time))
-            last_switch_time = current_time
-        # Si no había proceso, iniciar bloque
-        if not current_proc:
-            last_switch_time = current_time
-        current_proc = chosen.pid
+        remaining, idx = heapq.heappop(ready)
+        start = current_time
 
-        # Ejecutar un ciclo completo (preemptivo por ciclo)
-        remaining[current_proc] -= 1
-        current_time += 1
+        # Ejecutar hasta terminar o hasta que una llegada lo desplace
+        while True:
+            finish = current_time + remaining
+            if i >= n or finish <= arrival[i]:
+                current_time = finish
+                remaining = 0
+                break
+            # avanzar hasta la siguiente llegada e incorporar todo lo que llega ahí
+            remaining -= arrival[i] - current_time
+            current_time = arrival[i]
+            while i < n and arrival[i] <= current_time:
+                if burst[i] > 0:
+                    heapq.heappush(ready, (burst[i], i))
+                i += 1
+            if ready and ready[0] < (remaining, idx):
+                break
 
-        # Si el proceso termina, cerrar bloque y registrar finish
-        if remaining[current_proc] == 0:
-            timeline.append((current_proc, last_switch_time, current_time))
+        timeline.append(ids[idx], start, current_time)
+        if remaining == 0:
             # Tiempo de espera = finish - arrival - burst
-            waiting_times[current_proc] = current_time - arrival[current_proc] - chosen.burst_time
-            current_proc = None
-            last_switch_time = current_time
+            waiting_times[ids[idx]] = current_time - arrival[idx] - burst[idx]
+            done += 1
+            if progress is not None and not done % PROGRESS_EVERY:
+                progress(done / n)
+        else:
+            # preempción: vuelve a la cola con su tiempo restante
+            heapq.heappush(ready, (remaining, idx))
 
-    return ScheduleResult(timeline, waiting_times)
+    return ScheduleResult(timeline, waiting_times, wl.symbols)
@@ -0,0 +1,184 @@
+import heapq
+from collections import deque
+from typing import Deque, Dict, List, Sequence, Tuple
+from data_io.process_loader import Process
+from data_io.sync_loader import Action, PreparedTrace, prepare_trace
+from data_io.symbols import SymbolTable
+from synchronization.engine import SyncResult, ACCESED, WAITING, capacities
+from synchronization.deadlock import Deadlock, WaitForGraph
+from utils.timeline import SyncTimeline
+from utils.progress import Progress, PROGRESS_EVERY
+
+
+class BlockingSyncResult(SyncResult):
+    """
+    Resultado de la simulación bloqueante. Además de segments/timeline y
+    waits/waiting_counts (acciones de cada pid que tuvieron que esperar), con nombres:
+      - wait_durations: dict {pid: ciclos totales esperando en cola}
+      - max_queue_lengths: dict {resource: largo máximo de su cola de espera}
+      - pending: lista de (pid, resource, cycle) que nunca obtuvieron el recurso
+      - deadlocks: lista de Deadlock (solo con hold_and_wait), en orden de formación
+    """
+    def __init__(self, segments: SyncTimeline, waits: Dict[int, int],
+                 pids: SymbolTable, resources: SymbolTable,
+                 wait_durations: Dict[str, int], max_queue_lengths: Dict[str, int],
+                 pending: List[Tuple[str, str, int]], deadlocks: List[Deadlock] = None):
+        super().__init__(segments, waits, pids, resources)
+        self.wait_durations = wait_durations
+        self.max_queue_lengths = max_queue_lengths
+        self.pending = pending
+        self.deadlocks = deadlocks or []
+
+
+def simulate_blocking(processes: List[Process], counts: Dict[str, int],
+                      actions: List[Action], hold_and_wait: bool = False) -> BlockingSyncResult:
+    """
+    Semántica bloqueante: una acción que no obtiene el recurso entra a la cola FIFO
+    de ese recurso y se le concede en un ciclo posterior, cuando se libera capacidad.
+    Cada acceso ocupa su recurso durante act.duration ciclos desde que se concede.
+
+    El timeline registra WAITING en el ciclo en que la acción queda bloqueada y
+    ACCESED en el ciclo en que se concede. Es un motor por eventos: solo se visitan
+    ciclos con acciones nuevas o con liberaciones, así que los ciclos ociosos no cuestan.
+
+    Con hold_and_wait, un pid en cola queda bloqueado: conserva lo que retiene (sus
+    liberaciones se aplazan hasta un ciclo después de que se le conceda, y la fila
+    ACCESED se alarga hasta ese ciclo) y sus acciones siguientes esperan y se
+    emiten, en orden, al desbloquearse. Así pueden formarse interbloqueos; se
+    detectan al vuelo con un WaitForGraph.
+    """
+    trace = prepare_trace(actions, (p.pid for p in processes), counts)
+    return simulate_blocking_trace(trace, capacities(trace, counts), hold_and_wait)
+
+
+def simulate_blocking_trace(trace: PreparedTrace, capacity: Sequence[int],
+                            hold_and_wait: bool = False, progress: Progress = None) -> BlockingSyncResult:
+    """
+    simulate_blocking sobre una traza ya internada (capacity: por id de recurso).
+    progress: ver utils.progress (avanza con las acciones nuevas procesadas).
+    """
+    by_cycle: Dict[int, List[int]] = {}
+    for i, cycle in enumerate(trace.cycle):
+        by_cycle.setdefault(cycle, []).append(i)
+    # los ciclos negativos quedan fuera de la simulación (empieza en el ciclo 0)
+    cycles = sorted(c for c in by_cycle if c >= 0)
+    act_pid, act_res, act_cycle, act_dur = trace.pid, trace.resource, trace.cycle, trace.duration
+
+    waits: Dict[int, int] = dict.fromkeys(range(trace.n_processes), 0)
+    wait_durations: Dict[int, int] = dict.fromkeys(range(trace.n_processes), 0)
+    max_queue_lengths: Dict[int, int] = {}
+    segments = SyncTimeline()
+
+    in_use: Dict[int, int] = {}
+    queues: Dict[int, Deque[Tuple[int, int, int]]] = {}  # recurso -> cola de (pid, ciclo de pedido, duración)
+    releases: List[Tuple[int, int, int, int]] = []       # heap de (ciclo de liberación, recurso, pid, fila ACCESED)
+
+    # solo con hold_and_wait
+    graph = WaitForGraph() if hold_and_wait else None
+    backlog: Dict[int, Deque[int]] = {}      # acciones (índices) de un pid bloqueado, en orden
+    deferred: Dict[int, List[Tuple[int, int]]] = {}  # (recurso, fila ACCESED) aplazados de un pid bloqueado
+    deadlocks: List[Tuple[int, tuple, tuple]] = []
+
+    def grant(cycle: int, pid: int, resource: int, duration: int):
+        in_use[resource] = in_use.get(resource, 0) + 1
+        heapq.heappush(releases, (cycle + duration, resource, pid, len(segments)))
+        segments.append(cycle, pid, resource, ACCESED, duration)
+        if graph is not None:
+            graph.grant(pid, resource)
+
+    def request(cycle: int, i: int):
+        pid, resource, requested = act_pid[i], act_res[i], act_cycle[i]
+        queue = queues.get(resource)
+        if not queue and in_use.get(resource, 0) < capacity[resource]:
+            if cycle > requested:  # acción retenida por hold_and_wait
+                wait_durations[pid] = wait_durations.get(pid, 0) + cycle - requested
+            grant(cycle, pid, resource, act_dur[i])
+            return
+        if queue is None:
+            queue = queues[resource] = deque()
+        queue.append((pid, requested, act_dur[i]))
+        waits[pid] = waits.get(pid, 0) + 1
+        if len(queue) > max_queue_lengths.get(resource, 0):
+            max_queue_lengths[resource] = len(queue)
+        segments.append(cycle, pid, resource, WAITING, 1)
+        if graph is not None:
+            graph.request(pid, resource)
+            found = graph.find_deadlock(pid)
+            if found:
+                deadlocks.append((cycle, *found))
+
+    def resume(cycle: int, pid: int):
+        # pid desbloqueado: libera lo aplazado (su fila ACCESED pasa a durar hasta
+        # la liberación real) y emite sus acciones retenidas
+        for resource, row in deferred.pop(pid, ()):
+            segments.set_duration(row, cycle + 1 - segments.cycle[row])
+            heapq.heappush(releases, (cycle + 1, resource, pid, row))
+        pending_acts = backlog.get(pid)
+        while pending_acts and not graph.is_waiting(pid):
+            request(cycle, pending_acts.popleft())
+
+    ci = 0
+    done, next_report = 0, PROGRESS_EVERY
+    while ci < len(cycles) or releases:
+        # siguiente evento: llegada de acciones o liberación de un recurso
+        cycle = cycles[ci] if ci < len(cycles) else releases[0][0]
+        if releases and releases[0][0] < cycle:
+            cycle = releases[0][0]
+
+        # 1) liberar lo que vence en este ciclo y atender las colas (los más antiguos primero)
+        freed: Dict[int, None] = {}
+        while releases and releases[0][0] <= cycle:
+            _, resource, pid, row = heapq.heappop(releases)
+            if graph is not None:
+                if graph.is_waiting(pid):
+                    deferred.setdefault(pid, []).append((resource, row))
+                    continue
+                graph.release(pid, resource)
+            in_use[resource] -= 1
+            if queues.get(resource):
+                freed[resource] = None
+        for resource in freed:
+            queue = queues[resource]
+            while queue and in_use[resource] < capacity[resource]:
+                pid, requested, duration = queue.popleft()
+                wait_durations[pid] = wait_durations.get(pid, 0) + cycle - requested
+                grant(cycle, pid, resource, duration)
+                if graph is not None:
+                    resume(cycle, pid)
+
+        # 2) acciones nuevas del ciclo, en orden del archivo (detrás de los que ya esperan)
+        if ci < len(cycles) and cycles[ci] == cycle:
+            if progress is not None and done >= next_report:
+                progress(done / len(trace))
+                next_report = done + PROGRESS_EVERY
+            done += len(by_cycle[cycle])
+            for i in by_cycle[cycle]:
+                pid = act_pid[i]
+                if graph is not None and (graph.is_waiting(pid) or backlog.get(pid)):
+                    backlog.setdefault(pid, deque()).append(i)
+                    continue
+                request(cycle, i)
+            ci += 1
+
+    # agregados por pid/recurso: se devuelven con nombres
+    pnames, rnames = trace.pids.names, trace.resources.names
+    # recursos sin capacidad (o interbloqueados): sus colas nunca se vacían
+    pending = [
+        (pnames[pid], rnames[resource], requested)
+        for resource, queue in queues.items()
+        for pid, requested, _ in queue
+    ]
+    pending.extend(
+        (pnames[act_pid[i]], rnames[act_res[i]], act_cycle[i])
+        for idxs in backlog.values() for i in idxs
+    )
+    return BlockingSyncResult(
+        segments, waits, trace.pids, trace.resources,
+        wait_durations={pnames[p]: w for p, w in wait_durations.items()},
+        max_queue_lengths={rnames[r]: n for r, n in max_queue_lengths.items()},
+        pending=pending,
+        deadlocks=[
+            Deadlock(cycle, tuple(sorted(pnames[p] for p in pids)), tuple(sorted(rnames[r] for r in res)))
+            for cycle, pids, res in deadlocks
+        ]
+    )
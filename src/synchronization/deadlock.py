@@ -0,0 +1,96 @@
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+class Deadlock(NamedTuple):
+    cycle: int                  # ciclo en que se formó
+    pids: Tuple[str, ...]       # procesos que quedan bloqueados para siempre
+    resources: Tuple[str, ...]  # recursos que piden o retienen
+
+
+class WaitForGraph:
+    """
+    Grafo de asignación de recursos mantenido de forma incremental:
+      - pid -> recurso: el pid espera ese recurso (como mucho una espera por pid)
+      - recurso -> pid: el pid retiene unidades del recurso
+    pids y recursos son ids enteros (ver PreparedTrace).
+
+    Un interbloqueo solo puede formarse al agregar una espera, así que basta con
+    revisar desde el pid que acaba de bloquearse (find_deadlock). La búsqueda
+    recorre solo el grafo vivo (esperas y retenciones actuales) y no entra en
+    grupos ya reportados, así que su costo no crece con el largo de la traza.
+    """
+    def __init__(self):
+        self.waits_for: Dict[int, int] = {}
+        self.holders: Dict[int, Dict[int, int]] = {}
+        self.deadlocked: Set[int] = set()
+
+    def is_waiting(self, pid: int) -> bool:
+        return pid in self.waits_for
+
+    def request(self, pid: int, resource: int):
+        self.waits_for[pid] = resource
+
+    def grant(self, pid: int, resource: int):
+        if self.waits_for.get(pid) == resource:
+            del self.waits_for[pid]
+        held = self.holders.setdefault(resource, {})
+        held[pid] = held.get(pid, 0) + 1
+
+    def release(self, pid: int, resource: int):
+        held = self.holders[resource]
+        held[pid] -= 1
+        if not held[pid]:
+            del held[pid]
+            if not held:
+                del self.holders[resource]
+
+    def find_deadlock(self, pid: int) -> Optional[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+        """
+        ¿Quedó pid interbloqueado? Primero se comprueba que no pueda avanzar nunca:
+        desde él no se alcanza ningún pid libre (todo lo alcanzable espera: un nudo).
+        Con recursos de varias unidades un ciclo no basta, la espera se resuelve si
+        cualquiera de los que retienen el recurso avanza.
+        El interbloqueo son los pids y recursos del nudo que vuelven a pid (su
+        componente fuerte). Un pid que solo espera detrás de un interbloqueo ya
+        reportado queda bloqueado, pero no se reporta.
+        Devuelve (pids, recursos) o None.
+        """
+        # nodos del grafo: ('p', pid) o ('r', recurso); se guardan las aristas invertidas
+        parents: Dict[Tuple[str, int], List[Tuple[str, int]]] = {}
+        seen: Set[Tuple[str, int]] = set()
+        stack: List[Tuple[str, int]] = [('p', pid)]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            kind, name = node
+            if kind == 'p':
+                if name in self.deadlocked:
+                    continue  # grupo ya bloqueado: cerrado, no hace falta recorrerlo
+                resource = self.waits_for.get(name)
+                if resource is None:
+                    return None  # puede avanzar y, con el tiempo, liberar lo que retiene
+                nxt = [('r', resource)]
+            else:
+                held = self.holders.get(name)
+                if not held:
+                    return None  # nadie lo retiene: espera sin capacidad, no interbloqueo
+                nxt = [('p', h) for h in held]
+            for child in nxt:
+                parents.setdefault(child, []).append(node)
+                stack.append(child)
+        self.deadlocked.update(name for kind, name in seen if kind == 'p')
+
+        # componente fuerte de pid: lo que alcanza pid recorriendo las aristas al revés
+        scc: Set[Tuple[str, int]] = set()
+        back = list(parents.get(('p', pid), ()))
+        while back:
+            node = back.pop()
+            if node not in scc:
+                scc.add(node)
+                back.extend(parents.get(node, ()))
+        if ('p', pid) not in scc:
+            return None
+        return (tuple(sorted(name for kind, name in scc if kind == 'p')),
+                tuple(sorted(name for kind, name in scc if kind == 'r')))
@@ -0,0 +1,164 @@
+import heapq
+from typing import Callable, Iterable, List, Dict, Sequence, Tuple
+from data_io.process_loader import Process
+from data_io.sync_loader import Action, PreparedTrace, prepare_trace
+from data_io.symbols import SymbolTable
+from utils.timeline import SyncTimeline, NamedRows, PidIndex, TimelineIndex
+from utils.progress import Progress, PROGRESS_EVERY
+
+# estados del timeline: state_id -> nombre
+ACCESED, WAITING = 0, 1
+STATES = ('ACCESED', 'WAITING')
+
+
+class SyncResult:
+    """
+    Resultado de simulación de sincronización, con pids y recursos como ids de
+    las tablas de símbolos:
+      - segments: SyncTimeline con las filas (cycle, pid_id, resource_id, state_id)
+                  y la duración de cada una
+      - waits: dict {pid_id: num_waits}
+      - pids, resources: SymbolTable
+    timeline (vista de segments con nombres, sin copiarlos) y waiting_counts
+    ({pid: num_waits}) son lo mismo con nombres (solo para mostrar o exportar).
+    pid_index (PidIndex) ubica la fila de un pid en un ciclo;
+    timeline_index (TimelineIndex) reúne lo que precalcula el Gantt.
+    """
+    def __init__(self, segments: SyncTimeline, waits: Dict[int, int],
+                 pids: SymbolTable, resources: SymbolTable):
+        self.segments = segments
+        self.waits = waits
+        self.pids = pids
+        self.resources = resources
+        self._waiting_counts = None
+        self._pid_index = None
+        self._timeline_index = None
+
+    @property
+    def timeline(self) -> NamedRows:
+        return self.segments.named(self.pids.names, self.resources.names, STATES)
+
+    @property
+    def durations(self) -> Sequence[int]:
+        """Ciclos que dura cada fila de segments."""
+        return self.segments.duration
+
+    @property
+    def waiting_counts(self) -> Dict[str, int]:
+        if self._waiting_counts is None:
+            names = self.pids.names
+            self._waiting_counts = {names[p]: w for p, w in self.waits.items()}
+        return self._waiting_counts
+
+    @property
+    def pid_index(self) -> PidIndex:
+        """Filas de cada pid_id (se indexa una sola vez, al primer uso)."""
+        if self._pid_index is None:
+            self._pid_index = PidIndex(self.segments)
+        return self._pid_index
+
+    @property
+    def timeline_index(self) -> TimelineIndex:
+        """Índices para dibujar segments (se arman una sola vez, al primer uso)."""
+        if self._timeline_index is None:
+            self._timeline_index = TimelineIndex(self.segments, len(self.pids.names),
+                                                 self.pid_index)
+        return self._timeline_index
+
+
+def capacities(trace: PreparedTrace, counts: Dict[str, int]) -> List[int]:
+    """Capacidad por id de recurso (0 para los que no están en counts)."""
+    return [counts.get(name, 0) for name in trace.resources.names]
+
+
+def simulate_counts(processes: List[Process], counts: Dict[str, int], actions: List[Action]) -> SyncResult:
+    """
+    Motor común de mutex y semáforo: cada recurso admite counts[recurso] accesos
+    simultáneos, en el orden del archivo. Un acceso concedido retiene su recurso
+    durante act.duration ciclos.
+    """
+    trace = prepare_trace(actions, (p.pid for p in processes), counts)
+    return simulate_trace(trace, capacities(trace, counts))
+
+
+def simulate_trace(trace: PreparedTrace, capacity: Sequence[int], progress: Progress = None) -> SyncResult:
+    """
+    simulate_counts sobre una traza ya internada (capacity: por id de recurso).
+    progress: ver utils.progress.
+
+    Solo se recorren los ciclos que tienen acciones. Las retenciones vigentes de
+    cada recurso viven en un heap con su ciclo de fin: una retención de un millón
+    de ciclos cuesta O(log n), igual que una de un ciclo.
+    """
+    # Organizar actions por ciclo
+    by_cycle: Dict[int, List[int]] = {}
+    for i, cycle in enumerate(trace.cycle):
+        by_cycle.setdefault(cycle, []).append(i)
+    pid, res, dur = trace.pid, trace.resource, trace.duration
+    # los ciclos negativos quedan fuera de la simulación (empieza en el ciclo 0)
+    rows = (
+        (c, pid[i], res[i], dur[i])
+        for c in sorted(by_cycle) if c >= 0
+        for i in by_cycle[c]
+    )
+
+    waits: Dict[int, int] = dict.fromkeys(range(trace.n_processes), 0)
+    segments = SyncTimeline()  # (cycle, pid_id, resource_id, ACCESED|WAITING, duration)
+    _run_actions(rows, capacity, waits, segments.append, progress, len(trace))
+    return SyncResult(segments, waits, trace.pids, trace.resources)
+
+
+def simulate_counts_stream(processes: List[Process], counts: Dict[str, int],
+                           action_cycles: Iterable[Tuple[int, List[Action]]],
+                           sink: Callable[[Tuple[int, str, str, str, int]], None]) -> Dict[str, int]:
+    """
+    Variante en streaming de simulate_counts: consume (ciclo, acciones) en orden
+    creciente de ciclo (ver data_io.sync_loader.iter_action_cycles) y entrega cada
+    fila del timeline, con su duración al final, a 'sink' en cuanto se decide. La
+    memoria queda acotada por el ciclo más grande y las retenciones vigentes.
+    Devuelve waiting_counts.
+    """
+    pids = SymbolTable(p.pid for p in processes)
+    resources = SymbolTable(counts)
+    capacity = [counts[name] for name in resources.names]
+    waits: Dict[int, int] = dict.fromkeys(range(len(pids)), 0)
+
+    def rows():
+        for cycle, acts in action_cycles:
+            if cycle < 0:
+                continue
+            for act in acts:
+                r = resources.intern(act.resource)
+                if r == len(capacity):
+                    capacity.append(0)  # recurso desconocido: nunca se concede
+                yield cycle, pids.intern(act.pid), r, act.duration
+
+    pnames, rnames = pids.names, resources.names
+
+    def emit(cycle, p, r, st, duration):
+        sink((cycle, pnames[p], rnames[r], STATES[st], duration))
+
+    _run_actions(rows(), capacity, waits, emit)
+    return {pnames[p]: w for p, w in waits.items()}
+
+
+def _run_actions(rows: Iterable[Tuple[int, int, int, int]], capacity: Sequence[int],
+                 waits: Dict[int, int], emit: Callable,
+                 progress: Progress = None, total: int = 0) -> None:
+    # rows: (cycle, pid_id, resource_id, duration) en orden (ciclo, orden del archivo)
+    # recurso -> heap con el ciclo de fin de cada retención vigente
+    holds: Dict[int, List[int]] = {}
+    for done, (cycle, pid, res, duration) in enumerate(rows):
+        if progress is not None and done and not done % PROGRESS_EVERY:
+            progress(done / total)
+        active = holds.get(res)
+        if active is None:
+            active = holds[res] = []
+        while active and active[0] <= cycle:
+            heapq.heappop(active)
+        if len(active) < capacity[res]:
+            heapq.heappush(active, cycle + duration)
+            emit(cycle, pid, res, ACCESED, duration)
+        else:
+            waits[pid] = waits.get(pid, 0) + 1
+            emit(cycle, pid, res, WAITING, 1)
@@ -0,0 +1,98 @@
+import heapq
+from typing import List, Dict, Sequence, Set
+from data_io.process_loader import Process
+from data_io.sync_loader import Resource, Action, PreparedTrace, prepare_trace
+from synchronization.engine import SyncResult, ACCESED, WAITING, capacities
+from utils.timeline import SyncTimeline
+from utils.progress import Progress, PROGRESS_EVERY
+
+# 'readers': si hay lecturas en el ciclo, pasan todas y las escrituras esperan
+# 'writers': si hay escrituras en el ciclo, pasa la primera y todo lo demás espera
+# En ambas el count del recurso solo decide si se concede (count > 0): no limita
+# la cantidad de lectores simultáneos.
+POLICIES = ('readers', 'writers')
+
+
+def simulate(processes: List[Process], resources: List[Resource], actions: List[Action],
+             policy: str = 'readers') -> SyncResult:
+    """
+    Simulación de acceso a recursos con locks de lectura/escritura.
+    Las lecturas (READ) de un recurso lo comparten y cada escritura (WRITE) lo usa
+    en exclusiva, durante act.duration ciclos.
+    """
+    return simulate_rwlock(processes, {res.name: res.count for res in resources}, actions, policy)
+
+
+def simulate_rwlock(processes: List[Process], counts: Dict[str, int], actions: List[Action],
+                    policy: str = 'readers') -> SyncResult:
+    """
+    Motor del lock de lectura/escritura. Un recurso con count <= 0 (o desconocido)
+    no se concede nunca, igual que en mutex/semáforo; con count > 0 el valor no
+    importa (las lecturas no se limitan a count). Mismo formato de salida que
+    engine.simulate_counts.
+    """
+    trace = prepare_trace(actions, (p.pid for p in processes), counts)
+    return simulate_rwlock_trace(trace, capacities(trace, counts), policy)
+
+
+def simulate_rwlock_trace(trace: PreparedTrace, capacity: Sequence[int],
+                          policy: str = 'readers', progress: Progress = None) -> SyncResult:
+    """
+    simulate_rwlock sobre una traza ya internada (capacity: por id de recurso).
+    progress: ver utils.progress.
+
+    Las retenciones que pasan de un ciclo siguen vigentes: una lectura larga bloquea
+    escrituras posteriores (y una escritura larga, cualquier acceso) hasta su fin.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Política RW desconocida: {policy}")
+    prefer_readers = policy == 'readers'
+
+    by_cycle: Dict[int, List[int]] = {}
+    for i, cycle in enumerate(trace.cycle):
+        by_cycle.setdefault(cycle, []).append(i)
+    pid, res, dur, write = trace.pid, trace.resource, trace.duration, trace.write
+
+    waits: Dict[int, int] = dict.fromkeys(range(trace.n_processes), 0)
+    segments = SyncTimeline()
+    readers: Dict[int, List[int]] = {}   # recurso -> heap con el fin de cada lectura vigente
+    writer_until: Dict[int, int] = {}    # recurso -> ciclo de fin de la escritura vigente
+    done, next_report = 0, PROGRESS_EVERY
+
+    # los ciclos negativos quedan fuera de la simulación (empieza en el ciclo 0)
+    for cycle in sorted(c for c in by_cycle if c >= 0):
+        idxs = by_cycle[cycle]
+        if progress is not None and done >= next_report:
+            progress(done / len(trace))
+            next_report = done + PROGRESS_EVERY
+        done += len(idxs)
+        # qué recursos tienen lecturas / escrituras en este ciclo
+        read_res: Set[int] = set()
+        write_res: Set[int] = set()
+        for i in idxs:
+            (write_res if write[i] else read_res).add(res[i])
+
+        written: Set[int] = set()  # recursos cuya única escritura ya se concedió
+        for i in idxs:
+            r = res[i]
+            active = readers.get(r)
+            while active and active[0] <= cycle:
+                heapq.heappop(active)
+            if capacity[r] <= 0 or writer_until.get(r, 0) > cycle:
+                granted = False
+            elif write[i]:
+                granted = (not active and r not in written
+                           and (not prefer_readers or r not in read_res))
+                if granted:
+                    written.add(r)
+                    writer_until[r] = cycle + dur[i]
+            else:
+                granted = prefer_readers or r not in write_res
+                if granted:
+                    heapq.heappush(readers.setdefault(r, []), cycle + dur[i])
+            if granted:
+                segments.append(cycle, pid[i], r, ACCESED, dur[i])
+            else:
+                waits[pid[i]] = waits.get(pid[i], 0) + 1
+                segments.append(cycle, pid[i], r, WAITING, 1)
+    return SyncResult(segments, waits, trace.pids, trace.resources)
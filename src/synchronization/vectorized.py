@@ -0,0 +1,83 @@
+from array import array
+from typing import List, Dict, Sequence
+from data_io.process_loader import Process
+from data_io.sync_loader import Action, PreparedTrace, prepare_trace
+from synchronization.engine import SyncResult, ACCESED, WAITING, capacities
+from utils.timeline import SyncTimeline
+from utils.progress import Progress
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se usa synchronization.engine
+    np = None
+
+# a partir de este número de acciones conviene el motor vectorizado
+VECTORIZE_MIN = 4096
+
+
+def simulate_counts_vectorized(processes: List[Process], counts: Dict[str, int],
+                               actions: List[Action]) -> SyncResult:
+    """Misma semántica que engine.simulate_counts, resuelta con arreglos NumPy."""
+    trace = prepare_trace(actions, (p.pid for p in processes), counts)
+    return simulate_trace_vectorized(trace, capacities(trace, counts))
+
+
+def simulate_trace_vectorized(trace: PreparedTrace, capacity: Sequence[int],
+                              progress: Progress = None) -> SyncResult:
+    """
+    Una acción obtiene el recurso si su posición (en orden del archivo) entre las
+    acciones del mismo (ciclo, recurso) es menor que la capacidad del recurso. Los
+    pids y recursos ya vienen como enteros (ver PreparedTrace): se agrupa de forma
+    estable por (ciclo, recurso) y el rango dentro de cada grupo decide ACCESED/WAITING.
+    Solo vale si todas las acciones duran un ciclo. progress se llama entre
+    pasadas (ver utils.progress): es ahí donde se puede cancelar.
+    """
+    if np is None:
+        raise RuntimeError("simulate_trace_vectorized requiere numpy")
+
+    pids = np.frombuffer(trace.pid, dtype=np.int64)
+    res = np.frombuffer(trace.resource, dtype=np.int64)
+    cycles = np.frombuffer(trace.cycle, dtype=np.int64)
+    capacity = np.asarray(capacity, dtype=np.int64)
+
+    # los ciclos negativos quedan fuera de la simulación (empieza en el ciclo 0)
+    keep = np.flatnonzero(cycles >= 0)
+    pids, res, cycles = pids[keep], res[keep], cycles[keep]
+    m = len(keep)
+
+    # agrupar por (ciclo, recurso) conservando el orden del archivo (lexsort es estable)
+    order = np.lexsort((res, cycles))
+    c_sorted, r_sorted = cycles[order], res[order]
+    new_group = np.ones(m, dtype=bool)
+    if m > 1:
+        new_group[1:] = (c_sorted[1:] != c_sorted[:-1]) | (r_sorted[1:] != r_sorted[:-1])
+    positions = np.arange(m)
+    group_start = np.maximum.accumulate(np.where(new_group, positions, 0))
+    granted = np.empty(m, dtype=bool)
+    granted[order] = (positions - group_start) < capacity[r_sorted]
+    if progress is not None:
+        progress(0.4)
+
+    # timeline en orden (ciclo, orden del archivo)
+    torder = np.argsort(cycles, kind='stable')
+    granted_t = granted[torder]
+    pids_t = pids[torder]
+    states = np.where(granted_t, ACCESED, WAITING)
+    segments = SyncTimeline.from_columns(
+        cycles[torder].tobytes(),
+        pids_t.astype(np.int32).tobytes(),
+        res[torder].astype(np.int32).tobytes(),
+        states.astype(np.int8).tobytes(),
+        array('b', [1]) * m
+    )
+    if progress is not None:
+        progress(0.8)
+
+    # esperas por pid; los pids que no están en processes se agregan en orden de aparición
+    waits: Dict[int, int] = dict.fromkeys(range(trace.n_processes), 0)
+    waiting_pids = pids_t[~granted_t]
+    counts = np.bincount(waiting_pids, minlength=len(trace.pids))
+    codes, first = np.unique(waiting_pids, return_index=True)
+    for code in codes[np.argsort(first)].tolist():
+        waits[code] = waits.get(code, 0) + int(counts[code])
+    return SyncResult(segments, waits, trace.pids, trace.resources)
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 def compute_avg_waiting_time(waiting_times: Dict[str, int]) -> float:
     """
@@ -66,3 +66,17 @@ def compute_avg_turnaround_time(
         total += (finish - at)
 
     return total / len(completion_times)
+
+
+def compute_context_switches(timeline: List[tuple]) -> int:
+    """
+    Cuenta los cambios de contexto: segmentos consecutivos (pid, start, end)
+    cuyo pid es distinto del anterior.
+    """
+    switches = 0
+    prev = None
+    for pid, _, _ in timeline:
+        if prev is not None and pid != prev:
+            switches += 1
+        prev = pid
+    return switches
@@ -0,0 +1,32 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+
+@contextmanager
+def process_pool(max_workers: int, initializer: Optional[Callable] = None,
+                 initargs: tuple = ()) -> Iterator[ProcessPoolExecutor]:
+    """
+    ProcessPoolExecutor para las simulaciones en paralelo.
+
+    Fuera del hilo principal (la GUI simula en un hilo, ver gui.worker) los
+    procesos se crean con 'spawn': un fork de un proceso con varios hilos puede
+    heredar locks tomados por otro hilo y colgar al hijo.
+
+    Si el bloque termina con una excepción (p.ej. SimulationCancelled lanzada
+    por progress) se cancelan las tareas que no empezaron y no se espera a las
+    que están corriendo, así la cancelación vuelve enseguida.
+    """
+    context = None
+    if threading.current_thread() is not threading.main_thread():
+        context = multiprocessing.get_context('spawn')
+    pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                               initializer=initializer, initargs=initargs)
+    try:
+        yield pool
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
@@ -0,0 +1,19 @@
+from typing import Callable, Optional
+
+# Los motores llaman progress(fracción en [0, 1]) cada PROGRESS_EVERY pasos.
+# progress puede lanzar una excepción (p.ej. SimulationCancelled): la simulación
+# se corta en ese punto, así se cancela de forma cooperativa.
+Progress = Optional[Callable[[float], None]]
+
+PROGRESS_EVERY = 4096
+
+
+class SimulationCancelled(Exception):
+    """La simulación se canceló desde su callback de progreso."""
+
+
+def part(progress: Progress, k: int, n: int) -> Progress:
+    """Callback para la parte k (de n iguales) de un trabajo; None si progress es None."""
+    if progress is None:
+        return None
+    return lambda fraction: progress((k + fraction) / n)
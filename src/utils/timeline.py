@@ -0,0 +1,513 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+class Timeline:
+    """
+    Segmentos de un scheduling en columnas tipadas (array), en orden de inicio:
+      - pid: id del pid (ver data_io.symbols.SymbolTable)
+      - start, end: intervalo [start, end) de cada segmento
+    20 bytes por segmento frente a los ~150 de una tupla (y sus enteros) en una lista.
+    Se recorre como tuplas (pid_id, start, end), igual que la lista que reemplaza.
+
+    Con una sola CPU los segmentos no se solapan y tanto start como end quedan
+    en orden no decreciente; between() se apoya en eso.
+    """
+    __slots__ = ('pid', 'start', 'end')
+
+    def __init__(self, rows: Iterable[Tuple[int, int, int]] = ()):
+        self.pid = array('i')
+        self.start = array('q')
+        self.end = array('q')
+        for row in rows:
+            self.append(*row)
+
+    @classmethod
+    def from_columns(cls, pid: Sequence[int], start: Sequence[int], end: Sequence[int]) -> 'Timeline':
+        tl = cls()
+        tl.pid = array('i', pid)
+        tl.start = array('q', start)
+        tl.end = array('q', end)
+        return tl
+
+    def append(self, pid: int, start: int, end: int):
+        self.pid.append(pid)
+        self.start.append(start)
+        self.end.append(end)
+
+    def extend(self, other: 'Timeline'):
+        self.pid.extend(other.pid)
+        self.start.extend(other.start)
+        self.end.extend(other.end)
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        return zip(self.pid, self.start, self.end)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return Timeline.from_columns(self.pid[i], self.start[i], self.end[i])
+        return self.pid[i], self.start[i], self.end[i]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Timeline):
+            return NotImplemented
+        return self.pid == other.pid and self.start == other.start and self.end == other.end
+
+    def __repr__(self) -> str:
+        return f"Timeline({len(self)} segmentos)"
+
+    def span(self, t0: int, t1: int) -> Tuple[int, int]:
+        """Rango [lo, hi) de índices de los segmentos que se cruzan con [t0, t1)."""
+        lo = bisect_right(self.end, t0)
+        hi = bisect_left(self.start, t1, lo)
+        return lo, hi
+
+    def between(self, t0: int, t1: int) -> 'Timeline':
+        """Segmentos que se cruzan con el intervalo de tiempo [t0, t1)."""
+        lo, hi = self.span(t0, t1)
+        return self[lo:hi]
+
+    def named(self, names: Sequence[str]) -> 'NamedRows':
+        """Vista con el nombre de cada pid: (pid, start, end)."""
+        return NamedRows(self, lambda row: (names[row[0]],) + row[1:])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.itemsize * len(col) for col in (self.pid, self.start, self.end))
+
+
+class SyncTimeline:
+    """
+    Filas de una simulación de sincronización en columnas tipadas, en orden de ciclo:
+      - cycle: ciclo de la fila
+      - pid, resource: ids (ver data_io.symbols.SymbolTable)
+      - state: código de estado (synchronization.engine.ACCESED / WAITING)
+      - duration: ciclos que se retiene el recurso (1 para las esperas)
+    Se recorre como tuplas (cycle, pid_id, resource_id, state); duration va aparte.
+
+    duration usa el tipo entero más angosto que admite sus valores (DURATION_TYPECODES):
+    un byte por fila mientras ninguna retención pase de 127 ciclos, y se ensancha
+    (copiando la columna) la primera vez que un valor no entra.
+    """
+    __slots__ = ('cycle', 'pid', 'resource', 'state', 'duration')
+    COLUMNS = ('cycle', 'pid', 'resource', 'state', 'duration')
+    DURATION_TYPECODES = ('b', 'h', 'i', 'q')
+
+    def __init__(self, rows: Iterable[Tuple[int, int, int, int, int]] = ()):
+        self.cycle = array('q')
+        self.pid = array('i')
+        self.resource = array('i')
+        self.state = array('b')
+        self.duration = array('b')
+        for row in rows:
+            self.append(*row)
+
+    @classmethod
+    def from_columns(cls, cycle: Sequence[int], pid: Sequence[int], resource: Sequence[int],
+                     state: Sequence[int], duration: Sequence[int]) -> 'SyncTimeline':
+        """
+        Columnas como secuencias de enteros o bytes del tipo de cada una; duration
+        en bytes va como int64. Si duration ya es un array se conserva su tipo.
+        """
+        tl = cls()
+        tl.cycle = array('q', cycle)
+        tl.pid = array('i', pid)
+        tl.resource = array('i', resource)
+        tl.state = array('b', state)
+        if isinstance(duration, array):
+            tl.duration = array(duration.typecode, duration)
+        else:
+            tl.duration = array('q', duration)
+            if tl.duration:
+                tl._widen(min(tl.duration), max(tl.duration), narrowest='b')
+        return tl
+
+    def append(self, cycle: int, pid: int, resource: int, state: int, duration: int = 1):
+        self.cycle.append(cycle)
+        self.pid.append(pid)
+        self.resource.append(resource)
+        self.state.append(state)
+        try:
+            self.duration.append(duration)
+        except OverflowError:
+            self._widen(duration, duration)
+            self.duration.append(duration)
+
+    def set_duration(self, i: int, duration: int):
+        """Cambia la duración de la fila i (ensancha la columna si hace falta)."""
+        try:
+            self.duration[i] = duration
+        except OverflowError:
+            self._widen(duration, duration)
+            self.duration[i] = duration
+
+    def _widen(self, lo: int, hi: int, narrowest: str = None):
+        # primer tipo (desde narrowest o el actual) que admite tanto la columna como [lo, hi]
+        codes = self.DURATION_TYPECODES
+        start = codes.index(narrowest or self.duration.typecode)
+        for typecode in codes[start:]:
+            limit = 1 << (8 * array(typecode).itemsize - 1)
+            if -limit <= lo and hi < limit:
+                break
+        if typecode != self.duration.typecode:
+            self.duration = array(typecode, self.duration)
+
+    def __len__(self) -> int:
+        return len(self.cycle)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int, int]]:
+        return zip(self.cycle, self.pid, self.resource, self.state)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return SyncTimeline.from_columns(
+                self.cycle[i], self.pid[i], self.resource[i], self.state[i], self.duration[i]
+            )
+        return self.cycle[i], self.pid[i], self.resource[i], self.state[i]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SyncTimeline):
+            return NotImplemented
+        return all(getattr(self, col) == getattr(other, col) for col in self.COLUMNS)
+
+    def __repr__(self) -> str:
+        return f"SyncTimeline({len(self)} filas)"
+
+    def rows(self) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Filas completas (cycle, pid_id, resource_id, state, duration)."""
+        return zip(self.cycle, self.pid, self.resource, self.state, self.duration)
+
+    def between(self, c0: int, c1: int) -> 'SyncTimeline':
+        """
+        Filas que se cruzan con los ciclos [c0, c1). Arma un WindowIndex en cada
+        llamada: para consultar muchas ventanas conviene armarlo una vez.
+        """
+        keep = sorted(WindowIndex(self).rows(c0, c1))
+        return SyncTimeline.from_columns(
+            *([col[i] for i in keep] for col in (getattr(self, name) for name in self.COLUMNS))
+        )
+
+    def named(self, pids: Sequence[str], resources: Sequence[str],
+              states: Sequence[str]) -> 'NamedRows':
+        """Vista con nombres: (cycle, pid, resource, state)."""
+        return NamedRows(
+            self, lambda row: (row[0], pids[row[1]], resources[row[2]], states[row[3]])
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).itemsize * len(self) for name in self.COLUMNS)
+
+
+class NamedRows:
+    """
+    Vista de solo lectura de un Timeline / SyncTimeline que traduce cada fila a
+    nombres al leerla: no copia las columnas. Admite len, índices, slices (lista)
+    e igualdad con otra secuencia de tuplas.
+    """
+    __slots__ = ('_timeline', '_label')
+
+    def __init__(self, timeline, label):
+        self._timeline = timeline
+        self._label = label
+
+    def __len__(self) -> int:
+        return len(self._timeline)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return map(self._label, self._timeline)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._label(row) for row in self._timeline[i]]
+        return self._label(self._timeline[i])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (NamedRows, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"NamedRows({len(self)} filas)"
+
+
+class CoverageIndex:
+    """
+    Índice para resumir un Timeline / SyncTimeline a cualquier escala. Por clave
+    (pid_id, o (pid_id, state) en sincronización) guarda los intervalos ocupados,
+    unidos y ordenados, con la suma acumulada de sus largos. El tiempo ocupado en
+    cualquier [t0, t1) sale con dos bisecciones: agregar a cubetas de cualquier
+    ancho cuesta O(log n) por cubeta y nunca vuelve a recorrer el timeline.
+    """
+    __slots__ = ('_starts', '_ends', '_acc')
+
+    def __init__(self, timeline: Union[Timeline, SyncTimeline]):
+        if isinstance(timeline, SyncTimeline):
+            keys = zip(timeline.pid, timeline.state)
+            starts = timeline.cycle
+            ends = map(int.__add__, timeline.cycle, timeline.duration)
+        else:
+            keys, starts, ends = timeline.pid, timeline.start, timeline.end
+        merged: Dict[Hashable, Tuple[List[int], List[int]]] = {}
+        for key, start, end in zip(keys, starts, ends):
+            if end <= start:
+                continue
+            runs = merged.get(key)
+            if runs is None:
+                runs = merged[key] = ([], [])
+            s, e = runs
+            # filas en orden de inicio: basta con unir contra el último intervalo
+            if e and start <= e[-1]:
+                if end > e[-1]:
+                    e[-1] = end
+            else:
+                s.append(start)
+                e.append(end)
+        self._starts: Dict[Hashable, array] = {}
+        self._ends: Dict[Hashable, array] = {}
+        self._acc: Dict[Hashable, array] = {}
+        for key, (s, e) in merged.items():
+            acc = array('q', [0])
+            total = 0
+            for a, b in zip(s, e):
+                total += b - a
+                acc.append(total)
+            self._starts[key] = array('q', s)
+            self._ends[key] = array('q', e)
+            self._acc[key] = acc
+
+    def keys(self) -> Iterable[Hashable]:
+        return self._starts.keys()
+
+    def _cumulative(self, key: Hashable, t: int) -> int:
+        # tiempo ocupado antes de t
+        starts = self._starts[key]
+        j = bisect_right(starts, t)
+        if j == 0:
+            return 0
+        return self._acc[key][j - 1] + min(t, self._ends[key][j - 1]) - starts[j - 1]
+
+    def busy(self, key: Hashable, t0: int, t1: int) -> int:
+        """Tiempo ocupado de key dentro de [t0, t1)."""
+        if key not in self._starts:
+            return 0
+        return self._cumulative(key, t1) - self._cumulative(key, t0)
+
+    def next_busy(self, key: Hashable, t: int) -> Optional[int]:
+        """Primer instante >= t en que key está ocupado (None si ya no hay más)."""
+        starts = self._starts.get(key)
+        if starts is None:
+            return None
+        j = bisect_right(starts, t)
+        if j > 0 and self._ends[key][j - 1] > t:
+            return t
+        return starts[j] if j < len(starts) else None
+
+
+class PidIndex:
+    """
+    Índice por pid de un Timeline / SyncTimeline en formato CSR: las filas de
+    cada grupo (pid, o (pid, state) en sincronización) quedan contiguas en rows,
+    en orden de inicio, entre offsets[g] y offsets[g + 1]. Junto a cada una se
+    guarda su inicio (starts) y el máximo de los fines hasta ella dentro del
+    grupo (reach, no decreciente). Ubicar la fila que cubre un instante cuesta
+    dos bisecciones (O(log n)) aunque haya retenciones largas, sin recorrer
+    el timeline. Se construye en O(n) con un counting sort por grupo.
+    """
+    __slots__ = ('n_states', 'offsets', 'rows', 'starts', 'reach')
+
+    def __init__(self, timeline: Union[Timeline, SyncTimeline]):
+        pids = timeline.pid
+        if isinstance(timeline, SyncTimeline):
+            self.n_states = max(timeline.state, default=0) + 1
+            keys = [pid * self.n_states + state for pid, state in zip(pids, timeline.state)]
+            starts = timeline.cycle
+            ends = array('q', map(int.__add__, timeline.cycle, timeline.duration))
+        else:
+            self.n_states = 1
+            keys, starts, ends = pids, timeline.start, timeline.end
+        counts = [0] * ((max(pids, default=-1) + 1) * self.n_states)
+        for key in keys:
+            counts[key] += 1
+        offsets = array('q', [0])
+        total = 0
+        for n in counts:
+            total += n
+            offsets.append(total)
+        # el timeline ya está en orden de inicio: repartir en orden lo mantiene
+        rows = array('q', bytes(8 * len(pids)))
+        pos = offsets[:-1]
+        for i, key in enumerate(keys):
+            rows[pos[key]] = i
+            pos[key] += 1
+        reach = array('q', bytes(8 * len(pids)))
+        for g in range(len(counts)):
+            top = None
+            for j in range(offsets[g], offsets[g + 1]):
+                end = ends[rows[j]]
+                if top is None or end > top:
+                    top = end
+                reach[j] = top
+        self.offsets = offsets
+        self.rows = rows
+        self.starts = array('q', [starts[i] for i in rows])
+        self.reach = reach
+
+    def __len__(self) -> int:
+        """Cantidad de pids (ids 0..len-1)."""
+        return (len(self.offsets) - 1) // self.n_states
+
+    def _groups(self, pid: int, state: Optional[int]) -> Iterator[Tuple[int, int]]:
+        if not 0 <= pid < len(self):
+            return
+        states = range(self.n_states) if state is None else (state,)
+        for s in states:
+            if 0 <= s < self.n_states:
+                g = pid * self.n_states + s
+                yield self.offsets[g], self.offsets[g + 1]
+
+    def rows_of(self, pid: int) -> array:
+        """Índices (en el timeline) de las filas de pid, en orden."""
+        return array('q', sorted(i for lo, hi in self._groups(pid, None) for i in self.rows[lo:hi]))
+
+    def first_row(self, pid: int) -> Optional[int]:
+        """Índice de la primera fila de pid (None si no tiene)."""
+        return min((self.rows[lo] for lo, hi in self._groups(pid, None) if hi > lo), default=None)
+
+    def find(self, pid: int, t: int, state: Optional[int] = None,
+             upto: Optional[int] = None, until: Optional[int] = None) -> Optional[int]:
+        """
+        Índice de una fila de pid que cubre el instante t (None si no hay). En
+        sincronización puede filtrarse por state; si varias filas lo cubren
+        gana la que empezó antes. upto: solo filas con índice < upto (las ya
+        reveladas de una animación). until: si ninguna cubre t, la primera que
+        empieza en [t, until) (un pixel abarca varias unidades al alejarse).
+        """
+        found = following = None
+        for lo, hi in self._groups(pid, state):
+            if upto is not None:
+                # dentro del grupo los índices son crecientes: upto recorta el final
+                hi = bisect_left(self.rows, upto, lo, hi)
+            j = bisect_right(self.starts, t, lo, hi)
+            # primera fila (entre las que empiezan a más tardar en t) que termina después de t
+            k = bisect_right(self.reach, t, lo, j)
+            if k < j:
+                i = self.rows[k]
+                if found is None or i < found:
+                    found = i
+            elif until is not None and found is None:
+                k = bisect_left(self.starts, t, lo, hi)
+                if k < hi and self.starts[k] < until:
+                    i = self.rows[k]
+                    if following is None or i < following:
+                        following = i
+        return found if found is not None else following
+
+
+class WindowIndex:
+    """
+    Filas que se cruzan con una ventana de tiempo [t0, t1).
+
+    En un Timeline (una CPU) los segmentos no se solapan y Timeline.span da el
+    rango exacto. En un SyncTimeline las retenciones se solapan: una sola
+    retención larga haría que cualquier rango contiguo de índices abarque casi
+    todo el timeline. Por eso las filas se reparten en niveles por duración
+    (nivel k: duración <= 2^k) y cada nivel guarda, en orden de inicio, el
+    índice y el inicio de sus filas. Las candidatas de un nivel son las que
+    empiezan en [t0 - 2^k + 1, t1): una bisección por nivel, y solo filas
+    cercanas a la ventana, sin importar cuánto dure la más larga.
+    """
+    __slots__ = ('_timeline', '_levels', 'end')
+
+    def __init__(self, timeline: Union[Timeline, SyncTimeline]):
+        self._timeline = timeline
+        self._levels: Optional[List[Tuple[int, array, array]]] = None
+        if not isinstance(timeline, SyncTimeline):
+            self.end = timeline.end[-1] if timeline else 0
+            return
+        rows: Dict[int, List[int]] = {}
+        top = 0
+        for i, (cycle, duration) in enumerate(zip(timeline.cycle, timeline.duration)):
+            rows.setdefault(max(duration - 1, 0).bit_length(), []).append(i)
+            if cycle + duration > top:
+                top = cycle + duration
+        self.end = top   # fin del timeline (exclusivo)
+        cycle = timeline.cycle
+        self._levels = [
+            (1 << k, array('q', idx), array('q', [cycle[i] for i in idx]))
+            for k, idx in sorted(rows.items())
+        ]
+
+    def _ranges(self, t0: int, t1: int, upto: Optional[int]) -> Iterator[Tuple[Sequence[int], int, int]]:
+        # (índices del nivel, lo, hi): candidatas en posiciones [lo, hi) del nivel
+        if self._levels is None:
+            lo, hi = self._timeline.span(t0, t1)
+            if upto is not None:
+                hi = max(lo, min(hi, upto))
+            yield range(len(self._timeline)), lo, hi
+            return
+        for width, rows, starts in self._levels:
+            lo = bisect_left(starts, t0 - width + 1)
+            hi = bisect_left(starts, t1, lo)
+            if upto is not None:
+                hi = bisect_left(rows, upto, lo, hi)
+            yield rows, lo, hi
+
+    def count(self, t0: int, t1: int, upto: Optional[int] = None) -> int:
+        """Cota superior de las filas (con índice < upto) que se cruzan con [t0, t1)."""
+        return sum(hi - lo for _, lo, hi in self._ranges(t0, t1, upto))
+
+    def rows(self, t0: int, t1: int, upto: Optional[int] = None) -> Iterator[int]:
+        """Índices de las filas (con índice < upto) que se cruzan con [t0, t1)."""
+        tl = self._timeline
+        if self._levels is None:
+            for rows, lo, hi in self._ranges(t0, t1, upto):
+                yield from rows[lo:hi]
+            return
+        cycle, duration = tl.cycle, tl.duration
+        for rows, lo, hi in self._ranges(t0, t1, upto):
+            for p in range(lo, hi):
+                i = rows[p]
+                if cycle[i] + duration[i] > t0:
+                    yield i
+
+    def touches(self, t0: int, t1: int, first: int, last: int) -> bool:
+        """¿Alguna fila con índice en [first, last) puede cruzarse con [t0, t1)?"""
+        for rows, lo, hi in self._ranges(t0, t1, None):
+            p = bisect_left(rows, first, lo, hi)
+            if p < hi and rows[p] < last:
+                return True
+        return False
+
+    def start_of(self, i: int) -> int:
+        """Inicio de la fila i."""
+        tl = self._timeline
+        return tl.cycle[i] if self._levels is not None else tl.start[i]
+
+
+class TimelineIndex:
+    """
+    Todo lo que el Gantt necesita precalcular sobre un timeline, armado una vez
+    por resultado (en el hilo de la simulación, no en el de Tk):
+      - pids: PidIndex (click y tooltip)
+      - window: WindowIndex (filas visibles y fin del timeline, window.end)
+      - coverage: CoverageIndex (resumen por cubetas al alejarse)
+      - row_of / pid_of_row: fila de cada pid en orden de primera aparición
+        (-1 si no aparece) y pid de cada fila
+    """
+    __slots__ = ('pids', 'window', 'coverage', 'row_of', 'pid_of_row')
+
+    def __init__(self, timeline: Union[Timeline, SyncTimeline], n_pids: int,
+                 pids: Optional[PidIndex] = None):
+        self.pids = pids if pids is not None else PidIndex(timeline)
+        self.window = WindowIndex(timeline)
+        self.coverage = CoverageIndex(timeline)
+        first = [(self.pids.first_row(pid), pid) for pid in range(min(n_pids, len(self.pids)))]
+        self.pid_of_row = [pid for row, pid in sorted(f for f in first if f[0] is not None)]
+        self.row_of = [-1] * n_pids
+        for row, pid in enumerate(self.pid_of_row):
+            self.row_of[pid] = row
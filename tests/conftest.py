@@ -0,0 +1,33 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# los módulos se importan como en src/main.py: con src/ en el path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from data_io.process_loader import Process  # noqa: E402
+from data_io.sync_loader import Resource, Action  # noqa: E402
+
+
+@pytest.fixture
+def sync_input():
+    """
+    Fábrica de entradas de sincronización al azar: (processes, resources, actions).
+    Incluye pids y recursos que no están declarados (PX, RZ), recursos con count
+    <= 0 y ciclos negativos; durations elige la duración de cada acción.
+    """
+    def make(seed, n_actions=40, n_processes=4, n_resources=3, max_cycle=8, durations=(1,)):
+        rng = random.Random(seed)
+        processes = [Process(f"P{k}", 1, 0, 0) for k in range(n_processes)]
+        resources = [Resource(f"R{k}", rng.randint(-1, 3)) for k in range(n_resources)]
+        pids = [p.pid for p in processes] + ['PX']
+        names = [r.name for r in resources] + ['RZ']
+        actions = [
+            Action(rng.choice(pids), rng.choice(['READ', 'WRITE']), rng.choice(names),
+                   rng.randint(-2, max_cycle), rng.choice(durations))
+            for _ in range(n_actions)
+        ]
+        return processes, resources, actions
+    return make
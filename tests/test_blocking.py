@@ -0,0 +1,121 @@
+from collections import deque
+
+import pytest
+
+from data_io.process_loader import Process
+from data_io.sync_loader import Action, prepare_trace
+from synchronization.blocking import simulate_blocking
+from synchronization.engine import ACCESED, WAITING, capacities
+
+
+def _naive_blocking(processes, counts, actions):
+    """
+    Bloqueante ciclo a ciclo: al empezar cada ciclo se liberan las retenciones que
+    vencen y se atienden las colas (por id de recurso, cada una en orden FIFO);
+    después llegan las acciones del ciclo, en orden del archivo, detrás de las que
+    ya esperan.
+    """
+    trace = prepare_trace(actions, (p.pid for p in processes), counts)
+    capacity = capacities(trace, counts)
+    pnames, rnames = trace.pids.names, trace.resources.names
+    rows, waits = [], {}
+    wait_durations = {pnames[k]: 0 for k in range(trace.n_processes)}
+    max_queue, queues, holds = {}, {}, []
+    in_use = [0] * len(rnames)
+    by_cycle = {}
+    for i, c in enumerate(trace.cycle):
+        by_cycle.setdefault(c, []).append(i)
+    last = max(by_cycle, default=-1)
+
+    def grant(c, pid, r, duration):
+        in_use[r] += 1
+        holds.append((c + duration, r))
+        rows.append((c, pid, r, ACCESED, duration))
+
+    c = 0
+    while c <= last or holds:
+        freed = sorted({r for end, r in holds if end == c})
+        for end, r in [h for h in holds if h[0] == c]:
+            holds.remove((end, r))
+            in_use[r] -= 1
+        for r in freed:
+            queue = queues.get(r)
+            while queue and in_use[r] < capacity[r]:
+                pid, requested, duration = queue.popleft()
+                wait_durations[pnames[pid]] = wait_durations.get(pnames[pid], 0) + c - requested
+                grant(c, pid, r, duration)
+        for i in by_cycle.get(c, ()):
+            pid, r = trace.pid[i], trace.resource[i]
+            if not queues.get(r) and in_use[r] < capacity[r]:
+                grant(c, pid, r, trace.duration[i])
+                continue
+            queue = queues.setdefault(r, deque())
+            queue.append((pid, c, trace.duration[i]))
+            waits[pid] = waits.get(pid, 0) + 1
+            max_queue[rnames[r]] = max(max_queue.get(rnames[r], 0), len(queue))
+            rows.append((c, pid, r, WAITING, 1))
+        c += 1
+    pending = [(pnames[pid], rnames[r], requested)
+               for r, queue in queues.items() for pid, requested, _ in queue]
+    return rows, waits, wait_durations, max_queue, pending
+
+
+def _random_case(rng):
+    processes = [Process(f"P{k}", 1, 0, 0) for k in range(rng.randint(0, 4))]
+    counts = {f"R{k}": rng.randint(0, 2) for k in range(rng.randint(1, 3))}
+    pids = [p.pid for p in processes] + ['PX']
+    names = list(counts) + ['RZ']
+    actions = [Action(rng.choice(pids), 'READ', rng.choice(names), rng.randint(-1, 10),
+                      rng.choice([1, 1, 2, 4]))
+               for _ in range(rng.randint(0, 25))]
+    return processes, counts, actions
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_blocking_matches_cycle_by_cycle_reference(seed):
+    import random
+    processes, counts, actions = _random_case(random.Random(seed))
+    res = simulate_blocking(processes, counts, actions)
+    rows, waits, wait_durations, max_queue, pending = _naive_blocking(processes, counts, actions)
+    assert list(res.segments.rows()) == rows
+    assert res.waits == {**dict.fromkeys(range(len(processes)), 0), **waits}
+    assert res.wait_durations == wait_durations
+    assert res.max_queue_lengths == max_queue
+    assert res.pending == pending
+    assert res.deadlocks == []
+
+
+def _named_rows(res, state):
+    return [(c, res.pids.names[p], d) for c, p, _, s, d in res.segments.rows() if s == state]
+
+
+def test_queue_is_served_in_fifo_order():
+    # R1 ocupado hasta el ciclo 3: B y C esperan y pasan en orden; D llega justo en 3
+    # y queda detrás de ellos aunque en ese ciclo se libera capacidad
+    actions = [Action('A', 'READ', 'R1', 0, 3), Action('B', 'READ', 'R1', 1),
+               Action('C', 'READ', 'R1', 2), Action('D', 'READ', 'R1', 3)]
+    res = simulate_blocking([], {'R1': 1}, actions)
+    assert _named_rows(res, ACCESED) == [(0, 'A', 3), (3, 'B', 1), (4, 'C', 1), (5, 'D', 1)]
+    assert _named_rows(res, WAITING) == [(1, 'B', 1), (2, 'C', 1), (3, 'D', 1)]
+    assert res.wait_durations == {'B': 2, 'C': 2, 'D': 2}
+    assert res.waiting_counts == {'B': 1, 'C': 1, 'D': 1}
+    assert res.max_queue_lengths == {'R1': 2}
+    assert res.pending == []
+
+
+def test_capacity_frees_several_waiters_at_once():
+    actions = [Action('A', 'READ', 'R1', 0, 2), Action('B', 'READ', 'R1', 0, 2),
+               Action('C', 'READ', 'R1', 0), Action('D', 'READ', 'R1', 1), Action('E', 'READ', 'R1', 1)]
+    res = simulate_blocking([], {'R1': 2}, actions)
+    assert _named_rows(res, ACCESED) == [(0, 'A', 2), (0, 'B', 2), (2, 'C', 1), (2, 'D', 1), (3, 'E', 1)]
+    assert res.max_queue_lengths == {'R1': 3}
+    assert res.wait_durations == {'C': 2, 'D': 1, 'E': 2}
+
+
+def test_resources_without_capacity_stay_pending():
+    actions = [Action('A', 'READ', 'R0', 0), Action('B', 'READ', 'RZ', 1), Action('A', 'READ', 'R1', 1)]
+    res = simulate_blocking([Process('A', 1, 0, 0), Process('B', 1, 0, 0)], {'R0': 0, 'R1': 1}, actions)
+    assert res.pending == [('A', 'R0', 0), ('B', 'RZ', 1)]
+    assert res.max_queue_lengths == {'R0': 1, 'RZ': 1}
+    assert res.wait_durations == {'A': 0, 'B': 0}
+    assert _named_rows(res, ACCESED) == [(1, 'A', 1)]
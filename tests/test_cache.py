@@ -0,0 +1,113 @@
+import pytest
+
+from core import scheduler, sync_engine
+from core.comparison import compare
+from data_io.process_loader import Process, prepare_workload
+from data_io.sync_loader import Action, Resource, prepare_trace
+
+
+@pytest.fixture(autouse=True)
+def _empty_caches():
+    scheduler.clear_cache()
+    sync_engine.clear_cache()
+    yield
+    scheduler.clear_cache()
+    sync_engine.clear_cache()
+
+
+def _counting(monkeypatch, module, name):
+    calls = []
+    real = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return real(*args, **kwargs)
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
+def _sync_data():
+    processes = [Process('P1', 1, 0, 0), Process('P2', 1, 0, 0)]
+    resources = [Resource('R1', 1), Resource('R2', 2)]
+    actions = [Action('P1', 'READ', 'R1', 0, 3), Action('P2', 'WRITE', 'R1', 1),
+               Action('P2', 'READ', 'R2', 1), Action('P3', 'READ', 'RZ', 2)]
+    return processes, resources, actions
+
+
+def _trace(processes, resources, actions):
+    return prepare_trace(actions, (p.pid for p in processes), (r.name for r in resources))
+
+
+def test_sync_hit_returns_the_cached_result_without_simulating(monkeypatch):
+    processes, resources, actions = _sync_data()
+    calls = _counting(monkeypatch, sync_engine, '_simulate')
+    trace = _trace(processes, resources, actions)
+    first = sync_engine.run_synchronization(processes, resources, trace)
+    assert sync_engine.run_synchronization(processes, resources, trace) is first
+    # la misma entrada como lista de Action cae en la misma clave
+    assert sync_engine.run_synchronization(processes, resources, actions) is first
+    assert len(calls) == 1
+    assert sync_engine.cache_info()[:2] == (2, 1)
+
+
+def test_trace_fingerprint_is_computed_once(monkeypatch):
+    trace = _trace(*_sync_data())
+    fp = trace.fingerprint
+    monkeypatch.setattr(trace, 'pid', None)  # ya no se vuelven a leer las columnas
+    assert trace.fingerprint == fp
+
+
+@pytest.mark.parametrize('change', [
+    lambda p, r, a: (p, r, a[:-1]),
+    lambda p, r, a: (p, r, a[:1] + [Action('P2', 'READ', 'R1', 1)] + a[2:]),    # WRITE -> READ
+    lambda p, r, a: (p, r, [Action(x.pid, x.action, x.resource, x.cycle, 1) for x in a]),
+    lambda p, r, a: (p[::-1], r, a),                                             # otro orden de pids
+    lambda p, r, a: (p, [Resource('R1', 2), Resource('R2', 2)], a),              # otro count
+    lambda p, r, a: (p, r[::-1], a),
+])
+def test_different_input_is_a_miss(change, monkeypatch):
+    processes, resources, actions = _sync_data()
+    calls = _counting(monkeypatch, sync_engine, '_simulate')
+    first = sync_engine.run_synchronization(processes, resources, actions)
+    other = sync_engine.run_synchronization(*change(processes, resources, actions))
+    assert other is not first and len(calls) == 2
+
+
+def test_mode_and_options_are_part_of_the_key(monkeypatch):
+    processes, resources, actions = _sync_data()
+    calls = _counting(monkeypatch, sync_engine, '_simulate')
+    trace = _trace(processes, resources, actions)
+    for kwargs in ({}, {'mode': 'semaphore'}, {'blocking': True},
+                   {'mode': 'rwlock'}, {'mode': 'rwlock', 'rw_policy': 'writers'}):
+        sync_engine.run_synchronization(processes, resources, trace, **kwargs)
+    assert len(calls) == 5
+
+
+def test_use_cache_false_always_simulates(monkeypatch):
+    processes, resources, actions = _sync_data()
+    calls = _counting(monkeypatch, sync_engine, '_simulate')
+    trace = _trace(processes, resources, actions)
+    a = sync_engine.run_synchronization(processes, resources, trace, use_cache=False)
+    b = sync_engine.run_synchronization(processes, resources, trace, use_cache=False)
+    assert a is not b and len(calls) == 2
+    assert a.segments == b.segments
+
+
+def test_schedule_hit_returns_the_cached_result_without_simulating(monkeypatch):
+    wl = prepare_workload([Process(f"P{k}", 1 + k % 3, k, 0) for k in range(20)])
+    calls = _counting(monkeypatch, scheduler, '_simulate')
+    first = scheduler.run_scheduling(wl, 'rr', quantum=2)
+    assert scheduler.run_scheduling(wl, 'rr', quantum=2) is first
+    assert scheduler.run_scheduling(wl.processes(), 'rr', quantum=2) is first
+    assert scheduler.run_scheduling(wl, 'rr', quantum=3) is not first
+    assert len(calls) == 2
+
+
+def test_comparison_shares_the_scheduling_cache(monkeypatch):
+    wl = prepare_workload([Process(f"P{k}", 1 + k % 3, k, k % 2) for k in range(20)])
+    calls = _counting(monkeypatch, scheduler, '_simulate')
+    fifo = scheduler.run_scheduling(wl, 'fifo')
+    results = compare(wl, [('fifo', {}), ('rr', {'quantum': 2})], max_workers=1)
+    assert results[0] is fifo
+    assert scheduler.run_scheduling(wl, 'rr', quantum=2) is results[1]
+    assert len(calls) == 2
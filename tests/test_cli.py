@@ -0,0 +1,143 @@
+import csv
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cli
+from core.scheduler import run_scheduling
+from core.sweep import sweep_quantum
+from data_io.process_loader import load_processes
+from data_io.sync_loader import load_actions
+from utils.metrics import compute_avg_waiting_time
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+
+
+def _csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def _run(*argv):
+    return cli.main([str(a) for a in argv])
+
+
+def test_schedule_writes_metrics_and_timelines(tmp_path):
+    assert _run('schedule', DATA / 'processes.txt', '-a', 'fifo', 'rr', '-q', 3, '-o', tmp_path) == 0
+    metrics = _csv(tmp_path / 'metrics.csv')
+    assert [(row['algorithm'], row['quantum']) for row in metrics] == [('fifo', ''), ('rr', '3')]
+    processes = load_processes(DATA / 'processes.txt')
+    fifo = run_scheduling(processes, 'fifo', use_cache=False)
+    assert float(metrics[0]['awt']) == round(compute_avg_waiting_time(fifo.waiting_times), 4)
+    assert int(metrics[0]['processes']) == len(processes)
+    timelines = _csv(tmp_path / 'timelines.csv')
+    assert [(r['pid'], int(r['start']), int(r['end'])) for r in timelines if r['algorithm'] == 'fifo'] == \
+        [(fifo.symbols.names[p], s, e) for p, s, e in fifo.segments]
+
+
+def test_schedule_takes_directories_and_jsonl(tmp_path):
+    assert _run('schedule', DATA, '-a', 'sjf', '-f', 'jsonl', '--no-timeline', '-o', tmp_path) == 0
+    rows = [json.loads(line) for line in open(tmp_path / 'metrics.jsonl', encoding='utf-8')]
+    assert [(row['workload'], row['algorithm']) for row in rows] == [(str(DATA / 'processes.txt'), 'sjf')]
+    assert not (tmp_path / 'timelines.jsonl').exists()
+
+
+def test_schedule_rr_requires_quantum(tmp_path, capsys):
+    assert _run('schedule', DATA / 'processes.txt', '-a', 'rr', '-o', tmp_path) == 2
+    assert 'error' in capsys.readouterr().err
+
+
+def test_sync_runs_every_mode(tmp_path):
+    assert _run('sync', DATA, '-m', 'mutex', 'semaphore', 'rwlock', '-o', tmp_path) == 0
+    metrics = _csv(tmp_path / 'metrics.csv')
+    n_actions = len(load_actions(DATA / 'actions.txt'))
+    assert [row['mode'] for row in metrics] == ['mutex', 'semaphore', 'rwlock']
+    assert all(int(row['actions']) == n_actions for row in metrics)
+    timelines = _csv(tmp_path / 'timelines.csv')
+    for row in metrics:
+        mode_rows = [r for r in timelines if r['mode'] == row['mode']]
+        assert sum(r['state'] == 'ACCESED' for r in mode_rows) == int(row['accesses'])
+        assert sum(r['state'] == 'WAITING' for r in mode_rows) == int(row['total_waits'])
+
+
+def test_sync_stream_matches_in_memory(tmp_path):
+    assert _run('sync', DATA, '-o', tmp_path / 'mem') == 0
+    assert _run('sync', DATA, '--stream', '-o', tmp_path / 'stream') == 0
+    assert _csv(tmp_path / 'stream' / 'metrics.csv') == _csv(tmp_path / 'mem' / 'metrics.csv')
+    assert _csv(tmp_path / 'stream' / 'timelines.csv') == _csv(tmp_path / 'mem' / 'timelines.csv')
+
+
+def test_sync_hold_and_wait_writes_deadlocks(tmp_path):
+    assert _run('sync', DATA, '--hold-and-wait', '-o', tmp_path) == 0
+    with open(tmp_path / 'deadlocks.csv', newline='', encoding='utf-8') as f:
+        assert next(csv.reader(f)) == cli.DEADLOCK_FIELDS
+
+
+@pytest.mark.parametrize('flags', [['--blocking'], ['--stream'], ['--hold-and-wait']])
+def test_sync_rejects_rwlock_with_blocking_or_stream(tmp_path, flags, capsys):
+    assert _run('sync', DATA, '-m', 'rwlock', *flags, '-o', tmp_path) == 2
+    assert 'error' in capsys.readouterr().err
+
+
+def test_sweep_writes_one_row_per_quantum(tmp_path):
+    assert _run('sweep', DATA / 'processes.txt', '-q', '1:3', 5, '-o', tmp_path) == 0
+    rows = _csv(tmp_path / 'sweep.csv')
+    expected = sweep_quantum(load_processes(DATA / 'processes.txt'), [1, 2, 3, 5])
+    assert [int(row['quantum']) for row in rows] == [1, 2, 3, 5]
+    assert [float(row['awt']) for row in rows] == [round(row['awt'], 6) for row in expected]
+
+
+def test_parse_quanta():
+    assert cli.parse_quanta(['1:4', '8', '10:16:3']) == [1, 2, 3, 4, 8, 10, 13, 16]
+
+
+@pytest.mark.parametrize('argv', [
+    ['schedule', 'missing/processes.txt'],
+    ['sync', 'missing'],
+    ['sweep', 'missing/processes.txt', '-q', '2'],
+])
+def test_missing_input_fails_cleanly(tmp_path, argv, capsys):
+    assert _run(*argv, '-o', tmp_path) == 1
+    err = capsys.readouterr().err
+    assert err.startswith('error:') and 'missing' in err
+
+
+def _sync_folder(tmp_path, actions):
+    folder = tmp_path / 'in'
+    folder.mkdir()
+    (folder / 'processes.txt').write_text('P1, 3, 0, 1\n')
+    (folder / 'resources.txt').write_text('R1, 1\n')
+    (folder / 'actions.txt').write_text(actions)
+    return folder
+
+
+@pytest.mark.parametrize('actions', ['P1, READ, R1\n', 'P1, READ, R1, 0, 0\n', 'P1, READ, R1, x\n'])
+def test_invalid_actions_fail_cleanly(tmp_path, actions, capsys):
+    folder = _sync_folder(tmp_path, actions)
+    assert _run('sync', folder, '-o', tmp_path / 'out') == 1
+    assert capsys.readouterr().err.startswith('error:')
+
+
+@pytest.mark.parametrize('command', [['schedule'], ['sweep', '-q', '2']])
+def test_invalid_processes_fail_cleanly(tmp_path, command, capsys):
+    bad = tmp_path / 'processes.txt'
+    bad.write_text('P1, x, 0, 1\n')
+    assert _run(command[0], bad, *command[1:], '-o', tmp_path / 'out') == 1
+    assert capsys.readouterr().err.startswith('error:')
+
+
+def test_script_entry_point(tmp_path):
+    # como se invoca en la documentación: python src/cli.py ...
+    ok = subprocess.run([sys.executable, str(ROOT / 'src' / 'cli.py'), 'schedule', str(DATA / 'processes.txt'),
+                         '-a', 'fifo', '-o', str(tmp_path)], capture_output=True, text=True)
+    assert ok.returncode == 0 and (tmp_path / 'metrics.csv').exists()
+    bad = subprocess.run([sys.executable, str(ROOT / 'src' / 'cli.py'), 'sync', str(tmp_path / 'missing'),
+                          '-o', str(tmp_path)], capture_output=True, text=True)
+    assert bad.returncode == 1 and 'Traceback' not in bad.stderr
+    usage = subprocess.run([sys.executable, str(ROOT / 'src' / 'cli.py'), 'sweep', str(DATA)],
+                           capture_output=True, text=True)
+    assert usage.returncode == 2
@@ -0,0 +1,108 @@
+from data_io.process_loader import Process
+from data_io.sync_loader import Action
+from synchronization.blocking import simulate_blocking
+from synchronization.deadlock import Deadlock, WaitForGraph
+from synchronization.engine import ACCESED
+
+P1, P2, P3, P4 = 1, 2, 3, 4
+A, B = 10, 20
+
+
+def test_single_unit_cycle_is_a_deadlock():
+    g = WaitForGraph()
+    g.grant(P1, A)
+    g.grant(P2, B)
+    g.request(P1, B)
+    assert g.find_deadlock(P1) is None
+    g.request(P2, A)
+    assert g.find_deadlock(P2) == ((P1, P2), (A, B))
+
+
+def test_cycle_with_a_free_holder_is_not_a_deadlock():
+    # A tiene dos unidades: P1 y P3 la retienen. P1 -> B -> P2 -> A es un ciclo,
+    # pero P3 no espera nada y al liberar A destraba a P2
+    g = WaitForGraph()
+    g.grant(P1, A)
+    g.grant(P3, A)
+    g.grant(P2, B)
+    g.request(P1, B)
+    g.request(P2, A)
+    assert g.find_deadlock(P2) is None
+
+
+def test_knot_is_a_deadlock():
+    # mismo ciclo, pero ahora P3 también espera B: nada alcanzable puede avanzar
+    g = WaitForGraph()
+    g.grant(P1, A)
+    g.grant(P3, A)
+    g.grant(P2, B)
+    g.request(P1, B)
+    g.request(P2, A)
+    assert g.find_deadlock(P2) is None
+    g.request(P3, B)
+    assert g.find_deadlock(P3) == ((P1, P2, P3), (A, B))
+
+
+def test_waiting_without_holders_is_not_a_deadlock():
+    g = WaitForGraph()
+    g.grant(P1, A)
+    g.request(P1, B)  # nadie retiene B (p.ej. capacidad 0)
+    assert g.find_deadlock(P1) is None
+
+
+def test_waiting_behind_a_reported_deadlock_is_not_reported_again():
+    g = WaitForGraph()
+    g.grant(P1, A)
+    g.grant(P2, B)
+    g.request(P1, B)
+    g.request(P2, A)
+    assert g.find_deadlock(P2)
+    g.request(P4, A)
+    assert g.find_deadlock(P4) is None
+
+
+def test_release_breaks_the_wait():
+    g = WaitForGraph()
+    g.grant(P1, A)
+    g.grant(P2, B)
+    g.request(P1, B)
+    g.release(P2, B)
+    g.grant(P1, B)
+    assert not g.is_waiting(P1)
+    g.request(P2, A)
+    assert g.find_deadlock(P2) is None
+
+
+def _procs(*pids):
+    return [Process(pid, 1, 0, 0) for pid in pids]
+
+
+def test_hold_and_wait_reports_the_deadlock():
+    actions = [
+        Action('P1', 'READ', 'A', 0, 5), Action('P2', 'READ', 'B', 0, 5),
+        Action('P1', 'READ', 'B', 1), Action('P2', 'READ', 'A', 1),
+    ]
+    res = simulate_blocking(_procs('P1', 'P2'), {'A': 1, 'B': 1}, actions, hold_and_wait=True)
+    assert res.deadlocks == [Deadlock(1, ('P1', 'P2'), ('A', 'B'))]
+    assert sorted(res.pending) == [('P1', 'B', 1), ('P2', 'A', 1)]
+
+
+def test_without_hold_and_wait_there_is_no_deadlock():
+    actions = [
+        Action('P1', 'READ', 'A', 0, 5), Action('P2', 'READ', 'B', 0, 5),
+        Action('P1', 'READ', 'B', 1), Action('P2', 'READ', 'A', 1),
+    ]
+    res = simulate_blocking(_procs('P1', 'P2'), {'A': 1, 'B': 1}, actions)
+    assert res.deadlocks == [] and res.pending == []
+
+
+def test_deferred_release_stretches_the_access_row():
+    # P0 retiene A y queda esperando B (de P1 hasta el ciclo 5): A se libera en 6
+    actions = [
+        Action('P1', 'READ', 'B', 0, 5), Action('P0', 'READ', 'A', 1),
+        Action('P0', 'READ', 'B', 1), Action('P2', 'READ', 'A', 2),
+    ]
+    res = simulate_blocking(_procs('P0', 'P1', 'P2'), {'A': 1, 'B': 1}, actions, hold_and_wait=True)
+    rows = [(c, res.pids.names[p], res.resources.names[r], d)
+            for c, p, r, state, d in res.segments.rows() if state == ACCESED]
+    assert rows == [(0, 'P1', 'B', 5), (1, 'P0', 'A', 5), (5, 'P0', 'B', 1), (6, 'P2', 'A', 1)]
@@ -0,0 +1,94 @@
+import random
+import time
+
+import pytest
+
+from data_io.sync_loader import Action, iter_action_cycles, load_actions
+from synchronization.blocking import simulate_blocking
+from synchronization.engine import ACCESED, WAITING, simulate_counts
+
+
+def _naive_counts(counts, actions):
+    """Ocupación ciclo a ciclo: cada acceso concedido marca uno por uno sus ciclos."""
+    busy = {}   # (recurso, ciclo) -> accesos vigentes
+    rows = []
+    for act in sorted((a for a in actions if a.cycle >= 0), key=lambda a: a.cycle):
+        if busy.get((act.resource, act.cycle), 0) < counts.get(act.resource, 0):
+            for c in range(act.cycle, act.cycle + act.duration):
+                busy[(act.resource, c)] = busy.get((act.resource, c), 0) + 1
+            rows.append((act.cycle, act.pid, act.resource, ACCESED, act.duration))
+        else:
+            rows.append((act.cycle, act.pid, act.resource, WAITING, 1))
+    return rows
+
+
+def _named(res):
+    pnames, rnames = res.pids.names, res.resources.names
+    return [(c, pnames[p], rnames[r], s, d) for c, p, r, s, d in res.segments.rows()]
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_holds_match_per_cycle_occupancy(seed):
+    rng = random.Random(seed)
+    counts = {'R0': 1, 'R1': 2, 'R2': 0}
+    actions = [Action(f"P{rng.randint(0, 3)}", 'READ', rng.choice(['R0', 'R1', 'R2', 'RZ']),
+                      rng.randint(-1, 15), rng.choice([1, 1, 2, 5, 9]))
+               for _ in range(rng.randint(0, 40))]
+    assert _named(simulate_counts([], counts, actions)) == _naive_counts(counts, actions)
+
+
+def test_hold_outlives_its_cycle():
+    actions = [Action('A', 'WRITE', 'R1', 0, 5), Action('B', 'READ', 'R1', 1),
+               Action('B', 'READ', 'R1', 4), Action('B', 'READ', 'R1', 5)]
+    res = simulate_counts([], {'R1': 1}, actions)
+    assert _named(res) == [(0, 'A', 'R1', ACCESED, 5), (1, 'B', 'R1', WAITING, 1),
+                           (4, 'B', 'R1', WAITING, 1), (5, 'B', 'R1', ACCESED, 1)]
+    assert list(res.durations) == [5, 1, 1, 1]
+
+
+def test_release_frees_capacity_for_later_action():
+    # semáforo de 2: B suelta en el ciclo 1 y deja lugar a C; A sigue hasta el 3
+    actions = [Action('A', 'READ', 'R1', 0, 3), Action('B', 'READ', 'R1', 0),
+               Action('C', 'READ', 'R1', 1, 4), Action('D', 'READ', 'R1', 2), Action('D', 'READ', 'R1', 3)]
+    res = simulate_counts([], {'R1': 2}, actions)
+    assert [(c, p, s) for c, p, _, s, _ in _named(res)] == [
+        (0, 'A', ACCESED), (0, 'B', ACCESED), (1, 'C', ACCESED), (2, 'D', WAITING), (3, 'D', ACCESED)
+    ]
+
+
+def test_blocking_waiter_starts_when_the_hold_ends():
+    actions = [Action('A', 'WRITE', 'R1', 0, 6), Action('B', 'READ', 'R1', 2, 2), Action('C', 'READ', 'R1', 7)]
+    res = simulate_blocking([], {'R1': 1}, actions)
+    assert [row for row in _named(res) if row[3] == ACCESED] == [
+        (0, 'A', 'R1', ACCESED, 6), (6, 'B', 'R1', ACCESED, 2), (8, 'C', 'R1', ACCESED, 1)
+    ]
+    assert res.wait_durations == {'B': 4, 'C': 1}
+
+
+def test_long_hold_costs_no_more_than_a_short_one():
+    # una retención de un billón de ciclos no se recorre ciclo a ciclo
+    actions = [Action('A', 'READ', 'R1', 0, 10 ** 12), Action('B', 'READ', 'R1', 10 ** 11),
+               Action('B', 'READ', 'R1', 10 ** 12)]
+    start = time.perf_counter()
+    res = simulate_counts([], {'R1': 1}, actions)
+    assert time.perf_counter() - start < 1
+    assert [s for _, _, _, s, _ in _named(res)] == [ACCESED, WAITING, ACCESED]
+
+
+def test_loader_duration_column(tmp_path):
+    path = tmp_path / 'actions.txt'
+    path.write_text('# PID, ACCION, Recurso, Ciclo[, Duracion]\n'
+                    'P1, read, R1, 0\nP2, WRITE, R1, 0, 7\nP1, READ, R2, 3, 1\n')
+    assert [(a.pid, a.action, a.cycle, a.duration) for a in load_actions(path)] == [
+        ('P1', 'READ', 0, 1), ('P2', 'WRITE', 0, 7), ('P1', 'READ', 3, 1)
+    ]
+    assert [[a.duration for a in acts] for _, acts in iter_action_cycles(path)] == [[1, 7], [1]]
+
+
+@pytest.mark.parametrize('line', ['P1, READ, R1, 0, 0', 'P1, READ, R1, 0, -2', 'P1, READ, R1, 0, 1, 2',
+                                  'P1, READ, R1, 0, x'])
+def test_loader_rejects_invalid_durations(tmp_path, line):
+    path = tmp_path / 'actions.txt'
+    path.write_text(line + '\n')
+    with pytest.raises(ValueError):
+        load_actions(path)
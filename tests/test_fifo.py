@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from data_io.process_loader import Process, prepare_workload
+from scheduling import fifo
+
+np = pytest.importorskip('numpy')
+
+
+def _workload(seed, n, max_burst=9, spread=5):
+    rng = random.Random(seed)
+    return prepare_workload([
+        Process(f"P{k}", rng.randint(0, max_burst), rng.randint(0, n * spread), rng.randint(0, 5))
+        for k in range(n)
+    ])
+
+
+def _loop(monkeypatch, fn, wl):
+    with monkeypatch.context() as m:
+        m.setattr(fifo, 'np', None)
+        return fn(wl)
+
+
+def _vectorized(monkeypatch, fn, wl):
+    with monkeypatch.context() as m:
+        m.setattr(fifo, 'VECTORIZE_MIN', 0)
+        return fn(wl)
+
+
+@pytest.mark.parametrize('seed,n,max_burst', [
+    (0, 1, 9), (1, 50, 9), (2, 3000, 9),
+    (3, 500, 0),   # todos con burst 0
+    (4, 500, 1),   # mezcla de bursts 0 y 1
+])
+def test_vectorized_schedule_matches_loop(monkeypatch, seed, n, max_burst):
+    wl = _workload(seed, n, max_burst)
+    a = _loop(monkeypatch, fifo.schedule, wl)
+    b = _vectorized(monkeypatch, fifo.schedule, wl)
+    assert a.segments == b.segments
+    assert a.waits == b.waits
+
+
+def test_vectorized_schedule_with_late_start_and_ties(monkeypatch):
+    # todos llegan juntos y tarde: la CPU arranca ociosa y respeta el orden del archivo
+    wl = prepare_workload([Process(f"P{k}", k % 3, 100, 0) for k in range(40)])
+    a = _loop(monkeypatch, fifo.schedule, wl)
+    b = _vectorized(monkeypatch, fifo.schedule, wl)
+    assert a.segments == b.segments
+    assert a.waits == b.waits
+    assert a.segments[0] == (wl.pid_ids[0], 100, 100)
+
+
+@pytest.mark.parametrize('seed,n,max_burst,spread', [
+    (5, 1, 9, 5), (6, 400, 9, 5), (7, 400, 9, 20), (8, 400, 0, 5), (9, 400, 3, 1),
+])
+def test_vectorized_busy_periods_match_loop(monkeypatch, seed, n, max_burst, spread):
+    wl = _workload(seed, n, max_burst, spread)
+    assert (_vectorized(monkeypatch, fifo.busy_periods, wl)
+            == _loop(monkeypatch, fifo.busy_periods, wl))
+
+
+def test_busy_periods_cover_the_workload():
+    wl = _workload(10, 2000, spread=12)
+    periods = fifo.busy_periods(wl)
+    assert periods[0].first == 0 and periods[-1].stop == len(wl)
+    for prev, cur in zip(periods, periods[1:]):
+        assert prev.stop == cur.first
+        assert prev.end < cur.start
+    assert all(start < end for start, end in fifo.idle_gaps(periods))
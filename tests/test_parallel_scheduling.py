@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from core.scheduler import ALGORITHMS, run_scheduling
+from data_io.process_loader import Process, prepare_workload
+from scheduling.fifo import busy_periods
+
+
+def _workload(seed, n, max_burst=9, spread=12):
+    rng = random.Random(seed)
+    return prepare_workload([
+        Process(f"P{k}", rng.randint(0, max_burst), rng.randint(0, n * spread), rng.randint(0, 5))
+        for k in range(n)
+    ])
+
+
+def _assert_same(serial, parallel):
+    assert serial.segments == parallel.segments
+    assert serial.waits == parallel.waits
+    assert serial.completion_times == parallel.completion_times
+
+
+@pytest.mark.parametrize('alg', ALGORITHMS)
+def test_parallel_matches_serial(alg):
+    wl = _workload(1, 3000)
+    assert len(busy_periods(wl)) > 8  # hay trozos para repartir
+    serial = run_scheduling(wl, alg, quantum=2, use_cache=False, workers=1)
+    parallel = run_scheduling(wl, alg, quantum=2, use_cache=False, workers=2)
+    _assert_same(serial, parallel)
+
+
+@pytest.mark.parametrize('alg', ALGORITHMS)
+def test_parallel_matches_serial_with_zero_bursts(alg):
+    # bursts 0 en los bordes de los periodos: un proceso instantáneo no une periodos
+    wl = _workload(2, 2000, max_burst=2, spread=3)
+    serial = run_scheduling(wl, alg, quantum=1, use_cache=False, workers=1)
+    parallel = run_scheduling(wl, alg, quantum=1, use_cache=False, workers=2)
+    _assert_same(serial, parallel)
+
+
+def test_parallel_rr_per_quantum_matches_serial():
+    wl = _workload(3, 2000)
+    serial = run_scheduling(wl, 'rr', quantum=3, per_quantum=True, use_cache=False, workers=1)
+    parallel = run_scheduling(wl, 'rr', quantum=3, per_quantum=True, use_cache=False, workers=2)
+    _assert_same(serial, parallel)
+
+
+def test_single_busy_period_runs_serially():
+    # todos llegan en t=0: un solo periodo, no hay nada que repartir
+    wl = prepare_workload([Process(f"P{k}", 1 + k % 4, 0, k % 3) for k in range(300)])
+    assert len(busy_periods(wl)) == 1
+    _assert_same(run_scheduling(wl, 'srt', use_cache=False, workers=1),
+                 run_scheduling(wl, 'srt', use_cache=False, workers=4))
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from utils.timeline import PidIndex, SyncTimeline, Timeline
+
+
+def _schedule_timeline(rng, n, n_pids, long_every=0):
+    # en orden de inicio, con segmentos vacíos (burst 0) y, si se pide, largos
+    pid, start, end = [], [], []
+    t = 0
+    for k in range(n):
+        t += rng.randint(0, 3)
+        length = rng.choice([0, 1, 2, 5])
+        if long_every and k % long_every == 0:
+            length = 10 ** 6
+        pid.append(rng.randrange(n_pids))
+        start.append(t)
+        end.append(t + length)
+    return Timeline.from_columns(pid, start, end), list(zip(pid, start, end, [0] * n))
+
+
+def _sync_timeline(rng, n, n_pids, long_every=0):
+    rows = []
+    cycle = 0
+    for k in range(n):
+        cycle += rng.randint(0, 2)
+        duration = 1 if rng.random() < 0.6 else rng.randint(1, 6)
+        if long_every and k % long_every == 0:
+            duration = 10 ** 6
+        rows.append((cycle, rng.randrange(n_pids), rng.randrange(3), rng.randint(0, 1), duration))
+    tl = SyncTimeline(rows)
+    return tl, [(p, c, c + d, s) for c, p, _, s, d in rows]
+
+
+def _brute_find(rows, pid, t, state=None, upto=None, until=None):
+    def candidates():
+        for i, (p, start, end, s) in enumerate(rows):
+            if p == pid and (state is None or s == state) and (upto is None or i < upto):
+                yield i, start, end
+    covering = [i for i, start, end in candidates() if start <= t < end]
+    if covering:
+        return min(covering)
+    if until is not None:
+        following = [i for i, start, _ in candidates() if t <= start < until]
+        if following:
+            return min(following)
+    return None
+
+
+def _queries(rng, rows, n_pids, with_state):
+    # las retenciones largas cubren todo lo que viene después de su inicio
+    horizon = rows[-1][1] + 20 if rows else 10
+    for _ in range(300):
+        yield dict(
+            pid=rng.randrange(-1, n_pids + 1),
+            t=rng.randint(-2, horizon + 2),
+            state=rng.choice([None, 0, 1, 2]) if with_state else None,
+            upto=rng.choice([None, rng.randint(0, len(rows))]),
+            until=rng.choice([None, None, rng.randint(0, horizon + 5)]),
+        )
+
+
+@pytest.mark.parametrize('long_every', [0, 7])
+@pytest.mark.parametrize('seed', range(10))
+def test_find_matches_brute_force_on_schedules(seed, long_every):
+    rng = random.Random(seed)
+    tl, rows = _schedule_timeline(rng, rng.randint(0, 80), 5, long_every)
+    index = PidIndex(tl)
+    for q in _queries(rng, rows, 5, with_state=False):
+        assert index.find(**q) == _brute_find(rows, **q), q
+
+
+@pytest.mark.parametrize('long_every', [0, 5])
+@pytest.mark.parametrize('seed', range(10))
+def test_find_matches_brute_force_on_sync(seed, long_every):
+    rng = random.Random(100 + seed)
+    tl, rows = _sync_timeline(rng, rng.randint(0, 80), 4, long_every)
+    index = PidIndex(tl)
+    for q in _queries(rng, rows, 4, with_state=True):
+        assert index.find(**q) == _brute_find(rows, **q), q
+
+
+def test_long_hold_covers_later_instants():
+    # una retención de un millón de ciclos sigue cubriendo después de muchas filas cortas
+    rows = [(0, 0, 0, 0, 10 ** 6)] + [(c, 0, 0, 1, 1) for c in range(1, 5000)]
+    index = PidIndex(SyncTimeline(rows))
+    assert index.find(0, 999_999, state=0) == 0
+    assert index.find(0, 10 ** 6, state=0) is None
+    assert index.find(0, 4000) == 0          # ambas filas lo cubren: gana la que empezó antes
+    assert index.find(0, 4000, state=1) == 4000
+    assert index.find(0, 4000, upto=1) == 0
+    assert index.find(0, 10 ** 6 + 5, until=10 ** 6 + 10) is None
+
+
+def test_upto_hides_rows_not_yet_revealed():
+    tl = Timeline.from_columns([0, 1, 0], [0, 2, 4], [2, 4, 6])
+    index = PidIndex(tl)
+    assert index.find(0, 5) == 2
+    assert index.find(0, 5, upto=2) is None
+    assert index.find(0, 3, until=5) == 2
+    assert index.find(0, 3, upto=2, until=5) is None
+
+
+def test_rows_of_and_first_row():
+    rng = random.Random(7)
+    tl, rows = _sync_timeline(rng, 60, 4)
+    index = PidIndex(tl)
+    for pid in range(-1, 5):
+        mine = [i for i, (p, *_) in enumerate(rows) if p == pid]
+        assert list(index.rows_of(pid)) == mine
+        assert index.first_row(pid) == (mine[0] if mine else None)
@@ -0,0 +1,105 @@
+import random
+from collections import deque
+
+import pytest
+
+from data_io.process_loader import Process, prepare_workload
+from scheduling import rr
+
+
+def _naive_rr(wl, quantum):
+    """RR de a un quantum por vez, sin adelantar nada (como la versión original)."""
+    remaining = list(wl.burst)
+    finish = [0] * len(wl)
+    segments = []
+    queue = deque()
+    t = i = 0
+    while i < len(wl) or queue:
+        while i < len(wl) and wl.arrival[i] <= t:
+            queue.append(i)
+            i += 1
+        if not queue:
+            t = wl.arrival[i]
+            continue
+        k = queue.popleft()
+        run = min(quantum, remaining[k])
+        segments.append((wl.pid_ids[k], t, t + run))
+        remaining[k] -= run
+        t += run
+        while i < len(wl) and wl.arrival[i] <= t:
+            queue.append(i)
+            i += 1
+        if remaining[k] > 0:
+            queue.append(k)
+        else:
+            finish[k] = t
+    waits = {wl.pid_ids[k]: finish[k] - wl.arrival[k] - wl.burst[k] for k in range(len(wl))}
+    return segments, waits
+
+
+def _merged(segments):
+    # quantums consecutivos del mismo pid, sin hueco: un solo segmento
+    out = []
+    for pid, start, end in segments:
+        if out and out[-1][0] == pid and out[-1][2] == start:
+            out[-1] = (pid, out[-1][1], end)
+        else:
+            out.append((pid, start, end))
+    return out
+
+
+def _workload(rng, n):
+    spread = rng.choice([0, 10, 60])
+    return prepare_workload([
+        Process(f"P{k}", rng.randint(0, 12), rng.randint(0, spread), 0) for k in range(n)
+    ])
+
+
+@pytest.mark.parametrize('seed', range(150))
+def test_merged_timeline_matches_naive_rr(seed):
+    rng = random.Random(seed)
+    wl = _workload(rng, rng.randint(0, 10))
+    quantum = rng.randint(1, 5)
+    res = rr.schedule(wl, quantum=quantum)
+    segments, waits = _naive_rr(wl, quantum)
+    assert list(res.segments) == _merged(segments)
+    assert res.waits == waits
+
+
+@pytest.mark.parametrize('seed', range(150))
+def test_per_quantum_matches_naive_rr(seed):
+    rng = random.Random(1000 + seed)
+    wl = _workload(rng, rng.randint(0, 10))
+    quantum = rng.randint(1, 5)
+    res = rr.schedule(wl, quantum=quantum, per_quantum=True)
+    segments, waits = _naive_rr(wl, quantum)
+    assert list(res.segments) == segments
+    assert res.waits == waits
+
+
+def _named(res, wl):
+    return [(wl.symbols.names[p], s, e) for p, s, e in res.segments]
+
+
+def test_lone_runner_is_fast_forwarded():
+    # A corre sola hasta el primer borde de quantum en que ya llegó B (t=6)
+    wl = prepare_workload([Process('A', 10, 0, 0), Process('B', 2, 4, 0)])
+    assert _named(rr.schedule(wl, quantum=3), wl) == [('A', 0, 6), ('B', 6, 8), ('A', 8, 12)]
+
+
+def test_per_quantum_splits_the_lone_runner_stretch():
+    wl = prepare_workload([Process('A', 10, 0, 0), Process('B', 2, 4, 0)])
+    assert _named(rr.schedule(wl, quantum=3, per_quantum=True), wl) == [
+        ('A', 0, 3), ('A', 3, 6), ('B', 6, 8), ('A', 8, 11), ('A', 11, 12)
+    ]
+    alone = prepare_workload([Process('A', 7, 2, 0)])
+    assert _named(rr.schedule(alone, quantum=3, per_quantum=True), alone) == [
+        ('A', 2, 5), ('A', 5, 8), ('A', 8, 9)
+    ]
+    assert _named(rr.schedule(alone, quantum=3), alone) == [('A', 2, 9)]
+
+
+@pytest.mark.parametrize('quantum', [None, 0, -1])
+def test_quantum_is_required(quantum):
+    with pytest.raises(ValueError):
+        rr.schedule([Process('A', 1, 0, 0)], quantum=quantum)
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from data_io.sync_loader import Action, Resource
+from synchronization.engine import ACCESED, WAITING
+from synchronization.rwlock import POLICIES, simulate, simulate_rwlock
+
+
+def _rows(res, state):
+    names = res.pids.names
+    return [(c, names[p], d) for c, p, _, s, d in res.segments.rows() if s == state]
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_write_waits_for_long_reads(policy):
+    # A lee R1 durante 4 ciclos: la escritura de B espera hasta el ciclo 4, y la
+    # lectura de C en el ciclo 2 comparte el recurso con A (no hay escrituras en ese ciclo)
+    actions = [Action('A', 'READ', 'R1', 0, 4), Action('B', 'WRITE', 'R1', 2),
+               Action('C', 'READ', 'R1', 2, 3), Action('B', 'WRITE', 'R1', 4),
+               Action('B', 'WRITE', 'R1', 5)]
+    res = simulate_rwlock([], {'R1': 1}, actions, policy)
+    if policy == 'readers':
+        # la lectura de C (hasta el 5) sigue bloqueando la escritura del ciclo 4
+        assert _rows(res, ACCESED) == [(0, 'A', 4), (2, 'C', 3), (5, 'B', 1)]
+        assert _rows(res, WAITING) == [(2, 'B', 1), (4, 'B', 1)]
+    else:
+        # con prioridad de escritura C espera en el 2, y la escritura del 4 pasa
+        assert _rows(res, ACCESED) == [(0, 'A', 4), (4, 'B', 1), (5, 'B', 1)]
+        assert _rows(res, WAITING) == [(2, 'B', 1), (2, 'C', 1)]
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_long_write_blocks_every_access(policy):
+    actions = [Action('A', 'WRITE', 'R1', 0, 3), Action('B', 'READ', 'R1', 1),
+               Action('C', 'WRITE', 'R1', 2), Action('B', 'READ', 'R1', 3)]
+    res = simulate_rwlock([], {'R1': 1}, actions, policy)
+    assert _rows(res, ACCESED) == [(0, 'A', 3), (3, 'B', 1)]
+    assert res.waiting_counts == {'B': 1, 'C': 1}
+
+
+def test_readers_policy_same_cycle():
+    # en el mismo ciclo pasan todas las lecturas y la escritura espera
+    actions = [Action('A', 'READ', 'R1', 0), Action('B', 'WRITE', 'R1', 0),
+               Action('C', 'READ', 'R1', 0), Action('D', 'READ', 'R2', 0)]
+    res = simulate([], [Resource('R1', 1), Resource('R2', 1)], actions, 'readers')
+    assert _rows(res, ACCESED) == [(0, 'A', 1), (0, 'C', 1), (0, 'D', 1)]
+    assert _rows(res, WAITING) == [(0, 'B', 1)]
+
+
+def test_writers_policy_same_cycle():
+    # pasa solo la primera escritura; las lecturas del recurso esperan aunque estén
+    # antes en el archivo, y las de otro recurso no se ven afectadas
+    actions = [Action('A', 'READ', 'R1', 0), Action('B', 'WRITE', 'R1', 0),
+               Action('C', 'WRITE', 'R1', 0), Action('D', 'READ', 'R2', 0)]
+    res = simulate([], [Resource('R1', 1), Resource('R2', 1)], actions, 'writers')
+    assert _rows(res, ACCESED) == [(0, 'B', 1), (0, 'D', 1)]
+    assert _rows(res, WAITING) == [(0, 'A', 1), (0, 'C', 1)]
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_resources_without_capacity_are_never_granted(policy):
+    actions = [Action('A', 'READ', 'R0', 0), Action('B', 'WRITE', 'RZ', 0), Action('A', 'READ', 'R1', -1)]
+    res = simulate_rwlock([], {'R0': 0, 'R1': 1}, actions, policy)
+    assert _rows(res, ACCESED) == []
+    assert res.waiting_counts == {'A': 1, 'B': 1}
+
+
+@pytest.mark.parametrize('seed', range(100))
+@pytest.mark.parametrize('policy', POLICIES)
+def test_writes_are_exclusive(policy, seed):
+    rng = random.Random(seed)
+    actions = [Action(f"P{rng.randint(0, 3)}", rng.choice(['READ', 'WRITE']), f"R{rng.randint(0, 1)}",
+                      rng.randint(0, 12), rng.choice([1, 1, 3])) for _ in range(30)]
+    res = simulate_rwlock([], {'R0': 1, 'R1': 2}, actions, policy)
+    # una fila por acción, por ciclo y en orden del archivo
+    ordered = sorted(actions, key=lambda a: a.cycle)
+    assert len(res.segments) == len(ordered)
+    held = {}
+    for (c, _, r, state, d), act in zip(res.segments.rows(), ordered):
+        assert (c, res.resources.names[r]) == (act.cycle, act.resource)
+        if state == ACCESED:
+            held.setdefault(r, []).append((c, c + d, act.action == 'WRITE'))
+    for spans in held.values():
+        for k, (s1, e1, w1) in enumerate(spans):
+            for s2, e2, w2 in spans[k + 1:]:
+                if w1 or w2:
+                    assert e1 <= s2 or e2 <= s1
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        simulate_rwlock([], {'R1': 1}, [], 'fair')
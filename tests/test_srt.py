@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from data_io.process_loader import Process, prepare_workload
+from scheduling import srt
+
+
+def _naive_srt(wl):
+    """SRT de a un ciclo: en cada instante corre el listo con menos restante (desempata la llegada)."""
+    remaining = list(wl.burst)
+    segments, waits = [], {}
+    t = 0
+    while any(remaining):
+        ready = [k for k in range(len(wl)) if wl.arrival[k] <= t and remaining[k] > 0]
+        if not ready:
+            t += 1
+            continue
+        k = min(ready, key=lambda j: (remaining[j], j))
+        pid = wl.pid_ids[k]
+        if segments and segments[-1][0] == pid and segments[-1][2] == t:
+            segments[-1][2] = t + 1
+        else:
+            segments.append([pid, t, t + 1])
+        remaining[k] -= 1
+        t += 1
+        if remaining[k] == 0:
+            waits[pid] = t - wl.arrival[k] - wl.burst[k]
+    return [tuple(s) for s in segments], waits
+
+
+def _workload(seed, n, max_burst, spread):
+    rng = random.Random(seed)
+    return prepare_workload([
+        Process(f"P{k}", rng.randint(0, max_burst), rng.randint(0, spread), 0) for k in range(n)
+    ])
+
+
+@pytest.mark.parametrize('seed', range(150))
+def test_srt_matches_naive_reference(seed):
+    rng = random.Random(seed)
+    # spread chico: muchos empates de llegada y de restante; grande: CPU ociosa entre ráfagas
+    wl = _workload(seed, rng.randint(0, 12), rng.choice([1, 3, 8]), rng.choice([0, 5, 40]))
+    res = srt.schedule(wl)
+    segments, waits = _naive_srt(wl)
+    assert list(res.segments) == segments
+    assert res.waits == waits
+
+
+def test_ties_keep_arrival_order():
+    # en t=1 A y C tienen 2 restantes y en t=4 C y D tienen 1: no hay preempción,
+    # sigue el que llegó antes
+    wl = prepare_workload([Process('A', 3, 0, 0), Process('B', 3, 0, 0), Process('C', 2, 1, 0),
+                           Process('D', 1, 4, 0)])
+    res = srt.schedule(wl)
+    names = wl.symbols.names
+    assert [(names[p], s, e) for p, s, e in res.segments] == [
+        ('A', 0, 3), ('C', 3, 5), ('D', 5, 6), ('B', 6, 9)
+    ]
+
+
+def test_zero_burst_processes_never_run():
+    wl = prepare_workload([Process('A', 0, 0, 0), Process('B', 2, 0, 0), Process('C', 0, 1, 0)])
+    res = srt.schedule(wl)
+    assert list(res.segments) == [(wl.symbols.get('B'), 0, 2)]
+    assert res.waiting_times == {'B': 0}
+
+
+def test_trailing_zero_burst_processes_after_idle_cpu():
+    # la versión original recorría la carga con un índice y fallaba con IndexError
+    # cuando lo último en llegar, con la CPU ya ociosa, tenía ráfaga 0
+    wl = prepare_workload([Process('A', 2, 0, 0), Process('B', 0, 10, 0), Process('C', 0, 12, 0)])
+    res = srt.schedule(wl)
+    assert list(res.segments) == [(wl.symbols.get('A'), 0, 2)]
+    assert res.waiting_times == {'A': 0}
+
+
+def test_only_zero_bursts():
+    wl = prepare_workload([Process(f"P{k}", 0, k, 0) for k in range(5)])
+    res = srt.schedule(wl)
+    assert len(res.segments) == 0 and res.waits == {}
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from core import scheduler
+from core.scheduler import run_scheduling
+from core.sweep import sweep_quantum
+from data_io.process_loader import Process, prepare_workload
+from utils.metrics import compute_avg_waiting_time, compute_context_switches
+
+
+@pytest.fixture
+def workload():
+    rng = random.Random(4)
+    return prepare_workload([
+        Process(f"P{k}", rng.randint(0, 9), rng.randint(0, 1500), rng.randint(0, 3))
+        for k in range(400)
+    ])
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    scheduler.clear_cache()
+    yield
+    scheduler.clear_cache()
+
+
+def test_rows_match_run_scheduling(workload):
+    rows = sweep_quantum(workload, [3, 1, 2, 3])
+    assert [row['quantum'] for row in rows] == [1, 2, 3]
+    for row in rows:
+        res = run_scheduling(workload, 'rr', quantum=row['quantum'], use_cache=False)
+        assert row['awt'] == compute_avg_waiting_time(res.waits)
+        assert row['context_switches'] == compute_context_switches(res.segments)
+        assert set(row) == {'quantum', 'awt', 'avg_turnaround', 'context_switches', 'throughput'}
+
+
+def test_parallel_sweep_matches_serial(workload):
+    assert sweep_quantum(workload, range(1, 7), max_workers=3) == \
+        sweep_quantum(workload, range(1, 7), max_workers=1)
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_sweep_does_not_touch_the_result_cache(workload, max_workers):
+    kept = run_scheduling(workload, 'fifo')
+    sweep_quantum(workload, [1, 2, 4], max_workers=max_workers)
+    info = scheduler.cache_info()
+    assert (info.misses, info.currsize) == (1, 1)
+    assert run_scheduling(workload, 'fifo') is kept
+
+
+def test_non_positive_quantum_is_rejected(workload):
+    with pytest.raises(ValueError):
+        sweep_quantum(workload, [2, 0])
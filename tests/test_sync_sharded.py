@@ -0,0 +1,69 @@
+import pytest
+
+from core import sync_engine
+from core.sync_engine import run_synchronization
+from data_io.sync_loader import Action, Resource
+from synchronization import vectorized
+
+pytest.importorskip('numpy')
+
+MODES = [('mutex', 'readers'), ('semaphore', 'readers'), ('rwlock', 'readers'), ('rwlock', 'writers')]
+
+
+def _run(inputs, mode, rw_policy, workers):
+    return run_synchronization(*inputs, mode=mode, rw_policy=rw_policy,
+                               use_cache=False, workers=workers)
+
+
+def _assert_same(a, b):
+    assert a.segments == b.segments
+    assert list(a.waits.items()) == list(b.waits.items())
+
+
+@pytest.mark.parametrize('mode,rw_policy', MODES)
+@pytest.mark.parametrize('seed', range(25))
+def test_sharded_matches_serial(sync_input, mode, rw_policy, seed):
+    # retenciones largas, recursos desconocidos y ciclos negativos incluidos
+    inputs = sync_input(seed, n_actions=60, n_resources=5, durations=(1, 1, 3, 50))
+    _assert_same(_run(inputs, mode, rw_policy, 1), _run(inputs, mode, rw_policy, 3))
+
+
+def test_shards_with_different_duration_widths():
+    # R0 solo con retenciones de un ciclo (columna de un byte) y R1 con una de
+    # 40000 ciclos: el timeline combinado toma el tipo más ancho
+    actions = [Action(f"P{k % 3}", 'READ', f"R{k % 2}", k // 2, 40_000 if k == 5 else 1) for k in range(20)]
+    inputs = ([], [Resource('R0', 1), Resource('R1', 1)], actions)
+    serial, sharded = _run(inputs, 'mutex', 'readers', 1), _run(inputs, 'mutex', 'readers', 2)
+    _assert_same(serial, sharded)
+    assert sharded.segments.duration.typecode == serial.segments.duration.typecode == 'i'
+    assert sorted(sharded.durations)[-1] == 40_000
+
+
+@pytest.mark.parametrize('mode', ['mutex', 'semaphore'])
+def test_sharded_matches_serial_with_vectorized_shards(sync_input, mode):
+    # cada grupo supera VECTORIZE_MIN: los procesos del pool usan el motor NumPy
+    inputs = sync_input(0, n_actions=3 * vectorized.VECTORIZE_MIN, n_processes=30,
+                        n_resources=4, max_cycle=500)
+    _assert_same(_run(inputs, mode, 'readers', 1), _run(inputs, mode, 'readers', 2))
+
+
+def test_single_resource_is_not_sharded(monkeypatch, sync_input):
+    processes, resources, actions = sync_input(1, n_actions=100, n_resources=1)
+    actions = [a for a in actions if a.resource == 'R0']
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("no debería levantar un pool")
+    monkeypatch.setattr(sync_engine, 'process_pool', no_pool)
+    inputs = (processes, resources, actions)
+    _assert_same(_run(inputs, 'mutex', 'readers', 1), _run(inputs, 'mutex', 'readers', 4))
+
+
+def test_without_numpy_runs_serially(monkeypatch, sync_input):
+    inputs = sync_input(2, n_actions=100, n_resources=4)
+    serial = _run(inputs, 'semaphore', 'readers', 1)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("no debería levantar un pool")
+    monkeypatch.setattr(sync_engine, 'process_pool', no_pool)
+    monkeypatch.setattr(vectorized, 'np', None)
+    _assert_same(serial, _run(inputs, 'semaphore', 'readers', 4))
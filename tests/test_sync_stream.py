@@ -0,0 +1,63 @@
+from itertools import groupby
+
+import pytest
+
+from core.sync_engine import run_synchronization, run_synchronization_stream
+from data_io.sync_loader import iter_action_cycles, load_actions
+
+
+def _cycles(actions):
+    # (ciclo, acciones) en orden creciente de ciclo y, dentro del ciclo, del archivo
+    ordered = sorted(actions, key=lambda a: a.cycle)
+    return [(cycle, list(acts)) for cycle, acts in groupby(ordered, key=lambda a: a.cycle)]
+
+
+def _stream(processes, resources, actions, mode):
+    rows = []
+    waits = run_synchronization_stream(processes, resources, _cycles(actions), rows.append, mode=mode)
+    return rows, waits
+
+
+def _expected(processes, resources, actions, mode):
+    res = run_synchronization(processes, resources, actions, mode=mode, use_cache=False, workers=1)
+    rows = [(*row, d) for row, d in zip(res.timeline, res.durations)]
+    return rows, res.waiting_counts
+
+
+@pytest.mark.parametrize('mode', ['mutex', 'semaphore'])
+@pytest.mark.parametrize('seed', range(100))
+def test_stream_matches_simulate_trace(sync_input, mode, seed):
+    # retenciones largas, recursos y pids desconocidos y ciclos negativos incluidos
+    inputs = sync_input(seed, n_actions=seed % 60, durations=(1, 1, 4, 1000))
+    rows, waits = _stream(*inputs, mode)
+    expected_rows, expected_waits = _expected(*inputs, mode)
+    assert rows == expected_rows
+    assert waits == expected_waits
+
+
+def test_stream_from_file_matches_loaded_actions(tmp_path, sync_input):
+    processes, resources, actions = sync_input(3, n_actions=300, durations=(1, 2, 7))
+    actions.sort(key=lambda a: a.cycle)
+    path = tmp_path / 'actions.txt'
+    path.write_text(''.join(f"{a.pid}, {a.action}, {a.resource}, {a.cycle}, {a.duration}\n"
+                            for a in actions))
+    assert load_actions(str(path)) == actions
+    assert list(iter_action_cycles(str(path))) == _cycles(actions)
+
+    rows = []
+    waits = run_synchronization_stream(processes, resources, iter_action_cycles(str(path)),
+                                       rows.append, mode='semaphore')
+    assert (rows, waits) == _expected(processes, resources, actions, 'semaphore')
+
+
+def test_unsorted_file_is_rejected(tmp_path):
+    path = tmp_path / 'actions.txt'
+    path.write_text("P1, READ, R1, 2\nP2, READ, R1, 1\n")
+    with pytest.raises(ValueError):
+        list(iter_action_cycles(str(path)))
+
+
+def test_stream_rejects_rwlock(sync_input):
+    processes, resources, actions = sync_input(4)
+    with pytest.raises(ValueError):
+        run_synchronization_stream(processes, resources, _cycles(actions), print, mode='rwlock')
@@ -0,0 +1,62 @@
+import pytest
+
+from core import sync_engine
+from data_io.sync_loader import prepare_trace
+from synchronization import vectorized
+from synchronization.engine import WAITING, capacities, simulate_trace
+
+pytest.importorskip('numpy')
+
+
+def _trace(processes, resources, actions):
+    counts = {r.name: r.count for r in resources}
+    trace = prepare_trace(actions, (p.pid for p in processes), counts)
+    return trace, capacities(trace, counts)
+
+
+def _assert_same(a, b):
+    assert a.segments == b.segments
+    # mismo orden de claves: primero processes, luego los pids nuevos por primera espera
+    assert list(a.waits.items()) == list(b.waits.items())
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_vectorized_matches_simulate_trace(sync_input, seed):
+    trace, capacity = _trace(*sync_input(seed, n_actions=seed % 50))
+    _assert_same(simulate_trace(trace, capacity),
+                 vectorized.simulate_trace_vectorized(trace, capacity))
+
+
+def test_vectorized_matches_simulate_trace_on_a_large_trace(sync_input):
+    trace, capacity = _trace(*sync_input(0, n_actions=20_000, n_processes=50,
+                                         n_resources=20, max_cycle=2000))
+    _assert_same(simulate_trace(trace, capacity),
+                 vectorized.simulate_trace_vectorized(trace, capacity))
+
+
+def test_unknown_resources_are_never_granted(sync_input):
+    processes, resources, actions = sync_input(1, n_actions=300)
+    trace, capacity = _trace(processes, resources, actions)
+    res = vectorized.simulate_trace_vectorized(trace, capacity)
+    unknown = trace.resources.intern('RZ')
+    states = [state for _, _, r, state in res.segments if r == unknown]
+    assert states and all(s == WAITING for s in states)
+
+
+@pytest.mark.parametrize('mode', ['mutex', 'semaphore'])
+def test_dispatch_uses_vectorized_only_for_unit_durations(monkeypatch, sync_input, mode):
+    # con retenciones largas el motor vectorizado no vale: debe caer en simulate_trace
+    monkeypatch.setattr(vectorized, 'VECTORIZE_MIN', 0)
+    calls = []
+    real = vectorized.simulate_trace_vectorized
+    monkeypatch.setattr(vectorized, 'simulate_trace_vectorized',
+                        lambda *args: calls.append(1) or real(*args))
+    for durations, expected in (((1,), 1), ((1, 5, 1000), 0)):
+        calls.clear()
+        processes, resources, actions = sync_input(2, n_actions=200, durations=durations)
+        got = sync_engine.run_synchronization(processes, resources, actions, mode=mode,
+                                              use_cache=False, workers=1)
+        counts = sync_engine._mode_counts(resources, mode)
+        trace = prepare_trace(actions, (p.pid for p in processes), (r.name for r in resources))
+        _assert_same(simulate_trace(trace, capacities(trace, counts)), got)
+        assert len(calls) == expected
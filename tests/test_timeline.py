@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from array import array
+from utils.timeline import SyncTimeline
+
+
+def _rows(durations):
+    return [(k, k % 3, k % 2, k % 2, d) for k, d in enumerate(durations)]
+
+
+def test_unit_durations_take_one_byte_per_row():
+    tl = SyncTimeline(_rows([1] * 1000))
+    assert tl.duration.typecode == 'b'
+    # cycle 8 + pid 4 + resource 4 + state 1 + duration 1
+    assert tl.nbytes == 18 * 1000
+
+
+@pytest.mark.parametrize('value, typecode', [(127, 'b'), (128, 'h'), (40_000, 'i'), (10 ** 12, 'q')])
+def test_append_widens_the_duration_column(value, typecode):
+    durations = [1, 5, value, 2]
+    tl = SyncTimeline(_rows(durations))
+    assert tl.duration.typecode == typecode
+    assert [row[4] for row in tl.rows()] == durations
+
+
+def test_widening_never_narrows_back():
+    tl = SyncTimeline(_rows([1, 300]))
+    tl.append(9, 0, 0, 0, 1)
+    assert tl.duration.typecode == 'h' and list(tl.duration) == [1, 300, 1]
+
+
+def test_set_duration_widens():
+    tl = SyncTimeline(_rows([1, 1, 1]))
+    tl.set_duration(1, 5)
+    assert tl.duration.typecode == 'b'
+    tl.set_duration(2, 1 << 40)
+    assert tl.duration.typecode == 'q' and list(tl.duration) == [1, 5, 1 << 40]
+
+
+def test_from_columns_narrows_sequences_and_int64_bytes():
+    cols = ([0, 1, 2], [0, 1, 0], [0, 0, 1], [0, 1, 0])
+    assert SyncTimeline.from_columns(*cols, [1, 2, 3]).duration.typecode == 'b'
+    assert SyncTimeline.from_columns(*cols, [1, 2, 1000]).duration.typecode == 'h'
+    as_bytes = SyncTimeline.from_columns(*cols, array('q', [1, 70_000, 1]).tobytes())
+    assert as_bytes.duration == array('i', [1, 70_000, 1])
+    kept = SyncTimeline.from_columns(*cols, array('q', [1, 1, 1]))
+    assert kept.duration.typecode == 'q'
+
+
+def test_equality_slicing_and_windows_ignore_the_column_width():
+    narrow = SyncTimeline(_rows([1, 2, 1, 3]))
+    wide = SyncTimeline.from_columns(*(getattr(narrow, name) for name in SyncTimeline.COLUMNS[:4]),
+                                     array('q', narrow.duration))
+    assert narrow == wide
+    assert narrow[1:3] == wide[1:3] and narrow[1:3].duration.typecode == 'b'
+    assert narrow.between(1, 3) == wide.between(1, 3)
+
+
+def test_pickle_keeps_the_typecode():
+    tl = SyncTimeline(_rows([1, 500]))
+    copy = pickle.loads(pickle.dumps(tl))
+    assert copy == tl and copy.duration.typecode == 'h'